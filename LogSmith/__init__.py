@@ -10,20 +10,6 @@ LogSmith:
     - concurrency‑safe file handlers
 """
 
-# Version metadata
-# noinspection PyBroadException
-try:
-    from importlib.metadata import version
-    __version__ = version("LogSmith")
-except Exception:   # pragma: no cover
-    __version__ = "1.9.9"
-
-
-# LogSmith's calling card
-from .metadata import get_metadata, get_license_text, get_file_tree
-
-
-
 # ----------------------------------------------------------------------
 # Public API
 # ----------------------------------------------------------------------
@@ -99,12 +85,36 @@ __all__ = [
 # Calling Card
 # ----------------------------------------------------------------------
 
-__metadata__ = get_metadata()
-
-__license_text__ = get_license_text()
-
-__package_content__ = get_file_tree()
+# The version and calling card are resolved on first access: importing
+# importlib.metadata (and the email package behind it) costs more than
+# importing the rest of LogSmith.
+__calling_card = {
+    "__metadata__": "get_metadata",
+    "__license_text__": "get_license_text",
+    "__package_content__": "get_file_tree",
+}
 
 __all__.append("__metadata__")
 __all__.append("__license_text__")
 __all__.append("__package_content__")
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        # noinspection PyBroadException
+        try:
+            from importlib.metadata import version
+            value = version("LogSmith")
+        except Exception:   # pragma: no cover
+            value = "1.9.9"
+    elif name in __calling_card:
+        from . import metadata
+        value = getattr(metadata, __calling_card[name])()
+    elif name in __calling_card.values():
+        from . import metadata
+        return getattr(metadata, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
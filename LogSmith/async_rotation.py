@@ -9,7 +9,7 @@ import logging
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from pathlib import Path
-from typing import Optional, Callable, IO
+from typing import Optional, Callable, IO, Iterator
 
 from .rotation_base import (
     When,
@@ -51,7 +51,8 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
             large_entry_behavior: Optional[LargeLogEntryBehavior] = None,
             append_filename_pid: bool = False,
             append_filename_timestamp: bool = False,
-            audit_mode: bool = False
+            audit_mode: bool = False,
+            timestamped_backups: bool = False,
     ) -> None:
 
         # Initialize the base class (FileHandler + parameter storage)
@@ -67,6 +68,7 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
             large_entry_behavior = large_entry_behavior,
             append_filename_pid = append_filename_pid,
             append_filename_timestamp = append_filename_timestamp,
+            timestamped_backups = timestamped_backups,
         )
         self.audit_mode = audit_mode
 
@@ -82,6 +84,11 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
 
         self.write_lock = threading.Lock()
 
+        self.__newline_size = len("\n".encode(self.encoding or "utf-8"))
+
+        # monotonic time of the next expiration scan (ExpirationRule.check_interval)
+        self.__next_expiration_scan = 0.0
+
         self.__rollover_at = None
         if self.when is not None:
             self.__rollover_at = self.__compute_initial_rollover()
@@ -98,12 +105,13 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
         DROP = auto()  # drop entry entirely
         ROTATE_THEN_WRITE = auto()  # schedule rotation, then write
 
-    def __async_large_entry_decision(self, formatted: str) -> __AsyncLargeEntryDecision:
+    def __async_large_entry_decision(self, formatted: str, entry_size: Optional[int] = None) -> __AsyncLargeEntryDecision:
         leb = self.large_entry_behavior
         if leb is None:
             return self.__AsyncLargeEntryDecision.WRITE
 
-        entry_size = len(formatted.encode(self.encoding or "utf-8"))
+        if entry_size is None:
+            entry_size = len(formatted.encode(self.encoding or "utf-8"))
         if self.max_bytes <= 0 or entry_size < self.max_bytes:
             return self.__AsyncLargeEntryDecision.WRITE
 
@@ -128,8 +136,7 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
                 self.stream = self._open()  # pragma: no cover
 
             try:
-                self.stream.seek(0, os.SEEK_END)
-                empty = (self.stream.tell() == 0)
+                empty = (self.__file_size() == 0)
             except OSError: # pragma: no cover
                 # FD is broken: close best-effort and reopen, treat as empty
                 # noinspection PyBroadException
@@ -162,8 +169,7 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
 
                 # Size-based rotation only
                 try:
-                    self.stream.seek(0, os.SEEK_END)
-                    current = self.stream.tell()
+                    current = self.__file_size()
                 except OSError: # pragma: no cover
                     # FD broken → reopen and treat as empty
                     # noinspection PyBroadException
@@ -204,7 +210,11 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
 
             msg = formatted + "\n"
 
-            decision = self.__async_large_entry_decision(formatted)
+            # encoded once, shared by the large-entry and size-rotation checks
+            msg_size = len(msg.encode(self.encoding or "utf-8")) if self.max_bytes > 0 else None
+            entry_size = None if msg_size is None else msg_size - self.__newline_size
+
+            decision = self.__async_large_entry_decision(formatted, entry_size)
 
             if decision is self.__AsyncLargeEntryDecision.DROP:
                 self.__schedule_rotation()
@@ -212,7 +222,7 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
 
             if decision is self.__AsyncLargeEntryDecision.ROTATE_THEN_WRITE:
                 self.perform_rotation()
-            elif self.__should_rotate(formatted):
+            elif self.__should_rotate(formatted, msg_size):
                 if not self.__rotation_scheduled:
                     self.__schedule_rotation()
 
@@ -239,6 +249,14 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
             # Otherwise treat as logging error
             self.handleError(record)    # pragma: no cover
 
+    def __file_size(self) -> int:
+        """
+        Current size of the open file. Every write is flushed right away, so
+        a single fstat() sees all of it; the text stream's seek-to-end plus
+        tell() cost two syscalls and a decoder reset.
+        """
+        return os.fstat(self.stream.fileno()).st_size
+
     def __schedule_rotation(self) -> None:
         """
         Helper: schedule async rotation exactly once per need.
@@ -275,12 +293,14 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
                 self.stream = None  # type: ignore[assignment]
 
             # Rotate backups
-            if self.backup_count > 0:
+            if self.timestamped_backups:
+                self._rotate_to_timestamped_backup()
+            elif self.backup_count > 0:
+                suffix = self.__rotation_suffix()    # once per rollover, not per backup
                 for i in range(self.backup_count - 1, 0, -1):
 
                     # sfn = f"{self.baseFilename}.{i}"
                     # dfn = f"{self.baseFilename}.{i + 1}"
-                    suffix = self.__rotation_suffix()
                     if suffix:
                         sfn = f"{self.baseFilename}.{suffix}.{i}"
                         dfn = f"{self.baseFilename}.{suffix}.{i + 1}"
@@ -296,7 +316,6 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
                         os.utime(dfn, (orig_mtime, orig_mtime))
 
                 # dfn = f"{self.baseFilename}.1"
-                suffix = self.__rotation_suffix()
                 if suffix:
                     dfn = f"{self.baseFilename}.{suffix}.1"
                 else:
@@ -331,10 +350,13 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
         finally:
             self.release()
 
-    def __should_rotate(self, formatted) -> bool:
+    def __should_rotate(self, formatted, msg_size: Optional[int] = None) -> bool:
         """
         Async equivalent of ConcurrentTimedSizedRotatingFileHandler.shouldRollover().
         Decides if rotation should occur (size and/or time).
+
+        `msg_size` is the encoded size of the entry plus its newline, when
+        the caller has already measured it.
         """
         # Ensure file is open
         if self.stream is None: # pragma: no cover
@@ -344,10 +366,10 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
         # SIZE-BASED ROTATION
         # ----------------------------------------------------------
         if self.max_bytes and self.max_bytes > 0:
-            msg = f"{formatted}\n"
-            self.stream.seek(0, os.SEEK_END)
-            current_size = self.stream.tell()
-            projected = current_size + len(msg.encode(self.encoding or "utf-8"))
+            if msg_size is None:
+                msg_size = len(f"{formatted}\n".encode(self.encoding or "utf-8"))
+            current_size = self.__file_size()
+            projected = current_size + msg_size
             if projected >= self.max_bytes:
                 return True
 
@@ -362,12 +384,8 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
         return False
 
     def __rollover_interval_seconds(self) -> float:
-        if self.when == When.SECOND:
-            return self.interval
-        if self.when == When.MINUTE:
-            return self.interval * 60
-        if self.when == When.HOUR:
-            return self.interval * 3600
+        if self._period_seconds is not None:
+            return self._period_seconds
         if self.when == When.EVERYDAY:
             return 24 * 3600
         return 7 * 24 * 3600  # weekly
@@ -385,14 +403,8 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
             return float("inf") # pragma: no cover
 
         # simple periodic rotation
-        if self.when in (When.SECOND, When.MINUTE, When.HOUR):
-            if self.when == When.SECOND:
-                delta = self.interval
-            elif self.when == When.MINUTE:
-                delta = self.interval * 60
-            else:  # HOUR
-                delta = self.interval * 3600
-            return current + delta
+        if self._period_seconds is not None:
+            return current + self._period_seconds
 
         # daily / weekly rotation at a specific time-of-day
         ts = self.timestamp or RotationTimestamp(hour=0, minute=0, second=0)
@@ -410,17 +422,8 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
                 target = target + timedelta(days=1)
             return target.timestamp()
 
-        # weekday-based: Monday=0 ... Sunday=6
-        weekday_map = {
-            When.MONDAY: 0,
-            When.TUESDAY: 1,
-            When.WEDNESDAY: 2,
-            When.THURSDAY: 3,
-            When.FRIDAY: 4,
-            When.SATURDAY: 5,
-            When.SUNDAY: 6,
-        }
-        target_weekday = weekday_map[self.when]
+        # weekday-based
+        target_weekday = self._weekday_index
         days_ahead = (target_weekday - now_dt.weekday()) % 7
         if days_ahead == 0 and target <= now_dt:
             days_ahead = 7
@@ -432,36 +435,41 @@ class Async_TimedSizedRotatingFileHandler(BaseTimedSizedRotatingFileHandler):
         if rule is None:
             return  # pragma: no cover
 
-        now = datetime.now()
+        if rule.check_interval > 0:
+            # retention scans are throttled: skip until the interval has elapsed
+            mono = time.monotonic()
+            if mono < self.__next_expiration_scan:
+                return
+            self.__next_expiration_scan = mono + rule.check_interval
 
-        if rule.scale == ExpirationScale.Seconds:
-            cutoff = now - timedelta(seconds=rule.interval)
-        elif rule.scale == ExpirationScale.Minutes:
-            cutoff = now - timedelta(minutes=rule.interval)
-        elif rule.scale == ExpirationScale.Hours:   # pragma: no cover
-            cutoff = now - timedelta(hours=rule.interval)
-        elif rule.scale == ExpirationScale.Days:
-            cutoff = now - timedelta(days=rule.interval)
+        if self._expiration_seconds is not None:
+            cutoff_ts = time.time() - self._expiration_seconds
         elif rule.scale == ExpirationScale.MonthDay:
-            cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            cutoff_ts = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
         else:
             return  # pragma: no cover
 
-        for path in self.__list_rotated_files():
-            try:
-                if datetime.fromtimestamp(os.path.getmtime(path)) < cutoff:
+        for path, mtime in self.__scan_rotated_files():
+            if mtime < cutoff_ts:
+                try:
                     os.remove(path)
-            except OSError:
-                pass    # pragma: no cover
+                except OSError:
+                    pass    # pragma: no cover
 
-    def __list_rotated_files(self) -> list[str]:
+    def __scan_rotated_files(self) -> Iterator[tuple[str, float]]:
+        """
+        (path, mtime) of every backup of this file: one directory scan, with
+        the stat each entry needs, skipping the live base file and lock file.
+        """
         base = self.baseFilename
-        dir_name = os.path.dirname(base)
         prefix = os.path.basename(base)
 
-        return [
-            os.path.join(dir_name, f)
-            for f in os.listdir(dir_name)
-            if f.startswith(prefix)
-               and not f.endswith(".lock")
-        ]
+        with os.scandir(os.path.dirname(base)) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == prefix or not name.startswith(prefix) or name.endswith(".lock"):
+                    continue
+                try:
+                    yield entry.path, entry.stat().st_mtime
+                except FileNotFoundError:   # pragma: no cover
+                    continue    # removed by another process mid-scan
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import json
 import logging
 import multiprocessing
 import traceback
@@ -38,7 +39,6 @@ console printing utility
 it has the same effect, only it synchronizes with console logs
 """
 import io
-import contextlib
 
 
 # ===========================================================================
@@ -163,6 +163,7 @@ class AsyncSmartLogger:
             self.__worker_tasks = None
 
         self.__handlers: list[HandlerMetadata] = []
+        self.__handler_info_json: Optional[str] = None
         self.__messages_enqueued = 0
         self.__retired = False
 
@@ -307,7 +308,7 @@ class AsyncSmartLogger:
                         sanitize = False
                     break
 
-        if sanitize:
+        if sanitize and isinstance(msg, str):
             msg = CPrint.strip_ansi(msg)
 
         merged_kwargs = {}
@@ -388,9 +389,7 @@ class AsyncSmartLogger:
 
         # === NEW: delegate to logging + handlers, no special-casing ===
         for handler in self.__py_logger.handlers:
-            # Let logging filters run
-            if not handler.filter(record):
-                continue    # pragma: no cover
+            # handle() runs the handler's filters itself, then emits under the handler lock
             handler.handle(record)
 
         # PROFILING: finalize handler + total
@@ -628,6 +627,7 @@ class AsyncSmartLogger:
         self.__py_logger.addHandler(handler)
 
         level_name = logging.getLevelName(level)
+        self.__handler_info_json = None
         self.__handlers.append(
             HandlerMetadata(
                 kind="console",
@@ -674,7 +674,6 @@ class AsyncSmartLogger:
         os.makedirs(normalized, exist_ok=True)
 
         log_dir_path = Path(normalized).resolve()
-        os.makedirs(log_dir_path, exist_ok=True)
 
         if logfile_name is None:
             logfile_name = f"{self.__py_logger.name}.log"
@@ -711,6 +710,7 @@ class AsyncSmartLogger:
                 append_filename_pid = rotation_logic.append_filename_pid,
                 append_filename_timestamp = rotation_logic.append_filename_timestamp,
                 audit_mode=audit_mode,
+                timestamped_backups = rotation_logic.timestamped_backups,
             )
         else:
             handler = logging.FileHandler(str(file_path), encoding="utf-8")
@@ -729,7 +729,6 @@ class AsyncSmartLogger:
         # ------------------------------------------------------------------
         # Duplicate detection (process-wide) – mirror SmartLogger behavior
         # ------------------------------------------------------------------
-        resolved_for_compare = str(Path(resolved_path).resolve())
         for logger in logging.Logger.manager.loggerDict.values():
             if not isinstance(logger, AsyncSmartLogger):
                 continue
@@ -737,11 +736,11 @@ class AsyncSmartLogger:
             for info in logger.__handlers:
                 if info.kind != "file" or not info.path:
                     continue    # pragma: no cover
-                existing_resolved = str(Path(info.path).resolve())
-                if existing_resolved == resolved_for_compare:
+                # info.path was stored resolved: compare it as-is, no realpath per handler
+                if info.path == resolved_path:
                     FileHandlerRegistry.unregister(str(file_path))
                     raise ValueError(
-                        f"A file handler for '{resolved_for_compare}' is already active "
+                        f"A file handler for '{resolved_path}' is already active "
                         f"in this process. This is usually caused by a duplicate "
                         f"configuration or copy‑paste error."
                     )
@@ -758,6 +757,7 @@ class AsyncSmartLogger:
             if rotation_logic else None
         )
 
+        self.__handler_info_json = None
         self.__handlers.append(
             HandlerMetadata(
                 kind="file",
@@ -784,6 +784,7 @@ class AsyncSmartLogger:
             FileHandlerRegistry.unregister(h.baseFilename)
 
         # Also remove metadata
+        self.__handler_info_json = None
         self.__handlers = [
             h for h in self.__handlers
             if not (h.kind == "file" and h.path == str(target_path))
@@ -793,6 +794,15 @@ class AsyncSmartLogger:
     def handler_info(self) -> list[dict[str, Any]]:
         return [asdict(h) for h in self.__handlers]
 
+    @property
+    def handler_info_json(self) -> str:
+        """
+        handler_info as indented JSON, serialized once until the handlers change.
+        """
+        if self.__handler_info_json is None:
+            self.__handler_info_json = json.dumps(self.handler_info, indent=4, ensure_ascii=False, default=str)
+        return self.__handler_info_json
+
     @property
     def console_handler(self):
         for info in self.handler_info:
@@ -1088,22 +1098,28 @@ class AsyncSmartLogger:
         )
 
     async def a_trace(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        await self.__a_log(TRACE, msg, *args, **kwargs)
+        if self.__py_logger.isEnabledFor(TRACE) or self.__retired:
+            await self.__a_log(TRACE, msg, *args, **kwargs)
 
     async def a_debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        await self.__a_log(logging.DEBUG, msg, *args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.DEBUG) or self.__retired:
+            await self.__a_log(logging.DEBUG, msg, *args, **kwargs)
 
     async def a_info(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        await self.__a_log(logging.INFO, msg, *args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.INFO) or self.__retired:
+            await self.__a_log(logging.INFO, msg, *args, **kwargs)
 
     async def a_warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        await self.__a_log(logging.WARNING, msg, *args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.WARNING) or self.__retired:
+            await self.__a_log(logging.WARNING, msg, *args, **kwargs)
 
     async def a_error(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        await self.__a_log(logging.ERROR, msg, *args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.ERROR) or self.__retired:
+            await self.__a_log(logging.ERROR, msg, *args, **kwargs)
 
     async def a_critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        await self.__a_log(logging.CRITICAL, msg, *args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.CRITICAL) or self.__retired:
+            await self.__a_log(logging.CRITICAL, msg, *args, **kwargs)
 
     async def a_raw(self, level: int, message: str, end: str = "\n") -> None:
         if self.__retired:
@@ -1115,12 +1131,6 @@ class AsyncSmartLogger:
         Console-only async output, synchronized with AsyncSmartLogger logging
         *if* a console handler exists. Otherwise falls back to normal print().
         """
-        # Format text exactly like print()
-        buffer = io.StringIO()
-        with contextlib.redirect_stdout(buffer):
-            print(*args, sep=sep, end=end)
-        text = buffer.getvalue()
-
         # Detect whether a console handler exists
         has_console = any(
             isinstance(h, logging.StreamHandler) and not hasattr(h, "baseFilename")
@@ -1132,6 +1142,11 @@ class AsyncSmartLogger:
             print(*args, sep=sep, end=end)
             return
 
+        # Format text exactly like print()
+        buffer = io.StringIO()
+        print(*args, sep=sep, end=end, file=buffer)
+        text = buffer.getvalue()
+
         # Console handler exists → enqueue console-only RAW
         await self.__enqueue_raw(logging.NOTSET, text, end="", console_only=True)
 
@@ -1140,10 +1155,8 @@ class AsyncSmartLogger:
     # ------------------------------------------------------------------
     @staticmethod
     def levels() -> dict[str, int]:
-        levels = {"NOTSET": logging.NOTSET}
-        for name, meta in LEVELS.all().items():
-            levels[name] = meta["value"]
-        return levels
+        # a fresh dict per call (callers may mutate or serialize it), copied from the registry's cached map
+        return dict(LEVELS.value_map())
 
     @staticmethod
     def __safeguard_internals(name: str, value: int) -> None:
@@ -1454,6 +1467,20 @@ class AsyncSmartLogger:
             stack_info=stack_val,
         )
 
+    # ------------------------------------------------------------------
+    # lookup
+    # ------------------------------------------------------------------
+    @classmethod
+    def get(cls, name: str) -> Optional[AsyncSmartLogger]:
+        """
+        Return the live AsyncSmartLogger registered under ``name``, or None.
+        A single dict lookup; retired loggers are not returned.
+        """
+        logger = cls.__AsyncSmartLogger_registry.get(name)
+        if logger is None or logger.__retired:
+            return None
+        return logger
+
     # ------------------------------------------------------------------
     # retire & destroy
     # ------------------------------------------------------------------
@@ -1514,6 +1541,7 @@ class AsyncSmartLogger:
 
         # 5. Clear handler lists
         self.__py_logger.handlers.clear()
+        self.__handler_info_json = None
         self.__handlers.clear()
 
         # 6. Remove from registry
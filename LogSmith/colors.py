@@ -1,8 +1,9 @@
 # LogSmith/colors.py
 
+import functools
 import os
 import sys
-from typing import Iterable, Sequence, Union
+from typing import Any, Iterable, Mapping, Sequence, Union
 from enum import Enum
 import re
 
@@ -18,6 +19,33 @@ def terminal_supports_color() -> bool:
     return os.getenv("ANSICON") or os.getenv("WT_SESSION") or sys.stdout.isatty()   # pragma: no cover
 
 
+# evaluated once at import; a module global is the cheapest check for the
+# colorize/gradient/reverse hot paths
+_NO_COLOR = not terminal_supports_color()
+
+# C0 control characters and DEL -> their visible \xNN spelling, for one C-level str.translate()
+_CONTROL_ESCAPES = {code: f"\\x{code:02x}" for code in (*range(32), 127)}
+
+# SGR parameter strings of the 256 xterm colors, built once for gradient lookups
+_FG_256 = tuple(f"38;5;{i}" for i in range(256))
+_BG_256 = tuple(f"48;5;{i}" for i in range(256))
+
+# basic (8/16-color) foreground and background SGR codes, for reverse()
+_FG_BASIC = frozenset((*range(30, 38), *range(90, 98)))
+_BG_BASIC = frozenset((*range(40, 48), *range(100, 108)))
+
+
+@functools.lru_cache(maxsize=256)
+def _stretch_indices(source_len: int, target_len: int) -> tuple[int, ...]:
+    """
+    Stop index for each of ``target_len`` slots when ``source_len`` stops are
+    spread evenly over them (first and last stop kept). Shared by gradients
+    and palette blending, built once per size pair.
+    """
+    span = max(target_len - 1, 1)
+    return tuple(i * (source_len - 1) // span for i in range(target_len))
+
+
 class GradientDirection(Enum):
     """
     Direction for 256-color gradients.
@@ -194,7 +222,7 @@ class CPrint:
 
     __ANSI_RE = re.compile(r"\033\[([0-9;]+)m")
 
-    __NO_COLOR = not terminal_supports_color()
+    __NO_COLOR = _NO_COLOR
 
     @classmethod
     def __join_codes(cls, codes: Iterable[Code]) -> str:
@@ -220,11 +248,73 @@ class CPrint:
     ) -> str:
         """
         Solid colorization method.
+
+        The escape sequences come from a cache keyed by the color combination,
+        so a repeated combination costs one lookup and a concatenation.
         """
 
-        if cls.__NO_COLOR:
+        if _NO_COLOR:
             return text # pragma: no cover
 
+        if not styles:
+            styles = ()
+        elif not isinstance(styles, tuple):
+            styles = tuple(styles)
+        prefix, suffix = cls.__affixes(intensity, fg, bg, styles)
+        if not prefix:
+            return text # pragma: no cover
+        return f"{prefix}{text}{suffix}"
+
+    @classmethod
+    def colorize_multi(
+        cls,
+        segments: Iterable[tuple[str, Mapping[str, Any] | None]],
+    ) -> str:
+        """
+        Colorize several (text, style) segments into one string.
+
+        `style` holds colorize() keyword arguments (fg, bg, intensity, styles),
+        or None for plain text. Consecutive segments with the same style share
+        a single prefix and reset.
+        """
+
+        if _NO_COLOR:
+            return "".join(text for text, _ in segments)  # pragma: no cover
+
+        chunks: list[str] = []
+        current = ("", "")
+        for text, style in segments:
+            if style:
+                affixes = cls.__affixes(
+                    style.get("intensity"),
+                    style.get("fg"),
+                    style.get("bg"),
+                    tuple(style.get("styles") or ()),
+                )
+            else:
+                affixes = ("", "")
+
+            if affixes != current:
+                chunks.append(current[1])
+                chunks.append(affixes[0])
+                current = affixes
+            chunks.append(text)
+
+        chunks.append(current[1])
+        return "".join(chunks)
+
+    @classmethod
+    @functools.lru_cache(maxsize=512)
+    def __affixes(
+        cls,
+        intensity: Code | None,
+        fg: Code | None,
+        bg: Code | None,
+        styles: tuple[Code, ...],
+    ) -> tuple[str, str]:
+        """
+        (prefix, suffix) escape sequences for a color combination, built once.
+        """
         codes: list[Code] = []
         if intensity is not None:
             codes.append(intensity)
@@ -232,13 +322,10 @@ class CPrint:
             codes.append(fg)
         if bg is not None:
             codes.append(bg)
-        if styles:
-            codes.extend(styles)
+        codes.extend(styles)
 
         prefix = cls.__join_codes(codes)
-        if not prefix:
-            return text # pragma: no cover
-        return f"{prefix}{text}{cls.__RESET}"
+        return (prefix, cls.__RESET) if prefix else ("", "")
 
     @classmethod
     def gradient(   # pragma: no cover
@@ -255,7 +342,7 @@ class CPrint:
         Apply a 256-color gradient across the text.
         """
 
-        if cls.__NO_COLOR:
+        if _NO_COLOR:
             return text # pragma: no cover
 
         if not text or not fg_codes:
@@ -265,81 +352,109 @@ class CPrint:
         multi = len(lines) > 1
 
         # --- AUTO-STRETCH FG/BG LISTS TO MATCH LENGTH ---
-        def stretch(stops: list[int], target_len: int) -> list[int]:
+        # (tuple() hands a tuple palette back as-is: no copy for GradientPalette constants)
+        def stretch(stops: Sequence[int], target_len: int) -> tuple[int, ...]:
             if len(stops) == target_len:
-                return stops
-            if len(stops) == 1:
-                return stops * target_len  # repeat single color
-            stretched = []
-            for i in range(target_len):
-                idx = int(i * (len(stops) - 1) / (target_len - 1))
-                stretched.append(stops[idx])
-            return stretched
+                return tuple(stops)
+            return tuple([stops[i] for i in _stretch_indices(len(stops), target_len)])
 
         # Normalize fg_codes / bg_codes
         if fg_codes:
-            fg_codes = stretch(list(fg_codes), max(len(fg_codes), len(bg_codes or fg_codes)))
+            fg_codes = stretch(fg_codes, max(len(fg_codes), len(bg_codes or fg_codes)))
         if bg_codes:
-            bg_codes = stretch(list(bg_codes), max(len(bg_codes), len(fg_codes or bg_codes)))
+            bg_codes = stretch(bg_codes, max(len(bg_codes), len(fg_codes or bg_codes)))
 
         if direction == GradientDirection.AUTO:
             direction = GradientDirection.VERTICAL if multi else GradientDirection.HORIZONTAL
 
         if direction in (GradientDirection.HORIZONTAL, GradientDirection.HORIZONTAL_REVERSE):
+            palette = (fg_codes, bg_codes or (), intensity, tuple(styles) if styles else ())
+            first = fg_codes[-1] if direction == GradientDirection.HORIZONTAL_REVERSE else fg_codes[0]
             out_lines: list[str] = []
             for line in lines:
-                chars = list(line)
-                n = len(chars)
-                m = len(fg_codes)
+                n = len(line)
 
                 if n == 0:
                     out_lines.append("")
                     continue
 
-                codes = list(fg_codes)
-                if direction == GradientDirection.HORIZONTAL_REVERSE:
-                    codes.reverse()
-
                 if n == 1:
-                    code = f"38;5;{codes[0]}"
-                    out_lines.append(cls.colorize(chars[0], fg=code, intensity=intensity, styles=styles))
+                    code = _FG_256[first] if 0 <= first < 256 else f"38;5;{first}"
+                    out_lines.append(cls.colorize(line, fg=code, intensity=intensity, styles=styles))
                     continue
 
-                out: list[str] = []
-                for i, ch in enumerate(chars):
-                    idx = int(i * (m - 1) / (n - 1))
-                    # out.append(cls.colorize(ch, fg=code, intensity=intensity, styles=styles))
-                    fg = f"38;5;{fg_codes[idx]}" if fg_codes else None
-                    bg = f"48;5;{bg_codes[idx]}" if bg_codes else None
-
-                    out.append(cls.colorize(
-                        ch,
-                        fg=fg,
-                        bg=bg,
-                        intensity=intensity,
-                        styles=styles,
-                    ))
-                out_lines.append("".join(out))
+                # one C-level %-substitution per line, no per-character strings
+                out_lines.append(cls.__gradient_template(n, *palette) % tuple(line))
 
             return "\n".join(out_lines)
 
         if direction in (GradientDirection.VERTICAL, GradientDirection.VERTICAL_REVERSE):
-            m = len(fg_codes)
-            L = len(lines)
+            codes = fg_codes[::-1] if direction == GradientDirection.VERTICAL_REVERSE else fg_codes
 
-            codes = list(fg_codes)
-            if direction == GradientDirection.VERTICAL_REVERSE:
-                codes.reverse()
+            # one %-substitution for the whole block, no per-line strings
+            template = cls.__vertical_template(len(lines), codes, intensity, tuple(styles) if styles else ())
+            return template % tuple(lines)
 
-            out_lines: list[str] = []
-            for i, line in enumerate(lines):
-                idx = int(i * (m - 1) / (L - 1)) if L > 1 else 0
-                code = f"38;5;{codes[idx]}"
-                out_lines.append(cls.colorize(line, fg=code, intensity=intensity, styles=styles))
+        return text
 
-            return "\n".join(out_lines)
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def __gradient_template(
+        cls,
+        length: int,
+        fg_codes: tuple[int, ...],
+        bg_codes: tuple[int, ...],
+        intensity: Code | None,
+        styles: tuple[Code, ...],
+    ) -> str:
+        """
+        %-template of a horizontal gradient line (one %s per column), built
+        once per (line length, palette, style) combination.
+
+        Neighbouring columns that map to the same stop share one escape
+        sequence: a 40-column line over a 7-stop palette emits 7 color runs,
+        not 40 colored characters. Every run restates fg (and bg), intensity
+        and styles, so runs follow each other directly and only the line
+        ends with a reset.
+        """
+        fg_names = [_FG_256[c] if 0 <= c < 256 else f"38;5;{c}" for c in fg_codes]
+        bg_names = [_BG_256[c] if 0 <= c < 256 else f"48;5;{c}" for c in bg_codes]
 
-        return text
+        parts: list[str] = []
+        current: tuple[str, str] | None = None
+        for idx in _stretch_indices(len(fg_codes), length):
+            fg = fg_names[idx]
+            bg = bg_names[idx] if bg_names else None
+            affixes = cls.__affixes(intensity, fg, bg, styles)
+            if affixes != current:
+                parts.append(affixes[0].replace("%", "%%"))
+                current = affixes
+            parts.append("%s")
+        if current is not None:
+            parts.append(current[1].replace("%", "%%"))
+        return "".join(parts)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def __vertical_template(
+        cls,
+        line_count: int,
+        fg_codes: tuple[int, ...],
+        intensity: Code | None,
+        styles: tuple[Code, ...],
+    ) -> str:
+        """
+        %-template of a vertical gradient (one %s per line, wrapped in that
+        line's escape sequences, joined by newlines), built once per
+        (line count, palette, style) combination.
+        """
+        fg_names = [_FG_256[c] if 0 <= c < 256 else f"38;5;{c}" for c in fg_codes]
+
+        rows = []
+        for idx in _stretch_indices(len(fg_codes), line_count):
+            prefix, suffix = cls.__affixes(intensity, fg_names[idx], None, styles)
+            rows.append(f"{prefix.replace('%', '%%')}%s{suffix.replace('%', '%%')}")
+        return "\n".join(rows)
 
     @classmethod
     def reverse(cls, colored_text: str) -> str:
@@ -347,36 +462,34 @@ class CPrint:
         Flip FG and BG of an already-colored string.
         """
 
-        if cls.__NO_COLOR:
-            return colored_text
-
-        matches = cls.__ANSI_RE.findall(colored_text)
-        if not matches:
+        if _NO_COLOR:
             return colored_text
 
-        codes_raw: list[str] = []
-        for m in matches:
-            codes_raw.extend(m.split(";"))
-
+        # one regex pass: collect the text between sequences and classify each
+        # parameter as it is split off (the regex only admits digits and ';',
+        # so a token is either a number or empty)
         fg: Code | None = None
         bg: Code | None = None
         others: list[Code] = []
-
-        for c in codes_raw:
-            if c.startswith("38;5"):
-                fg = c
-            elif c.startswith("48;5"):
-                bg = c
-            elif c.isdigit():
+        pieces: list[str] = []
+        last = 0
+        for m in cls.__ANSI_RE.finditer(colored_text):
+            pieces.append(colored_text[last:m.start()])
+            last = m.end()
+            for c in m.group(1).split(";"):
+                if not c:
+                    others.append(c)
+                    continue
                 num = int(c)
-                if 30 <= num <= 37 or 90 <= num <= 97:
+                if num in _FG_BASIC:
                     fg = num
-                elif 40 <= num <= 47 or 100 <= num <= 107:
+                elif num in _BG_BASIC:
                     bg = num
                 else:
                     others.append(num)
-            else:
-                others.append(c)
+        if not pieces:
+            return colored_text
+        pieces.append(colored_text[last:])
 
         new_fg = bg
         new_bg = fg
@@ -389,11 +502,12 @@ class CPrint:
         new_codes.extend(others)
 
         prefix = cls.__join_codes(new_codes)
-        stripped = cls.__ANSI_RE.sub("", colored_text)
-        return f"{prefix}{stripped}{cls.__RESET}"
+        return f"{prefix}{''.join(pieces)}{cls.__RESET}"
 
     @classmethod
     def strip_ansi(cls, text: str) -> str:
+        if "\x1b" not in text:
+            return text     # common case: nothing to strip, skip the regex engine
         return cls.__ANSI_RE.sub("", text)
 
     @staticmethod
@@ -423,13 +537,9 @@ class CPrint:
             A string where ANSI color/style codes are escaped, but other control
             sequences remain functional.
         """
-        result = []
-        for ch in text:
-            if ch == "\x1b":  # ESC byte
-                result.append("\\x1b")
-            else:
-                result.append(ch)
-        return "".join(result)
+        if "\x1b" not in text:  # no ESC byte - nothing to escape
+            return text
+        return text.replace("\x1b", "\\x1b")
 
     @staticmethod
     def escape_control_chars(text: str) -> str:
@@ -456,13 +566,7 @@ class CPrint:
             A string where all ANSI control sequences are escaped (e.g., "\x1b" → "\\x1b"),
             ensuring the terminal displays them as plain text.
         """
-        out = []
-        for ch in text:
-            if ord(ch) < 32 or ord(ch) == 127:
-                out.append(f"\\x{ord(ch):02x}")
-            else:
-                out.append(ch)
-        return "".join(out)
+        return text.translate(_CONTROL_ESCAPES)
 
 
 class GradientPalette:
@@ -509,43 +613,43 @@ class GradientPalette:
     BRIGHT_RED = 196
 
     # Classic rainbow
-    RAINBOW = [196, 208, 226, 46, 21, 93]
+    RAINBOW = (196, 208, 226, 46, 21, 93)
 
     # Smooth sunset
-    SUNSET = [196, 202, 208, 214, 220, 226]
+    SUNSET = (196, 202, 208, 214, 220, 226)
 
     # Ocean blue
-    OCEAN = [18, 19, 20, 21, 27, 33, 39, 45, 51]
+    OCEAN = (18, 19, 20, 21, 27, 33, 39, 45, 51)
 
     # Fire (deep red → bright yellow)
-    FIRE = [52, 88, 124, 160, 196, 202, 226]
+    FIRE = (52, 88, 124, 160, 196, 202, 226)
 
     # Ice (blue → cyan → white)
-    ICE = [21, 27, 33, 39, 51, 87, 231]
+    ICE = (21, 27, 33, 39, 51, 87, 231)
 
     # Greyscale ramp
-    GREYSCALE = [232, 235, 239, 244, 250, 255]
+    GREYSCALE = (232, 235, 239, 244, 250, 255)
 
     # Forest (greens)
-    FOREST = [22, 28, 34, 40, 46, 82, 118]
+    FOREST = (22, 28, 34, 40, 46, 82, 118)
 
     # Neon (bright cyberpunk)
-    NEON = [201, 93, 51, 87, 123, 159, 195]
+    NEON = (201, 93, 51, 87, 123, 159, 195)
 
     # Pastel (soft tones)
-    PASTEL = [224, 225, 189, 151, 146, 182, 218]
+    PASTEL = (224, 225, 189, 151, 146, 182, 218)
 
 
-def blend_palettes(p1: list[int], p2: list[int], *, steps: int | None = None) -> list[int]: # pragma: no cover
+def blend_palettes(p1: Sequence[int], p2: Sequence[int], *, steps: int | None = None) -> list[int]:
     """
     Blend two palettes by interpolating their indices.
     Produces a smooth transition from palette p1 to palette p2.
 
     Parameters
     ----------
-    p1 : list[int]
-        First palette (start)
-    p2 : list[int]
+    p1 : Sequence[int]
+        First palette (start), e.g. a GradientPalette constant
+    p2 : Sequence[int]
         Second palette (end)
     steps : int | None
         Number of output colors. If None, uses max(len(p1), len(p2)).
@@ -559,25 +663,10 @@ def blend_palettes(p1: list[int], p2: list[int], *, steps: int | None = None) ->
     if steps is None:
         steps = max(len(p1), len(p2))
 
-    # Stretch both palettes to equal length
-    def stretch(stops: list[int], target: int) -> list[int]:
-        if len(stops) == target:
-            return stops
-        if len(stops) == 1:
-            return stops * target
-        out = []
-        for i in range(target):
-            idx = int(i * (len(stops) - 1) / (target - 1))
-            out.append(stops[idx])
-        return out
-
-    p1s = stretch(p1, steps)
-    p2s = stretch(p2, steps)
-
-    # Linear interpolation in index space
-    blended = []
-    for a, b in zip(p1s, p2s):
-        mid = int((a + b) / 2)
-        blended.append(mid)
-
-    return blended
+    # Stretch both palettes to equal length and average them in index space
+    # - one pass over the cached index tables, no intermediate lists
+    #   (xterm indices are 0..255: plain int math, nothing to vectorize)
+    return [
+        (p1[i] + p2[j]) // 2
+        for i, j in zip(_stretch_indices(len(p1), steps), _stretch_indices(len(p2), steps))
+    ]
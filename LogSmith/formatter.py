@@ -1,8 +1,13 @@
 # LogSmith/formatter.py
 
+import functools
 import json
 import logging
+import math
+import re
+import time
 import traceback
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from enum import Enum
@@ -39,6 +44,25 @@ class OptionalRecordFields:
     stack_info: bool = False
 
 
+# Validation tables (OptionalRecordFields layout is fixed)
+_INLINE_FIELDS: tuple[str, ...] = (
+    "relative_created",
+    "logger_name",
+    "file_path",
+    "file_name",
+    "lineno",
+    "func_name",
+    "thread_id",
+    "thread_name",
+    "task_name",
+    "process_id",
+    "process_name",
+)
+_DIAGNOSTIC_FIELDS: tuple[str, ...] = ("exc_info", "stack_info")
+_ALLOWED_PARTS = frozenset(_INLINE_FIELDS) | {"level", *_DIAGNOSTIC_FIELDS}
+_FORBIDDEN_PARTS = frozenset({"timestamp", "message"})
+
+
 # ================================================================
 # LogRecordDetails
 # ================================================================
@@ -116,13 +140,7 @@ class LogRecordDetails:
         # ------------------------------------------------------------
         orf = self.optional_record_fields
 
-        # Inline optional fields (diagnostics excluded)
-        inline_fields = [
-            f for f in vars(orf).keys()
-            if f not in ("exc_info", "stack_info")
-        ]
-
-        inline_enabled = any(getattr(orf, f) for f in inline_fields)
+        inline_enabled = any(getattr(orf, f) for f in _INLINE_FIELDS)
         diagnostics_enabled = orf.exc_info or orf.stack_info
 
         # Case: only diagnostics enabled → message_parts_order must be None
@@ -139,48 +157,50 @@ class LogRecordDetails:
             raise ValueError("message_parts_order must be provided when inline optional fields are enabled")
 
         mpo = self.message_parts_order
+        counts = Counter(mpo)   # one pass; every check below is a lookup
 
         # ------------------------------------------------------------
         # timestamp and message must NOT appear
         # ------------------------------------------------------------
-        forbidden = {"timestamp", "message"}
-        if any(p in forbidden for p in mpo):
+        if not _FORBIDDEN_PARTS.isdisjoint(counts):
             raise ValueError("timestamp and message must NOT appear in message_parts_order")    # pragma: no cover
 
         # ------------------------------------------------------------
         # level must appear exactly once
         # ------------------------------------------------------------
-        if mpo.count("level") != 1:
+        if counts["level"] != 1:
             raise ValueError("message_parts_order must contain 'level' exactly once")
 
         # ------------------------------------------------------------
         # Optional inline fields must match message_parts_order exactly
         # ------------------------------------------------------------
-        for field_name in inline_fields:
+        for field_name in _INLINE_FIELDS:
             enabled = getattr(orf, field_name)
 
             if enabled:
-                if mpo.count(field_name) != 1:
+                if counts[field_name] != 1:
                     raise ValueError(f"Optional field '{field_name}' is True but not present exactly once in message_parts_order")
             else:
-                if field_name in mpo:
+                if counts[field_name]:
                     raise ValueError(f"Optional field '{field_name}' is False but appears in message_parts_order")
 
         # ------------------------------------------------------------
         # Diagnostics may appear only if enabled
         # ------------------------------------------------------------
-        if "exc_info" in mpo:
+        if counts["exc_info"]:
             raise ValueError("exc_info should not appear in message_parts_order")
 
-        if "stack_info" in mpo:
+        if counts["stack_info"]:
             raise ValueError("stack_info should not appear in message_parts_order")
 
         # ------------------------------------------------------------
         # Allowed message parts
         # ------------------------------------------------------------
-        allowed = set(inline_fields) | {"level", "exc_info", "stack_info"}
+        if counts.keys() <= _ALLOWED_PARTS:
+            return
+
         for part in mpo:
-            if part not in allowed:
+            if part not in _ALLOWED_PARTS:
                 raise ValueError(
                     f"Invalid message part: {part!r}. "
                     f"Allowed parts are OptionalRecordFields attributes, 'level', 'exc_info', or 'stack_info'."
@@ -197,50 +217,205 @@ class OutputMode(Enum):
 # ================================================================
 # Timestamp formatting
 # ================================================================
-def _format_timestamp(record: logging.LogRecord, datefmt: str | None) -> str:
+TimestampRenderer = Callable[[float], str]
+
+_FRACTION_RE          = re.compile(r"%([1-6])f")
+_INVALID_FRACTION_RE  = re.compile(r"%([0,7-9])f")
+_FRACTION_PLACEHOLDER = "__FRACTIONAL_SECONDS__"
+_FRACTION_SLOT        = "\x00"
+
+# directives the fast assembler renders from time.localtime() fields
+_FAST_DIRECTIVES = {
+    "Y": "{0:04d}",
+    "m": "{1:02d}",
+    "d": "{2:02d}",
+    "H": "{3:02d}",
+    "M": "{4:02d}",
+    "S": "{5:02d}",
+}
+
+
+def _fast_datefmt_template(datefmt: str) -> str | None:
+    """
+    Translate a datefmt built only from %Y %m %d %H %M %S and %1f..%6f
+    into a str.format template. Returns None for anything else
+    (locale-dependent directives, %%, ...), which keeps the strftime path.
+    """
+    out: List[str] = []
+    i = 0
+    while i < len(datefmt):
+        ch = datefmt[i]
+        if ch == "%":
+            directive = datefmt[i + 1:i + 2]
+            if directive in _FAST_DIRECTIVES:
+                out.append(_FAST_DIRECTIVES[directive])
+                i += 2
+                continue
+            if directive and directive in "123456" and datefmt[i + 2:i + 3] == "f":
+                out.append("{6}")
+                i += 3
+                continue
+            return None
+        out.append("{{" if ch == "{" else "}}" if ch == "}" else ch)
+        i += 1
+    return "".join(out)
+
+
+def _compile_fast_datefmt(template: str, digits: int) -> TimestampRenderer:
+    # Everything but the fraction only changes once per second: render the
+    # second's text once (split around the fraction slots) and reuse it.
+    last: tuple[float, list[str]] = (math.nan, [])
+
+    def render_fast(created: float) -> str:
+        nonlocal last
+
+        # same split + half-even rounding as datetime.fromtimestamp()
+        frac, whole = math.modf(created)
+        us = round(frac * 1e6)
+        if us >= 1_000_000:
+            whole += 1
+            us -= 1_000_000
+        elif us < 0:
+            whole -= 1
+            us += 1_000_000
+
+        second, segments = last
+        if second != whole:
+            lt = time.localtime(whole)
+            segments = template.format(
+                lt.tm_year, lt.tm_mon, lt.tm_mday, lt.tm_hour, lt.tm_min, lt.tm_sec,
+                _FRACTION_SLOT,
+            ).split(_FRACTION_SLOT)
+            last = (whole, segments)
+
+        if len(segments) == 1:
+            return segments[0]
+        return f"{us:06d}"[:digits].join(segments)
+
+    return render_fast
+
+
+def _compile_per_second(render_second: Callable[[float], str], digits: int) -> TimestampRenderer:
+    """
+    Same once-per-second reuse as the fast renderer, for datefmts that still
+    need datetime/strftime: ``render_second`` maps a whole-second timestamp
+    to its text, with _FRACTION_PLACEHOLDER wherever the first ``digits``
+    digits of the microseconds go.
+
+    The cache is a single tuple, replaced atomically, so concurrent handlers
+    never need a lock (at worst two threads render the same second).
+    """
+    last: tuple[float, list[str]] = (math.nan, [])
+
+    def render_cached(created: float) -> str:
+        nonlocal last
+
+        # same split + half-even rounding as datetime.fromtimestamp()
+        frac, whole = math.modf(created)
+        us = round(frac * 1e6)
+        if us >= 1_000_000:
+            whole += 1
+            us -= 1_000_000
+        elif us < 0:
+            whole -= 1
+            us += 1_000_000
+
+        second, segments = last
+        if second != whole:
+            segments = render_second(whole).split(_FRACTION_PLACEHOLDER)
+            last = (whole, segments)
+
+        if len(segments) == 1:
+            return segments[0]
+        return f"{us:06d}"[:digits].join(segments)
+
+    return render_cached
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_datefmt(datefmt: str | None) -> TimestampRenderer:
+    """
+    Parse a datefmt once and return a renderer mapping ``record.created``
+    to the formatted timestamp. Invalid fractional directives are reported
+    when rendering, not when compiling.
+    """
     if datefmt is None:
-        return datetime.fromtimestamp(record.created).isoformat(sep=" ", timespec="seconds")
+        return _compile_per_second(
+            lambda whole: datetime.fromtimestamp(whole).isoformat(sep=" ", timespec="seconds"),
+            0,
+        )
 
-    import re
-    base = datetime.fromtimestamp(record.created)
+    match = _FRACTION_RE.search(datefmt)
+
+    # Hot case (including the default datefmt): assemble from integers,
+    # no datetime object and no strftime
+    template = _fast_datefmt_template(datefmt)
+    if template is not None and _FRACTION_SLOT not in datefmt:
+        return _compile_fast_datefmt(template, int(match.group(1)) if match else 0)
 
-    match = re.search(r"%([1-6])f", datefmt)
     if match:
-        digits = int(match.group(1))
-        placeholder = "__FRACTIONAL_SECONDS__"
-        normalized = re.sub(r"%[1-6]f", placeholder, datefmt)
-        rendered = base.strftime(normalized)
-        micros = f"{base.microsecond:06d}"[:digits]
-        return rendered.replace(placeholder, micros)
-
-    invalid = re.search(r"%([0,7-9])f", datefmt)
+        # strftime still runs, but only once per second
+        normalized = _FRACTION_RE.sub(_FRACTION_PLACEHOLDER, datefmt)
+        return _compile_per_second(
+            lambda whole: datetime.fromtimestamp(whole).strftime(normalized),
+            int(match.group(1)),
+        )
+
+    invalid = _INVALID_FRACTION_RE.search(datefmt)
     if invalid:
-        raise ValueError(
+        error = (
             f"Invalid fractional seconds directive '{invalid.group(0)}'. "
             "Only %1f through %6f are supported."
         )
 
-    if "%f" in datefmt:
-        return base.strftime(datefmt)
+        def render_invalid(created: float) -> str:
+            raise ValueError(error)
 
-    return base.strftime(datefmt)
+        return render_invalid
+
+    if "%f" not in datefmt:
+        return _compile_per_second(
+            lambda whole: datetime.fromtimestamp(whole).strftime(datefmt),
+            0,
+        )
+
+    # plain %f, which strftime renders natively
+    return lambda created: datetime.fromtimestamp(created).strftime(datefmt)
+
+
+def _format_timestamp(record: logging.LogRecord, datefmt: str | None) -> str:
+    return _compile_datefmt(datefmt)(record.created)
 
 
 # ================================================================
 # Extras extraction
 # ================================================================
+_STANDARD_FIELDS = frozenset({
+    "name", "msg", "args", "levelname", "levelno",
+    "pathname", "filename", "module", "exc_info",
+    "exc_text", "stack_info", "lineno", "funcName",
+    "created", "msecs", "relativeCreated", "thread",
+    "threadName", "processName", "process",
+    "taskName", "task",
+    "message", "asctime",
+    # LogSmith per-record caches
+    "_logsmith_audit_line",
+    "_logsmith_plain_line",
+    "_logsmith_message",
+    # LogSmith bookkeeping markers
+    "_logsmith_audited",
+})
+
+
 def _extract_extras(record: logging.LogRecord) -> Mapping[str, Any]:
-    standard = {
-        "name", "msg", "args", "levelname", "levelno",
-        "pathname", "filename", "module", "exc_info",
-        "exc_text", "stack_info", "lineno", "funcName",
-        "created", "msecs", "relativeCreated", "thread",
-        "threadName", "processName", "process",
-        "taskName", "task",
-        "message", "asctime",
-    }
+    attrs = record.__dict__
+
+    # Fast path: most records carry no extras at all
+    if attrs.keys() <= _STANDARD_FIELDS:
+        return {}
+
     extras: Dict[str, Any] = {
-        k: v for k, v in record.__dict__.items() if k not in standard
+        k: v for k, v in attrs.items() if k not in _STANDARD_FIELDS
     }
 
     # Remove empty extras
@@ -249,122 +424,259 @@ def _extract_extras(record: logging.LogRecord) -> Mapping[str, Any]:
 
     fields = extras.get("fields", {})
     if isinstance(fields, dict):
-        extras = {k: v for k, v in extras.items() if k != "fields"}
+        extras.pop("fields", None)
         extras.update(fields)
 
     return extras
 
 
+# ================================================================
+# Message text
+# ================================================================
+def _get_message(record: logging.LogRecord) -> str:
+    """
+    Resolve ``msg % args``, shared by the handlers formatting the same record.
+
+    The result is stored in record.message (as logging.Formatter does) and
+    reused only while record.msg and record.args are the objects it was
+    built from: a handler filter that rewrites them (e.g. redaction) gets a
+    fresh message.
+    """
+    msg, args = record.msg, record.args
+    cached = record.__dict__.get("_logsmith_message")
+    if cached is not None and cached[0] is msg and cached[1] is args:
+        return cached[2]
+
+    message = record.getMessage()
+    record.message = message
+    record._logsmith_message = (msg, args, message)
+    return message
+
+
+# ================================================================
+# Exception text
+# ================================================================
+_EXC_FMT = logging.Formatter()
+
+
+def _format_exc_info(record: logging.LogRecord) -> str:
+    """
+    Render record.exc_info once per record.
+
+    The text is cached in record.exc_text, exactly like logging.Formatter
+    does, so console, file and audit handlers share a single traceback
+    rendering (stdlib formatters reuse it as well).
+    """
+    if not record.exc_text:
+        record.exc_text = _EXC_FMT.formatException(record.exc_info)
+    return record.exc_text + "\n"
+
+
+# ================================================================
+# Compiled inline-field renderers
+# ================================================================
+Renderer = Callable[[logging.LogRecord], str]
+
+
+def _render_task_name(record: logging.LogRecord) -> str | None:
+    if not hasattr(record, "taskName"):
+        return None     # pre-3.12 records carry no taskName; the part is omitted
+    return getattr(record, "taskName") or ''    # taskName is the only field that can have NoneValue
+
+
+def _inline_part_names(details: LogRecordDetails) -> tuple[str, ...]:
+    """
+    Resolve message_parts_order against OptionalRecordFields once, returning
+    the names of the inline parts (between timestamp and message) in order.
+    Diagnostics never appear inline; they are appended after the message.
+    """
+    rf = details.optional_record_fields
+    mpo = details.message_parts_order
+
+    if rf is None or mpo is None:
+        # simple mode / diagnostics-only mode → level is the only inline part
+        return ("level",)
+
+    return tuple(
+        part for part in mpo
+        if part == "level" or (part in _INLINE_FIELDS and getattr(rf, part, False))
+    )
+
+
+def _compile_parts(
+    details: LogRecordDetails,
+    renderers: Mapping[str, Callable[[logging.LogRecord], Any]],
+) -> tuple:
+    """
+    The renderers of the inline parts, in compiled order.
+    """
+    return tuple(renderers[part] for part in _inline_part_names(details) if part in renderers)
+
+
+# f-string source of each plain inline part (task_name is handled apart)
+_PLAIN_PART_SOURCE: Dict[str, str] = {
+    "level":            "{r.levelname}",
+    "relative_created": "{int(r.relativeCreated)}",
+    "logger_name":      "LOGGER={r.name}",
+    "file_path":        "{r.pathname}",
+    "file_name":        "{r.filename}",
+    "lineno":           "L={r.lineno}",
+    "func_name":        "{r.funcName}",
+    "thread_id":        "th={r.thread}",
+    "thread_name":      "{r.threadName}",
+    "process_id":       "P={r.process}",
+    "process_name":     "{r.processName}",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_plain_head(
+    part_names: tuple[str, ...],
+    timestamp: TimestampRenderer,
+    separator: str,
+) -> Callable[[logging.LogRecord], str]:
+    """
+    Generate a specialized function rendering everything in front of the
+    message: "<timestamp><sep><part><sep>...<part><sep>".
+
+    The parts are unrolled into a single f-string, so the per-record work is
+    one call with no loop or dispatch over message_parts_order. Formatters
+    built from equal layouts (e.g. a logger's file and audit formatters)
+    share the generated function.
+    """
+    pieces = ["{_ts(r.created)}{_sep}"]
+    chunks = []
+    for name in part_names:
+        if name == "task_name":
+            # pre-3.12 records may lack taskName, in which case the part is omitted
+            chunks.append('f"' + "".join(pieces) + '"')
+            chunks.append('("" if (t := _task(r)) is None else t + _sep)')
+            pieces = []
+        else:
+            pieces.append(_PLAIN_PART_SOURCE[name] + "{_sep}")
+    if pieces:
+        chunks.append('f"' + "".join(pieces) + '"')
+
+    source = (
+        "def _head(r, _ts=_ts, _sep=_sep, _task=_task):\n"
+        f"    return {' + '.join(chunks)}\n"
+    )
+    namespace = {"_ts": timestamp, "_sep": separator, "_task": _render_task_name}
+    exec(compile(source, "<logsmith plain head>", "exec"), namespace)
+    return namespace["_head"]
+
+
 # ================================================================
 # Plain formatter
 # ================================================================
 class StructuredPlainFormatter:
     """
     Plain (non-colored) formatter driven by LogRecordDetails.
+
+    The details are compiled when the formatter is constructed.
     """
 
     def __init__(self, details: LogRecordDetails) -> None:
         self._details = details or LogRecordDetails()
+        self.__timestamp = _compile_datefmt(self._details.datefmt)
+        self.__separator = f" {self._details.separator} "
+        self.__part_names = _inline_part_names(self._details)
+        self.__head = _compile_plain_head(self.__part_names, self.__timestamp, self.__separator)
 
-    @staticmethod
-    def __format_exc_info(record: logging.LogRecord) -> str:
-        import traceback
-        return "".join(traceback.format_exception(*record.exc_info))
-
-    def format(self, record: logging.LogRecord) -> str:
         rf = self._details.optional_record_fields
+        self.__simple_mode        = rf is None
+        self.__exc_info_enabled   = bool(rf and rf.exc_info)
+        self.__stack_info_enabled = bool(rf and rf.stack_info)
+
+        # Formatters with an identical configuration render identical lines;
+        # the signature lets them share one rendering per record.
+        self.__signature = (
+            self._details.datefmt, self.__separator, self.__part_names,
+            self.__simple_mode, self.__exc_info_enabled, self.__stack_info_enabled,
+        )
+
+        # Resolve the format path once (unless a subclass customizes format())
+        self.__render = self.__format_simple if self.__simple_mode else self.__format_strict
+        if type(self).format is StructuredPlainFormatter.format:
+            self.format = self.__format_shared
 
-        # SIMPLE MODE
-        if rf is None:
-            parts = [
-                _format_timestamp(record, self._details.datefmt),
-                record.levelname,
-                record.getMessage(),
-            ]
-            line = f" {self._details.separator} ".join(parts)
+    def format(self, record: logging.LogRecord) -> str:
+        return self.__format_shared(record)
+
+    def __format_shared(self, record: logging.LogRecord) -> str:
+        # e.g. the audit handler and a file handler using the same details;
+        # reused only while msg/args are unchanged (a filter may rewrite them)
+        msg, args = record.msg, record.args
+        cached = record.__dict__.get("_logsmith_plain_line")
+        if cached is not None and cached[0] == self.__signature and cached[1] is msg and cached[2] is args:
+            return cached[3]
+
+        line = self.__render(record)
+        record._logsmith_plain_line = (self.__signature, msg, args, line)
+        return line
 
-            extras = _extract_extras(record)
-            if extras:
-                kv = ", ".join(f"{k}={v!r}" for k, v in extras.items())
-                line = f"{line} {{{kv}}}"
+    def __format_simple(self, record: logging.LogRecord) -> str:
+        sep = self.__separator
+        line = f"{self.__timestamp(record.created)}{sep}{record.levelname}{sep}{_get_message(record)}"
 
+        # the common case: no extras
+        if record.__dict__.keys() <= _STANDARD_FIELDS:
             return line
 
-        # STRICT MODE
-        # noinspection PyListCreation
-        parts = []
+        extras = _extract_extras(record)
+        if extras:
+            kv = ", ".join([f"{k}={v!r}" for k, v in extras.items()])
+            line = f"{line} {{{kv}}}"
 
-        # Always first
-        parts.append(_format_timestamp(record, self._details.datefmt))
+        return line
 
-        if self._details.message_parts_order is None:
-            # diagnostics-only mode (no inline fields)
-            parts.append(record.levelname)
-        else:
-            # Inline fields
-            for part in self._details.message_parts_order:
-                if part == "level":
-                    parts.append(record.levelname)
-                elif part == "relative_created" and rf.relative_created:
-                    parts.append(str(int(record.relativeCreated)))
-                elif part == "logger_name" and rf.logger_name:
-                    parts.append(f"LOGGER={record.name}")
-                elif part == "file_path" and rf.file_path:
-                    parts.append(record.pathname)
-                elif part == "file_name" and rf.file_name:
-                    parts.append(record.filename)
-                elif part == "lineno" and rf.lineno:
-                    parts.append("L=" + str(record.lineno))
-                elif part == "func_name" and rf.func_name:
-                    parts.append(record.funcName)
-                elif part == "thread_id" and rf.thread_id:
-                    parts.append("th=" + str(record.thread))
-                elif part == "thread_name" and rf.thread_name:
-                    parts.append(record.threadName)
-                elif part == "task_name" and rf.task_name and hasattr(record, "taskName"):
-                    parts.append(getattr(record, "taskName") or '')     # taskName is the only field that can have NoneValue
-                elif part == "process_id" and rf.process_id:
-                    parts.append("P=" + str(record.process))
-                elif part == "process_name" and rf.process_name:
-                    parts.append(record.processName)
-                elif part == "exc_info" and rf.exc_info and record.exc_info:
-                    parts.append(self.__format_exc_info(record))
-                elif part == "stack_info" and rf.stack_info and record.stack_info:
-                    parts.append(str(record.stack_info))
-
-        # Always last
-        parts.append(record.getMessage())
-
-        line = f" {self._details.separator} ".join(parts)
+    def __format_strict(self, record: logging.LogRecord) -> str:
+        # timestamp always first, inline fields in compiled order, message always last
+        line = self.__head(record) + _get_message(record)
 
+        # extras trail the message within the same field
         extras = _extract_extras(record)
         if extras:
-            kv = ", ".join(f"{k}={v!r}" for k, v in extras.items())
+            kv = ", ".join([f"{k}={v!r}" for k, v in extras.items()])
             line = f"{line} {kv}"
 
-        # Note: no extra exc_info/stack_info append here anymore;
-        # they are handled as structured fields above when enabled.
-
         # ------------------------------------------------------------
-        # Fallback: diagnostics appended last if not in message_parts_order
+        # Diagnostics never appear in message_parts_order; they are appended last
         # ------------------------------------------------------------
-        rf = self._details.optional_record_fields
-        mpo = self._details.message_parts_order or []
-
-        if rf:
-            if rf.exc_info and record.exc_info and "exc_info" not in mpo:
-                line += "\n" + self.__format_exc_info(record)
-
-            if rf.stack_info and record.stack_info and "stack_info" not in mpo:
-                line += "\n" + str(record.stack_info)
+        exc_info   = self.__exc_info_enabled and record.exc_info
+        stack_info = self.__stack_info_enabled and record.stack_info
+        if not (exc_info or stack_info):
+            return line
 
-        return line
+        lines = [line]
+        if exc_info:
+            lines.append(_format_exc_info(record))
+        if stack_info:
+            lines.append(str(record.stack_info))
+        return "\n".join(lines)
 
 
 # ================================================================
 # Color formatter (table-driven)
 # ================================================================
-Renderer = Callable[[logging.LogRecord], str]
+def _ansi_affixes(
+    *,
+    fg:        Code | None = None,
+    bg:        Code | None = None,
+    intensity: Code | None = None,
+    styles:    Any = None,
+) -> tuple[str, str]:
+    """
+    Split CPrint.colorize() output around a sentinel into (prefix, suffix),
+    so that wrapping text becomes a plain concatenation.
+    """
+    prefix, _, suffix = CPrint.colorize("\x00", fg=fg, bg=bg, intensity=intensity, styles=styles).partition("\x00")
+    return prefix, suffix
+
+
+_DIM_PREFIX, _DIM_SUFFIX = _ansi_affixes(fg=CPrint.FG.CONSOLE_DEFAULT, intensity=CPrint.Intensity.DIM)
+_KEY_PREFIX, _KEY_SUFFIX = _ansi_affixes(fg=CPrint.FG.BRIGHT_WHITE, intensity=CPrint.Intensity.BOLD)
+_VAL_PREFIX, _VAL_SUFFIX = _ansi_affixes(fg=CPrint.FG.BRIGHT_GREY)
 
 class StructuredColorFormatter:
     """
@@ -385,11 +697,23 @@ class StructuredColorFormatter:
         if details is None:
             details = LogRecordDetails()
         self.__details       = details
+        self.__timestamp     = _compile_datefmt(details.datefmt)
         self.__key_fg        = key_fg
         self.__key_intensity = key_intensity
         self.__value_fg      = value_fg
         self.__current_style: LevelStyle | None = None
 
+        # ANSI wrappers resolved once, not per record
+        self.__separator = " " + CPrint.colorize(
+            details.separator,
+            fg=CPrint.FG.BRIGHT_WHITE,
+            intensity=CPrint.Intensity.BOLD,
+        ) + " "
+        self.__rendered_levels: dict[str, tuple[LevelStyle | None, str]] = {}
+
+        # metadata styling is fixed per formatter: level colors or dim
+        self.__style_meta = self.__apply_level if details.color_all_log_record_fields else self.__style_meta_dim
+
         self.FIELD_RENDERERS: dict[str, Renderer] = {
             "relative_created": self.__render_relative_created,
             "level":            self.__render_level,
@@ -406,47 +730,53 @@ class StructuredColorFormatter:
             "exc_info":         self.__render_exc_info,
             "stack_info":       self.__render_stack_info,
         }
+        self.__pipeline: tuple[Renderer, ...] = _compile_parts(details, self.FIELD_RENDERERS)
+
+        rf = details.optional_record_fields
+        self.__exc_info_enabled   = bool(rf and rf.exc_info)
+        self.__stack_info_enabled = bool(rf and rf.stack_info)
+        self.__with_diagnostics   = self.__exc_info_enabled or self.__stack_info_enabled
+
+        # Resolve the format path once (unless a subclass customizes format())
+        if type(self).format is StructuredColorFormatter.format:
+            self.format = self.__format_with_diagnostics if self.__with_diagnostics else self.__format_line
 
     # ------------------------------------------------------------
     # Styling helpers
     # ------------------------------------------------------------
     @staticmethod
     def dim(text: str) -> str:
-        return CPrint.colorize(
-            text,
-            fg=CPrint.FG.CONSOLE_DEFAULT,
-            intensity=CPrint.Intensity.DIM,
-        )
+        return f"{_DIM_PREFIX}{text}{_DIM_SUFFIX}"
 
     @staticmethod
     def __apply_level(text: str, style: LevelStyle | None) -> str:
         if not style:
             return text
-        return CPrint.colorize(
-            text,
-            fg=style.fg,
-            bg=style.bg,
-            intensity=style.intensity,
-            styles=style.styles,
-        )
+        return style.apply(text)
 
-    def __style_meta(self, text: str, style: LevelStyle | None) -> str:
-        if self.__details.color_all_log_record_fields:
-            return self.__apply_level(text, style)
-        return self.dim(text)
+    @staticmethod
+    def __style_meta_dim(text: str, style: LevelStyle | None) -> str:
+        return f"{_DIM_PREFIX}{text}{_DIM_SUFFIX}"
 
     # ------------------------------------------------------------
     # Field renderers
     # ------------------------------------------------------------
     def __render_timestamp(self, rec):
-        ts = _format_timestamp(rec, self.__details.datefmt)
+        ts = self.__timestamp(rec.created)
         return self.__style_meta(ts, self.__current_style)
 
     def __render_relative_created(self, rec):
         return self.__style_meta(str(int(rec.relativeCreated)), self.__current_style)
 
     def __render_level(self, rec):
-        return self.__apply_level(rec.levelname.ljust(8), self.__current_style)
+        # padded + styled level names are constant per (levelname, style)
+        style = self.__current_style
+        entry = self.__rendered_levels.get(rec.levelname)
+        if entry is None or entry[0] is not style:
+            entry = self.__rendered_levels[rec.levelname] = (
+                style, self.__apply_level(rec.levelname.ljust(8), style)
+            )
+        return entry[1]
 
     def __render_logger_name(self, rec):
         return self.__style_meta(f"LOGGER={rec.name}", self.__current_style)
@@ -480,103 +810,62 @@ class StructuredColorFormatter:
 
     @staticmethod
     def __render_exc_info(rec) -> str:
-        import traceback
-        text = "".join(traceback.format_exception(*rec.exc_info))
-        return CPrint.colorize(text, fg=CPrint.FG.BRIGHT_RED)
+        return CPrint.colorize(_format_exc_info(rec), fg=CPrint.FG.BRIGHT_RED)
 
     @staticmethod
     def __render_stack_info(rec):
         return CPrint.colorize(str(rec.stack_info), fg=CPrint.FG.BRIGHT_MAGENTA)
 
     def __render_message(self, rec):
-        return self.__apply_level(rec.getMessage(), self.__current_style)
+        return self.__apply_level(_get_message(rec), self.__current_style)
 
     # ------------------------------------------------------------
     # Extras renderer
     # ------------------------------------------------------------
     @staticmethod
     def __render_extras_colored(named_arguments: Mapping[str, Any]) -> str:
-        parts = []
-        for k, v in named_arguments.items():
-            colored_key = CPrint.colorize(
-                k,
-                fg=CPrint.FG.BRIGHT_WHITE,
-                intensity=CPrint.Intensity.BOLD,
-            )
-            colored_val = CPrint.colorize(
-                repr(v),
-                fg=CPrint.FG.BRIGHT_GREY,
-            )
-            parts.append(f"{colored_key} = {colored_val}")
-        return f"{{{', '.join(parts)}}}"
+        kv = ", ".join([
+            f"{_KEY_PREFIX}{k}{_KEY_SUFFIX} = {_VAL_PREFIX}{v!r}{_VAL_SUFFIX}"
+            for k, v in named_arguments.items()
+        ])
+        return f"{{{kv}}}"
 
     # ------------------------------------------------------------
     # Main format()
     # ------------------------------------------------------------
     def format(self, record: logging.LogRecord) -> str:
-        rf = self.__details.optional_record_fields
+        if self.__with_diagnostics:
+            return self.__format_with_diagnostics(record)
+        return self.__format_line(record)
 
+    def __format_line(self, record: logging.LogRecord) -> str:
         level_entry = LEVELS.get(record.levelname)
         self.__current_style = level_entry["style"] if level_entry else None
 
-        if rf is None:  # SIMPLE MODE
-            parts = [
-                self.__render_timestamp(record),
-                self.__render_level(record),
-                self.__render_message(record),
-            ]
-        else:   # STRICT MODE
-            # timestamp is always first
-            parts = [self.__render_timestamp(record)]
-
-            # Inline fields
-            if self.__details.message_parts_order:
-                for part in self.__details.message_parts_order:
-                    renderer = self.FIELD_RENDERERS.get(part)
-                    if renderer:
-                        # respect rf flags for diagnostics as well
-                        if part == "exc_info" and not (rf.exc_info and record.exc_info):
-                            continue    # pragma: no cover
-                        if part == "stack_info" and not (rf.stack_info and record.stack_info):
-                            continue    # pragma: no cover
-                        parts.append(renderer(record))
-            else:
-                # diagnostics-only mode → include level
-                parts.append(self.__render_level(record))
-
-            # Always last
-            parts.append(self.__render_message(record))
-
-        sep = CPrint.colorize(
-            self.__details.separator,
-            fg=CPrint.FG.BRIGHT_WHITE,
-            intensity=CPrint.Intensity.BOLD,
-        )
-        line = f" {sep} ".join(parts)
+        # timestamp always first, inline fields in compiled order, message always last
+        parts = [self.__render_timestamp(record)]
+        parts.extend(render(record) for render in self.__pipeline)
 
+        # extras trail the message within the same field
+        message = self.__render_message(record)
         extras = _extract_extras(record)
         if extras:
-            line = f"{line} {self.__render_extras_colored(extras)}"
+            message = f"{message} {self.__render_extras_colored(extras)}"
+        parts.append(message)
 
-        # Note: no extra exc_info/stack_info append here;
-        # they are handled as structured fields when enabled.
+        return self.__separator.join(parts)
 
-        # ------------------------------------------------------------
-        # Fallback: diagnostics appended last if not in message_parts_order
-        # ------------------------------------------------------------
-        rf = self.__details.optional_record_fields
-        mpo = self.__details.message_parts_order or []
+    def __format_with_diagnostics(self, record: logging.LogRecord) -> str:
+        lines = [self.__format_line(record)]
 
-        if rf:
-            if rf.exc_info and record.exc_info and "exc_info" not in mpo:
-                import traceback
-                text = "".join(traceback.format_exception(*record.exc_info))
-                line += "\n" + CPrint.colorize(text, fg=CPrint.FG.BRIGHT_RED)
+        # diagnostics never appear in message_parts_order; they are appended last
+        if self.__exc_info_enabled and record.exc_info:
+            lines.append(self.__render_exc_info(record))
 
-            if rf.stack_info and record.stack_info and "stack_info" not in mpo:
-                line += "\n" + CPrint.colorize(str(record.stack_info), fg=CPrint.FG.BRIGHT_MAGENTA)
+        if self.__stack_info_enabled and record.stack_info:
+            lines.append(self.__render_stack_info(record))
 
-        return line
+        return "\n".join(lines)
 
 
 # # ================================================================
@@ -611,8 +900,15 @@ class AuditFormatter(logging.Formatter):
             self.structured = StructuredPlainFormatter(self.details)
 
     def format(self, record: logging.LogRecord) -> str:
-        prefix = f"[{record.name}]: "
-        return prefix + self.structured.format(record)
+        # A record can reach the audit handler more than once (directly and
+        # through propagation to the root logger); format it only once.
+        cached = record.__dict__.get("_logsmith_audit_line")
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        line = f"[{record.name}]: {self.structured.format(record)}"
+        record._logsmith_audit_line = (self, line)
+        return line
 
 
 # ================================================================
@@ -651,7 +947,7 @@ class StructuredJSONFormatter(logging.Formatter):
             "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
-            "message": CPrint.strip_ansi(record.getMessage()),
+            "message": CPrint.strip_ansi(_get_message(record)),
             "file_path": record.pathname,
             "file_name": record.filename,
             "lineno": record.lineno,
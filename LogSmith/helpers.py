@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
 
 def contains_any(s: str, subs: Iterable[str]):
@@ -13,3 +13,29 @@ def contains_all(s: str, subs: Iterable[str]):
         if sub not in s:
             return False
     return True
+
+
+class LazyMessage:
+    """
+    Wraps an expensive message computation.
+
+    The callable runs only when a handler renders the record (str()),
+    at most once per instance. Records that are filtered out by level
+    never pay for it.
+    """
+
+    __slots__ = ("__func", "__args", "__kwargs", "__text")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self.__func = func
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__text: str | None = None
+
+    def __str__(self) -> str:
+        if self.__text is None:
+            self.__text = str(self.__func(*self.__args, **self.__kwargs))
+        return self.__text
+
+    def __repr__(self) -> str:
+        return str(self)
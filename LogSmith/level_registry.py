@@ -1,20 +1,26 @@
 # LogSmith/level_registry.py
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 import logging
+import re
 
 from .colors import CPrint
 from .levels import LevelStyle, TRACE
 
 
+_LEVEL_NAME_RE = re.compile(r"[A-Z][A-Z0-9_][A-Z0-9]*")
+
+
 class LevelRegistry:
     def __init__(self) -> None:
         self.__levels: Dict[str, Dict[str, Any]] = {}
-        self.__cache: Dict[str, Dict[str, Any]] = {}
+        self.__value_map: Mapping[str, int] | None = None
         self.__init_builtin_levels()
 
     def __init_builtin_levels(self) -> None:
         self.__levels.clear()
+        self.__value_map = None
 
         self.register("TRACE", TRACE,
                       LevelStyle(fg=CPrint.FG.SOFT_PURPLE, intensity=CPrint.Intensity.NORMAL),
@@ -38,9 +44,7 @@ class LevelRegistry:
                       )
 
     def register(self, name: str, value: int, style: LevelStyle | None = None) -> None:
-        import re
-
-        if not re.fullmatch(r"[A-Z][A-Z0-9_][A-Z0-9]*", name):
+        if not _LEVEL_NAME_RE.fullmatch(name):
             raise ValueError(f"Invalid level name {name!r}. Must be uppercase letters, digits, underscores.")
 
         for existing in self.__levels.values():
@@ -55,18 +59,26 @@ class LevelRegistry:
             "style": style,
             "default_style": style,   # <--- added
         }
+        self.__value_map = None
 
-    def get(self, name: str) -> Dict[str, Any]:
-        if name in self.__cache:
-            return self.__cache[name]
-
-        value = self.__levels[name]
-        self.__cache[name] = value
-        return value
+    def get(self, name: str) -> Dict[str, Any] | None:
+        return self.__levels.get(name)
 
     def all(self) -> Dict[str, Dict[str, Any]]:
         return dict(self.__levels)
 
+    def value_map(self) -> Mapping[str, int]:
+        """
+        Read-only {name: value} mapping, NOTSET first.
+        Built once and reused until the next registration.
+        """
+        if self.__value_map is None:
+            values = {"NOTSET": logging.NOTSET}
+            for name, meta in self.__levels.items():
+                values[name] = meta["value"]
+            self.__value_map = MappingProxyType(values)
+        return self.__value_map
+
 
 LEVELS = LevelRegistry()
 
@@ -4,7 +4,7 @@ import logging
 from dataclasses import dataclass
 from typing import Tuple
 
-from .colors import Code
+from .colors import CPrint, Code
 
 
 TRACE = 5
@@ -20,3 +20,29 @@ class LevelStyle:
     bg: Code | None = None
     intensity: Code | None = None
     styles: Tuple[Code, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Resolve the ANSI codes once, when the style is created: coloring a
+        # record is then two concatenations. Frozen, so cache outside the fields.
+        colored = CPrint.colorize(
+            "\x00",
+            fg=self.fg,
+            bg=self.bg,
+            intensity=self.intensity,
+            styles=self.styles,
+        )
+        prefix, _, suffix = colored.partition("\x00")
+        object.__setattr__(self, "_affixes", (prefix, suffix))
+
+    def compile(self) -> Tuple[str, str]:
+        """
+        The style's (ANSI prefix, ANSI suffix) pair, resolved at creation.
+        """
+        return self._affixes
+
+    def apply(self, text: str) -> str:
+        """
+        Color text with this style.
+        """
+        prefix, suffix = self._affixes
+        return f"{prefix}{text}{suffix}"
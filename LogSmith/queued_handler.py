@@ -0,0 +1,242 @@
+# LogSmith/queued_handler.py
+
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+OVERFLOW_POLICIES = ("drop_oldest", "block")
+
+# most records the listener drains from the queue in one go
+_MAX_BATCH = 256
+
+
+def _is_evictable(item) -> bool:
+    """
+    Only log records may be dropped. The stop sentinel, flush markers and
+    raw text written by the user must be delivered.
+    """
+    return (
+        item is not None
+        and not hasattr(item, "_logsmith_flush_event")
+        and not hasattr(item, "_logsmith_raw_text")
+    )
+
+
+class _DropOldestQueue(queue.Queue):
+    """
+    Bounded queue for the drop_oldest policy: when full, put_dropping_oldest()
+    discards the oldest droppable record instead of blocking. Control entries
+    are never discarded; if nothing else is queued, the producer waits for
+    the listener to make room.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self.dropped = 0    # updated under the queue's own lock
+
+    def put_dropping_oldest(self, item) -> None:
+        with self.not_full:
+            while self._qsize() >= self.maxsize:
+                for i, queued in enumerate(self.queue):
+                    if _is_evictable(queued):
+                        # the dropped record's task is taken over by the new one
+                        del self.queue[i]
+                        self.dropped += 1
+                        self._put(item)
+                        self.not_empty.notify()
+                        return
+                self.not_full.wait()
+
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+
+class _FileQueueListener(QueueListener):
+    """
+    QueueListener that:
+        - blocks (instead of failing) when the stop sentinel meets a full queue
+        - drains whatever is already queued and writes runs of records through
+          the wrapped handler's emit_batch(), one lock round-trip per run
+        - writes raw text entries straight to the wrapped handler's stream
+        - answers flush markers once everything queued before them is written
+        - never lets a failing record kill the listener thread
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        q = self.queue
+        has_task_done = hasattr(q, "task_done")
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < _MAX_BATCH:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopped = self.__handle_batch(batch)
+            if has_task_done:
+                for _ in batch:
+                    q.task_done()
+            if stopped:
+                return
+
+    def __handle_batch(self, batch: list[logging.LogRecord]) -> bool:
+        """Handle drained records in order; True once the stop sentinel is reached."""
+        run: list[logging.LogRecord] = []
+        for record in batch:
+            if record is self._sentinel:
+                self.__emit_run(run)
+                return True
+            if hasattr(record, "_logsmith_flush_event") or hasattr(record, "_logsmith_raw_text"):
+                self.__emit_run(run)
+                run = []
+                self.handle(record)
+            else:
+                run.append(record)
+        self.__emit_run(run)
+        return False
+
+    def __emit_run(self, run: list[logging.LogRecord]) -> None:
+        handler = self.handlers[0]
+        emit_batch = getattr(handler, "emit_batch", None)
+        if emit_batch is None or len(run) < 2:
+            for record in run:
+                self.handle(record)
+            return
+
+        run = [record for record in run if record.levelno >= handler.level]
+        if not run:
+            return  # pragma: no cover
+
+        handler.acquire()
+        # noinspection PyBroadException
+        try:
+            emit_batch(run)
+        except Exception:   # pragma: no cover
+            handler.handleError(run[-1])
+        finally:
+            handler.release()
+
+    def handle(self, record: logging.LogRecord) -> None:
+        handler = self.handlers[0]
+
+        flushed = getattr(record, "_logsmith_flush_event", None)
+        if flushed is not None:
+            try:
+                handler.flush()
+            finally:
+                flushed.set()
+            return
+
+        raw_text = getattr(record, "_logsmith_raw_text", None)
+        if raw_text is not None:
+            handler.acquire()
+            try:
+                if handler.stream is None:  # pragma: no cover
+                    handler.stream = handler._open()
+                handler.stream.write(raw_text)
+                handler.stream.flush()
+            finally:
+                handler.release()
+            return
+
+        # noinspection PyBroadException
+        try:
+            super().handle(record)
+        except Exception:
+            handler.handleError(record)
+
+
+class QueuedFileHandler(QueueHandler):
+    """
+    QueuedFileHandler
+    =================
+    Wraps a file handler so that the logging thread only pays for an enqueue.
+    A single background thread (QueueListener) formats the records and writes
+    them through the wrapped handler, preserving their order.
+
+    Records are enqueued unformatted: message interpolation, extras and
+    exception text are all rendered on the listener thread.
+
+    Overflow policies (queue_size > 0):
+        - "drop_oldest": discard the oldest queued record to make room
+        - "block":       wait until the listener frees a slot
+
+    queue_size <= 0 means an unbounded queue.SimpleQueue (no overflow handling,
+    no task bookkeeping).
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        *,
+        queue_size: int = 8192,
+        overflow: str = "drop_oldest",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+
+        if queue_size <= 0:
+            q = queue.SimpleQueue()
+        elif overflow == "drop_oldest":
+            q = _DropOldestQueue(queue_size)
+        else:
+            q = queue.Queue(maxsize=queue_size)
+        super().__init__(q)
+
+        self.handler = handler
+        self.overflow = overflow
+        self.baseFilename = handler.baseFilename
+        self.setFormatter(handler.formatter)
+
+        self.__listener = _FileQueueListener(self.queue, handler, respect_handler_level=True)
+        self.__listener.start()
+        self.__running = True
+
+    @property
+    def dropped(self) -> int:
+        """Number of records discarded by the drop_oldest policy."""
+        return getattr(self.queue, "dropped", 0)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # formatting is deferred to the listener thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if isinstance(self.queue, _DropOldestQueue):
+            self.queue.put_dropping_oldest(record)
+        else:
+            self.queue.put(record)
+
+    def write_raw(self, text: str) -> None:
+        """
+        Queue text to be written verbatim, in order with the records.
+        Unlike records, raw text is never discarded by drop_oldest.
+        """
+        self.enqueue(logging.makeLogRecord({"_logsmith_raw_text": text}))
+
+    def flush(self) -> None:
+        """Block until every queued record has been written, then flush the file."""
+        if not self.__running:
+            self.handler.flush()
+            return
+
+        # a marker is never dropped: it waits for room, and drop_oldest skips it
+        flushed = threading.Event()
+        self.queue.put(logging.makeLogRecord({"_logsmith_flush_event": flushed}))
+        flushed.wait()
+
+    def close(self) -> None:
+        try:
+            if self.__running:
+                self.__running = False
+                self.__listener.stop()
+            self.handler.close()
+        finally:
+            super().close()
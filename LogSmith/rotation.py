@@ -1,12 +1,12 @@
 # LogSmith/rotation.py
 
+import codecs
 import errno
 import os
 import time
 import logging
-from logging.handlers import BaseRotatingHandler
 from datetime import datetime, timedelta
-from typing import Optional, IO, List
+from typing import Optional, IO, Iterator, List
 
 from LogSmith.rotation_base import BaseTimedSizedRotatingFileHandler
 
@@ -46,12 +46,41 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
         * concurrent, cross-process safe rotation using OS-level locks
         * atomic renames
         * backup file management
+        * optional write buffering (buffer_size > 0)
+
+    Buffered mode:
+        When buffer_size > 0 the stream is opened with that buffer size and
+        records are only flushed when their level is >= flush_level, once
+        flush_interval seconds have passed since the last flush (checked on
+        each write, 0 disables it), on rollover, on close, or on an explicit
+        flush(). The size check then relies on the per-process byte counter
+        alone (re-reading the file size would force a flush on every record),
+        so with several processes sharing one file the max_bytes limit is
+        approximate.
+
+    Size tracking:
+        Without a buffer, the file size is read once per lock acquisition
+        (one lseek) and the bytes written under the lock are counted, so
+        size checks cost no syscall per record and still see what other
+        processes wrote before they released the lock.
+
+    Lock-free writes:
+        With lock_check_interval > 0 (unbuffered only), the cross-process
+        lock is taken at most once per lock_check_interval seconds, or when
+        the entry is due to trigger a rollover. Otherwise the entry is written
+        straight to the file. This relies on append-mode writes landing whole
+        at the end of the file. At each locked check the file size is re-read,
+        and the base file is reopened if another process has rotated it. Between
+        checks, other processes' writes are not counted, so max_bytes is
+        approximate by that much.
 
     Filename scheme:
         base.log
         base.log.1
         base.log.2
         ...
+    or, with timestamped_backups, one name per rollover:
+        base.log.20240210_213045_123456
     """
 
     def __init__(
@@ -68,15 +97,41 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
         large_entry_behavior: LargeLogEntryBehavior | None = None,
         append_filename_pid: bool = False,
         append_filename_timestamp: bool = False,
+        buffer_size: int = 0,
+        flush_level: int = logging.WARNING,
+        flush_interval: float = 0,
+        lock_check_interval: float = 0,
+        timestamped_backups: bool = False,
     ):
-        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
-
-        # BaseRotatingHandler -> FileHandler
-        BaseRotatingHandler.__init__(self, filename, mode="a", encoding=encoding)
+        if buffer_size < 0:
+            raise ValueError(f"buffer_size must be >= 0, got {buffer_size}")
+        if flush_interval < 0:
+            raise ValueError(f"flush_interval must be >= 0, got {flush_interval}")
+        if lock_check_interval < 0:
+            raise ValueError(f"lock_check_interval must be >= 0, got {lock_check_interval}")
+        if lock_check_interval > 0 and buffer_size > 0:
+            raise ValueError("lock_check_interval requires unbuffered writes (buffer_size=0)")
 
-        # Tell PyCharm the truth: stream can be None
-        self.stream: Optional[IO[str]] = self.stream
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
 
+        # must be known before the base class opens the stream
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self.lock_check_interval = lock_check_interval
+        # time.time() after which the next entry goes through the lock again
+        self.__next_lock_check = 0.0
+        self.__stream_size = 0
+        self.__last_flush = time.monotonic()
+        # while emit_batch() runs, unbuffered entries are collected here and
+        # reach the stream as one joined write
+        self.__in_batch = False
+        self.__pending: List[str] = []
+        # ASCII text has as many bytes as characters in these encodings
+        self.__ascii_compatible = codecs.lookup(encoding or "utf-8").name in ("utf-8", "ascii")
+
+        # BaseTimedSizedRotatingFileHandler -> FileHandler: opens the stream
+        # and creates this handler's own lock, exactly once
         super().__init__(
             filename,
             when = when,
@@ -89,16 +144,24 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
             large_entry_behavior = large_entry_behavior,
             append_filename_pid = append_filename_pid,
             append_filename_timestamp = append_filename_timestamp,
+            timestamped_backups = timestamped_backups,
         )
 
+        # Tell PyCharm the truth: stream can be None
+        self.stream: Optional[IO[str]] = self.stream
+
         self.large_entry_behavior = (
             large_entry_behavior or LargeLogEntryBehavior.ExceedMaxBytesIfFileIsEmpty
         )
 
         # lock file for cross-process safety
         self.__lock_file = None
+        self.__lock_pid = 0
         self.__lock_file_path = self.baseFilename + ".lock"
 
+        # monotonic time of the next expiration scan (ExpirationRule.check_interval)
+        self.__next_expiration_scan = 0.0
+
         # time-based rollover scheduling
         self.__rollover_at: Optional[float] = None
         if self.when is not None:
@@ -121,13 +184,83 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
         # Silence internal logging errors
         pass
 
+    def _open(self):
+        stream = self.__open_stream()
+        self.__stream_size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def __open_stream(self):
+        if self.buffer_size <= 0:
+            return super()._open()
+
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering = self.buffer_size,
+            encoding = self.encoding,
+            errors = self.errors,
+        )
+
+    def __encoded_size(self, text: str) -> int:
+        if self.__ascii_compatible and text.isascii():
+            return len(text)
+        return len(text.encode(self.encoding or "utf-8"))
+
+    def __sync_stream_size(self) -> None:
+        """
+        Unbuffered mode: re-read the file size once, right after taking the
+        cross-process lock. Until the lock is released only this process
+        writes, so __write keeps the count exact from here on.
+        """
+        if self.buffer_size > 0 or self.max_bytes <= 0:
+            return
+        if self.stream is None: # pragma: no cover
+            self.stream = self._open()
+        self.__stream_size = os.lseek(self.stream.fileno(), 0, os.SEEK_END)
+
+    def __reopen_if_rotated(self) -> bool:
+        """
+        Another process may have rotated the base file since we last held the
+        lock, leaving our stream on the renamed backup. If so, reopen the new
+        base file and return True.
+        """
+        if self.stream is None:    # pragma: no cover
+            return False
+        try:
+            current = os.stat(self.baseFilename)
+            ours = os.fstat(self.stream.fileno())
+            rotated = (current.st_ino, current.st_dev) != (ours.st_ino, ours.st_dev)
+        except FileNotFoundError:
+            rotated = True
+        if rotated:
+            self.__write_pending()
+            self.stream.close()
+            self.stream = self._open()
+        return rotated
+
+    def __write(self, text: str, flush: bool = True, size: Optional[int] = None) -> None:
+        if self.max_bytes > 0 or self.buffer_size > 0:
+            self.__stream_size += self.__encoded_size(text) if size is None else size
+
+        if self.buffer_size <= 0:
+            if self.__in_batch:
+                self.__pending.append(text)
+            else:
+                self.stream.write(text)
+                self.stream.flush()
+            return
+
+        self.stream.write(text)
+
+        if not flush and self.flush_interval > 0:
+            flush = time.monotonic() - self.__last_flush >= self.flush_interval
+        if flush:
+            self.stream.flush()
+            self.__last_flush = time.monotonic()
+
     def __rollover_interval_seconds(self) -> float:
-        if self.when == When.SECOND:
-            return self.interval
-        if self.when == When.MINUTE:
-            return self.interval * 60
-        if self.when == When.HOUR:
-            return self.interval * 3600 # pragma: no cover
+        if self._period_seconds is not None:
+            return self._period_seconds
         if self.when == When.EVERYDAY:
             return 24 * 3600
         # weekly
@@ -137,8 +270,15 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
     # LOCKING
     # ------------------------------------------------------------------
     def __open_lock_file(self) -> None:
+        if self.__lock_file is not None and self.__lock_pid != os.getpid():
+            # Inherited across fork(): flock() locks belong to the open file
+            # description, which parent and child would share, so both could
+            # "hold" the lock at once. The child needs its own.
+            self.__lock_file.close()
+            self.__lock_file = None
         if self.__lock_file is None:
             self.__lock_file = open(self.__lock_file_path, "a+b")
+            self.__lock_pid = os.getpid()
 
     def __acquire_lock(self) -> None:
         self.__open_lock_file()
@@ -187,14 +327,8 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
             return float("inf")
 
         # simple periodic rotation
-        if self.when in (When.SECOND, When.MINUTE, When.HOUR):
-            if self.when == When.SECOND:
-                delta = self.interval
-            elif self.when == When.MINUTE:
-                delta = self.interval * 60
-            else:  # HOUR   -   # pragma: no cover
-                delta = self.interval * 3600
-            return current + delta
+        if self._period_seconds is not None:
+            return current + self._period_seconds
 
         # daily / weekly rotation at a specific time-of-day
         ts = self.timestamp or RotationTimestamp(hour=0, minute=0, second=0)
@@ -212,17 +346,8 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
                 target = target + timedelta(days=1)
             return target.timestamp()
 
-        # weekday-based: Monday=0 ... Sunday=6
-        weekday_map = {
-            When.MONDAY: 0,
-            When.TUESDAY: 1,
-            When.WEDNESDAY: 2,
-            When.THURSDAY: 3,
-            When.FRIDAY: 4,
-            When.SATURDAY: 5,
-            When.SUNDAY: 6,
-        }
-        target_weekday = weekday_map[self.when]
+        # weekday-based
+        target_weekday = self._weekday_index
         days_ahead = (target_weekday - now_dt.weekday()) % 7
         if days_ahead == 0 and target <= now_dt:
             days_ahead = 7  # pragma: no cover
@@ -232,27 +357,24 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
     # ------------------------------------------------------------------
     # ROLLOVER DECISION
     # ------------------------------------------------------------------
-    def __shouldRollover(self, record: logging.LogRecord) -> bool:
+    def __shouldRollover(self, record: logging.LogRecord, size: int) -> bool:
         """
         Decide if rollover should occur (size and/or time).
+
+        `size` is the encoded size of the entry about to be written (measured
+        once by emit), and the record's creation time stands in for "now", so
+        the check costs no extra formatting, encoding or clock read.
         """
         if self.stream is None: # pragma: no cover
             self.stream = self._open()
 
-        # size-based
-        if self.max_bytes > 0:
-            msg = f"{self.format(record)}\n"
-            self.stream.seek(0, os.SEEK_END)
-            current_size = self.stream.tell()
-            projected = current_size + len(msg.encode(self.encoding or "utf-8"))
-            if projected >= self.max_bytes:
-                return True
-
         # time-based
-        if self.__rollover_at is not None:
-            now = time.time()
-            if now >= self.__rollover_at:
-                return True
+        if self.__rollover_at is not None and record.created >= self.__rollover_at:
+            return True
+
+        # size-based
+        if self.max_bytes > 0 and self.__stream_size + size >= self.max_bytes:
+            return True
 
         return False
 
@@ -276,15 +398,17 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
         # Determine if file is empty
         # noinspection PyBroadException
         try:
-            file_empty = (self.stream is None or self.stream.tell() == 0)
+            if self.stream is None:
+                file_empty = True   # pragma: no cover
+            else:
+                file_empty = self.__stream_size == 0
         except Exception:   # pragma: no cover
             file_empty = False  # pragma: no cover
 
         if behavior is LargeLogEntryBehavior.ExceedMaxBytesIfFileIsEmpty:
             if file_empty:
                 # write first, then rotate
-                self.stream.write(formatted)
-                self.stream.flush()
+                self.__write(formatted)
                 self.__doRollover()
                 self.__apply_expiration_policy()
                 return True
@@ -292,15 +416,13 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
                 # rotate first, then write
                 self.__doRollover()
                 self.__apply_expiration_policy()
-                self.stream.write(formatted)
-                self.stream.flush()
+                self.__write(formatted)
                 return True
 
         if behavior is LargeLogEntryBehavior.RotateFirst:
             self.__doRollover()
             self.__apply_expiration_policy()
-            self.stream.write(formatted)
-            self.stream.flush()
+            self.__write(formatted)
             return True
 
         if behavior is LargeLogEntryBehavior.DumpSilently:
@@ -316,31 +438,115 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
     def emit(self, record: logging.LogRecord) -> None:
         """
         Emit a record with concurrency-safe rollover.
+
+        Handler filters run first: a rejected record never takes the
+        cross-process lock.
         """
+        if not self.filter(record):
+            return
+
+        formatted = None
+        if self.lock_check_interval > 0:
+            formatted = self.__emit_unlocked(record)
+            if formatted is None:
+                return
+
         try:
             self.__acquire_lock()
+            self.__checked_under_lock()
+            self.__emit_locked(record, formatted)
+        finally:
+            self.__release_lock()
 
-            if not self.filter(record):
-                return  # pragma: no cover
+    def __emit_unlocked(self, record: logging.LogRecord) -> Optional[str]:
+        """
+        Lock-free mode: write the entry without the cross-process lock when
+        no check is due. Returns None once written, or the formatted entry
+        when it has to go through the lock.
+        """
+        formatted = self.format(record) + self.terminator
+        if self.stream is None:  # pragma: no cover
+            return formatted
+
+        created = record.created
+        if created >= self.__next_lock_check:
+            return formatted
+        if self.__rollover_at is not None and created >= self.__rollover_at:
+            return formatted
+
+        size = self.__encoded_size(formatted) if self.max_bytes > 0 else 0
+        if self.max_bytes > 0 and self.__stream_size + size >= self.max_bytes:
+            return formatted
+
+        self.__write(formatted, size=size)
+        return None
+
+    def __checked_under_lock(self) -> None:
+        if self.lock_check_interval > 0:
+            if self.__reopen_if_rotated():
+                # another writer rolled over: its rollover is ours too
+                self.__schedule_next_rollover()
+            self.__next_lock_check = time.time() + self.lock_check_interval
+        self.__sync_stream_size()
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        Emit several records under a single acquisition of the cross-process
+        lock. Rollover is still evaluated for every record, and a record that
+        fails is reported through handleError() without dropping the rest.
+
+        Without a write buffer, the entries are joined and written with a
+        single stream write and flush before the lock is released (or before
+        a rollover closes the file), so the whole batch usually reaches the
+        file in one write call instead of one per record.
+        """
+        records = [record for record in records if self.filter(record)]
+        if not records:
+            return
 
+        try:
+            self.__acquire_lock()
+            self.__checked_under_lock()
+            self.__in_batch = True
+            for record in records:
+                # noinspection PyBroadException
+                try:
+                    self.__emit_locked(record)
+                except Exception:
+                    self.handleError(record)
+        finally:
+            self.__in_batch = False
+            try:
+                self.__write_pending()
+            finally:
+                self.__release_lock()
+
+    def __write_pending(self) -> None:
+        if not self.__pending:
+            return
+        text = "".join(self.__pending)
+        self.__pending.clear()
+        self.stream.write(text)
+        self.stream.flush()
+
+    def __emit_locked(self, record: logging.LogRecord, formatted: Optional[str] = None) -> None:
+        if formatted is None:
             formatted = self.format(record) + self.terminator
 
-            # Handle oversized entries according to LargeLogEntryBehavior
-            if self.__handle_large_entry(formatted):
-                return  # pragma: no cover
+        # Handle oversized entries according to LargeLogEntryBehavior
+        if self.__handle_large_entry(formatted):
+            return  # pragma: no cover
 
-            # Normal rollover path
-            if self.__shouldRollover(record):
-                self.__doRollover()
-                self.__apply_expiration_policy()
+        # measured once, for both the size check and the buffered byte counter
+        size = self.__encoded_size(formatted) if self.max_bytes > 0 or self.buffer_size > 0 else 0
 
-            # Write normally
-            msg = formatted
-            self.stream.write(msg)
-            self.stream.flush()
+        # Normal rollover path
+        if self.__shouldRollover(record, size):
+            self.__doRollover()
+            self.__apply_expiration_policy()
 
-        finally:
-            self.__release_lock()
+        # Write normally
+        self.__write(formatted, record.levelno >= self.flush_level, size)
 
     # ------------------------------------------------------------------
     # ROLLOVER IMPLEMENTATION
@@ -360,18 +566,30 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
             - rotate backups
             - reopen base file
             - compute next rollover time
+
+        Several processes can decide to roll over the same file; the lock
+        makes them do it one after another. Whoever finds the base file
+        already replaced by an earlier rollover only reopens it, so the file
+        is rotated once rather than once per process.
         """
+        if self.__reopen_if_rotated():
+            self.__schedule_next_rollover()
+            return
+
         if self.stream:
+            self.__write_pending()
             self.stream.close()
             self.stream = None  # type: ignore[assignment]
 
         # rotate backups
-        if self.backup_count > 0:
+        if self.timestamped_backups:
+            self._rotate_to_timestamped_backup()
+        elif self.backup_count > 0:
+            suffix = self.__rotation_suffix()    # once per rollover, not per backup
             for i in range(self.backup_count - 1, 0, -1):
 
                 # sfn = f"{self.baseFilename}.{i}"
                 # dfn = f"{self.baseFilename}.{i + 1}"
-                suffix = self.__rotation_suffix()
                 if suffix:
                     sfn = f"{self.baseFilename}.{suffix}.{i}"
                     dfn = f"{self.baseFilename}.{suffix}.{i + 1}"
@@ -390,7 +608,6 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
                         pass
 
             # dfn = f"{self.baseFilename}.1"
-            suffix = self.__rotation_suffix()
             if suffix:
                 dfn = f"{self.baseFilename}.{suffix}.1"
             else:
@@ -410,8 +627,9 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
 
         # reopen base file
         self.stream = self._open()
+        self.__schedule_next_rollover()
 
-        # compute next rollover time
+    def __schedule_next_rollover(self) -> None:
         if self.when is not None:
             now = time.time()
             self.__rollover_at = self.__compute_next_rollover(now)
@@ -423,38 +641,44 @@ class ConcurrentTimedSizedRotatingFileHandler (BaseTimedSizedRotatingFileHandler
         if rule is None:
             return  # pragma: no cover
 
-        now = datetime.now()
+        if rule.check_interval > 0:
+            # retention scans are throttled: skip until the interval has elapsed
+            mono = time.monotonic()
+            if mono < self.__next_expiration_scan:
+                return
+            self.__next_expiration_scan = mono + rule.check_interval
 
         # Compute cutoff time
-        if rule.scale == ExpirationScale.Seconds:
-            cutoff = now - timedelta(seconds=rule.interval)
-        elif rule.scale == ExpirationScale.Minutes:
-            cutoff = now - timedelta(minutes=rule.interval)
-        elif rule.scale == ExpirationScale.Hours:
-            cutoff = now - timedelta(hours=rule.interval)
-        elif rule.scale == ExpirationScale.Days:
-            cutoff = now - timedelta(days=rule.interval)
+        if self._expiration_seconds is not None:
+            cutoff_ts = time.time() - self._expiration_seconds
         elif rule.scale == ExpirationScale.MonthDay:
             # Delete files from previous calendar days
-            cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            cutoff_ts = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
         else:
             return  # pragma: no cover
 
         # Delete rotated files older than cutoff
-        for path in self.__list_rotated_files():
-            if datetime.fromtimestamp(os.path.getmtime(path)) < cutoff:
+        for path, mtime in self.__scan_rotated_files():
+            if mtime < cutoff_ts:
                 try:
                     os.remove(path)
                 except OSError:
                     pass    # pragma: no cover
 
-    def __list_rotated_files(self) -> List[str]:
+    def __scan_rotated_files(self) -> Iterator[tuple[str, float]]:
+        """
+        (path, mtime) of every backup of this file: one directory scan, with
+        the stat each entry needs, skipping the live base file and lock file.
+        """
         base = self.baseFilename
-        dir_name = os.path.dirname(base)
         prefix = os.path.basename(base)
 
-        return [
-            os.path.join(dir_name, f)
-            for f in os.listdir(dir_name)
-            if f.startswith(prefix) and not f.endswith(".lock")
-        ]
+        with os.scandir(os.path.dirname(base)) as entries:
+            for entry in entries:
+                name = entry.name
+                if name == prefix or not name.startswith(prefix) or name.endswith(".lock"):
+                    continue
+                try:
+                    yield entry.path, entry.stat().st_mtime
+                except FileNotFoundError:   # pragma: no cover
+                    continue    # removed by another process mid-scan
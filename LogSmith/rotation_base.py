@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import os
+import re
 from abc import ABC
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum, auto
 from logging import FileHandler
 from logging.handlers import BaseRotatingHandler
@@ -28,6 +31,21 @@ class When(Enum):
     EVERYDAY = "everyday"
 
 
+# Seconds per unit for the purely periodic modes; the others are anchored to a time of day.
+_PERIODIC_UNIT_SECONDS = {When.SECOND: 1, When.MINUTE: 60, When.HOUR: 3600}
+
+# Weekly modes: Monday=0 ... Sunday=6, as datetime.weekday() counts them
+_WEEKDAY_INDEX = {
+    When.MONDAY: 0,
+    When.TUESDAY: 1,
+    When.WEDNESDAY: 2,
+    When.THURSDAY: 3,
+    When.FRIDAY: 4,
+    When.SATURDAY: 5,
+    When.SUNDAY: 6,
+}
+
+
 @dataclass
 class RotationTimestamp:
     """
@@ -49,6 +67,15 @@ class ExpirationScale(Enum):
     MonthDay = "MD"
 
 
+# Seconds per unit for the age-based scales (MonthDay is calendar-based instead)
+_EXPIRATION_UNIT_SECONDS = {
+    ExpirationScale.Seconds: 1,
+    ExpirationScale.Minutes: 60,
+    ExpirationScale.Hours: 3600,
+    ExpirationScale.Days: 86400,
+}
+
+
 class LargeLogEntryBehavior(Enum):
     ExceedMaxBytesIfFileIsEmpty = auto()   # default
     RotateFirst                 = auto()   # might lead to an empty log file
@@ -60,6 +87,7 @@ class LargeLogEntryBehavior(Enum):
 class ExpirationRule:
     scale: ExpirationScale
     interval: int  # ignored if scale == ExpirationScale.MonthDay
+    check_interval: float = 0  # min seconds between expiration scans; 0 = scan after every rollover
 
 
 class RotationLogic:
@@ -120,6 +148,13 @@ class RotationLogic:
     append_filename_timestamp : bool
         If True, inserts a timestamp into the base filename before rotation
         logic is applied.
+
+    timestamped_backups : bool
+        If True, each rollover renames the active file once, to
+        ``<base>[.<pid>].<YYYYmmdd_HHMMSS_ffffff>``, instead of shifting the
+        numbered backups (.1 → .2 → ...). `backupCount` then keeps the newest
+        backups and deletes older ones. Rollover costs one rename, whatever
+        the backupCount.
     """
 
     def __init__(
@@ -135,6 +170,7 @@ class RotationLogic:
             # =====================================
             append_filename_pid:                     bool                         = False,
             append_filename_timestamp:               bool                         = False,
+            timestamped_backups:                     bool                         = False,
     ):
         if interval is not None and interval < 0:
             raise ValueError("Negative interval is illegal")
@@ -158,6 +194,7 @@ class RotationLogic:
 
         self.append_filename_pid       = append_filename_pid
         self.append_filename_timestamp = append_filename_timestamp
+        self.timestamped_backups       = timestamped_backups
 
 
 class BaseTimedSizedRotatingFileHandler(ABC, BaseRotatingHandler):
@@ -181,6 +218,7 @@ class BaseTimedSizedRotatingFileHandler(ABC, BaseRotatingHandler):
         large_entry_behavior: Optional[LargeLogEntryBehavior] = None,
         append_filename_pid: bool = False,
         append_filename_timestamp: bool = False,
+        timestamped_backups: bool = False,
     ) -> None:
 
         FileHandler.__init__(self, filename, mode="a", encoding=encoding)
@@ -195,3 +233,58 @@ class BaseTimedSizedRotatingFileHandler(ABC, BaseRotatingHandler):
         self.large_entry_behavior = large_entry_behavior
         self.append_filename_pid = append_filename_pid
         self.append_filename_timestamp = append_filename_timestamp
+        self.timestamped_backups = timestamped_backups
+
+        # Rollover period for SECOND / MINUTE / HOUR, resolved once (None for anchored modes)
+        unit_seconds = _PERIODIC_UNIT_SECONDS.get(when)
+        self._period_seconds: Optional[int] = None if unit_seconds is None else unit_seconds * interval
+        self._weekday_index: Optional[int] = _WEEKDAY_INDEX.get(when)
+
+        # Maximum backup age in seconds for the age-based expiration scales (None for MonthDay)
+        self._expiration_seconds: Optional[float] = None
+        if expiration_rule is not None and expiration_rule.scale in _EXPIRATION_UNIT_SECONDS:
+            self._expiration_seconds = _EXPIRATION_UNIT_SECONDS[expiration_rule.scale] * expiration_rule.interval
+
+    # ------------------------------------------------------------------
+    # TIMESTAMPED BACKUPS (shared by the sync and async handlers)
+    # ------------------------------------------------------------------
+    def _rotate_to_timestamped_backup(self) -> None:
+        """
+        Rollover for timestamped_backups: a single rename of the (closed) base
+        file to a name of its own, then count-based pruning. Nothing is
+        renumbered, so the cost does not grow with backup_count.
+        """
+        if self.backup_count <= 0:
+            return
+
+        parts = [self.baseFilename]
+        if self.append_filename_pid:
+            parts.append(str(os.getpid()))
+        parts.append(datetime.now().strftime("%Y%m%d_%H%M%S_%f"))
+
+        if os.path.exists(self.baseFilename):
+            try:
+                os.replace(self.baseFilename, ".".join(parts))
+            except PermissionError:     # pragma: no cover
+                # another process still has the file open (Windows): keep appending to it
+                return
+
+        self.__prune_timestamped_backups()
+
+    def __prune_timestamped_backups(self) -> None:
+        pattern = re.compile(re.escape(os.path.basename(self.baseFilename)) + r"\.(?:\d+\.)?(\d{8}_\d{6}_\d{6})$")
+
+        backups = []
+        with os.scandir(os.path.dirname(self.baseFilename)) as entries:
+            for entry in entries:
+                match = pattern.match(entry.name)
+                if match:
+                    backups.append((match.group(1), entry.path))
+
+        # newest first: the timestamps sort chronologically as text
+        backups.sort(reverse=True)
+        for _, path in backups[self.backup_count:]:
+            try:
+                os.remove(path)
+            except OSError:     # pragma: no cover
+                pass
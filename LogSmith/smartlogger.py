@@ -1,7 +1,9 @@
 # LogSmith/smartlogger.py
 
 from __future__ import annotations
+import asyncio
 import inspect
+import json
 import logging
 import os
 import sys
@@ -11,7 +13,7 @@ import traceback
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, List, Dict, ClassVar
+from typing import Any, Callable, Iterable, Optional, List, Dict, ClassVar
 
 from .file_registry import FileHandlerRegistry
 from .formatter import (
@@ -20,20 +22,19 @@ from .formatter import (
     LogRecordDetails, PassthroughFormatter, AuditFormatter, OutputMode, StructuredJSONFormatter,
     StructuredNDJSONFormatter, OptionalRecordFields,
 )
-from .helpers import contains_all
+from .helpers import contains_all, LazyMessage
 from .levels import LevelStyle, TRACE
 from .level_registry import LEVELS
 from .colors import CPrint
 from .rotation_base import RotationLogic
 from .rotation import ConcurrentTimedSizedRotatingFileHandler
+from .queued_handler import QueuedFileHandler, OVERFLOW_POLICIES
 
 """
 console printing utility
 "stdout()" function replaces print()
 it has the same effect, only it synchronizes with console logs
 """
-import io
-import contextlib
 
 
 # ===========================================================================
@@ -49,6 +50,7 @@ class _SmartLoggerState:
 
     def __init__(self) -> None:
         self.handlers: list[HandlerMetadata] = []
+        self.handler_info_json: Optional[str] = None
         self.retired: bool = False
 
 
@@ -89,6 +91,31 @@ class HandlerMetadata:
     preserve_colors_in_log_files: Optional[bool] = None
 
 
+_LOGSMITH_FORMATTERS = (
+    StructuredPlainFormatter, StructuredColorFormatter, StructuredJSONFormatter,
+    PassthroughFormatter, AuditFormatter,
+)
+
+
+def _handler_needs_caller(handler: logging.Handler | None) -> bool:
+    if handler is None:
+        return False
+    # filters and foreign formatters may read pathname / lineno / funcName themselves
+    if handler.filters or not isinstance(handler.formatter, _LOGSMITH_FORMATTERS):
+        return True
+    details = getattr(handler, "log_record_details", None)
+    if details is None:
+        return True
+    rf = details.optional_record_fields
+    return rf is not None and (rf.file_path or rf.file_name or rf.lineno or rf.func_name)
+
+
+def _not_audited_yet(record: logging.LogRecord) -> bool:
+    # SmartLogger records reach the audit handler directly and, with auditing
+    # enabled, again through propagation to the root logger: audit them once
+    return not getattr(record, "_logsmith_audited", False)
+
+
 # ======================================================================
 #  SMARTLOGGER IMPLEMENTATION
 # ======================================================================
@@ -147,6 +174,10 @@ class SmartLogger:
             • backupCount               (how many files in the rotation)
             • append_filename_timestamp ( . . . to rotating file names)
 
+    add_async_file(log_dir, logfile_name, ..., queue_size=8192, overflow="drop_oldest")
+        Same as add_file, but formatting and writing run on a background
+        thread; the logging call only enqueues the record.
+
     ---------------------------------------------------------------------------
     Formatting
     ---------------------------------------------------------------------------
@@ -286,22 +317,39 @@ class SmartLogger:
         self.__py_logger.propagate = SmartLogger.__audit_enabled
 
     def trace(self, msg, *args, **kwargs):
-        self.__log(TRACE, msg, args, **kwargs)
+        if self.__py_logger.isEnabledFor(TRACE) or self.__smart_state.retired:
+            self.__log(TRACE, msg, args, **kwargs)
 
     def debug(self, msg, *args, **kwargs):
-        self.__log(logging.DEBUG, msg, args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.DEBUG) or self.__smart_state.retired:
+            self.__log(logging.DEBUG, msg, args, **kwargs)
 
     def info(self, msg, *args, **kwargs):
-        self.__log(logging.INFO, msg, args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.INFO) or self.__smart_state.retired:
+            self.__log(logging.INFO, msg, args, **kwargs)
 
     def warning(self, msg, *args, **kwargs):
-        self.__log(logging.WARNING, msg, args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.WARNING) or self.__smart_state.retired:
+            self.__log(logging.WARNING, msg, args, **kwargs)
 
     def error(self, msg, *args, **kwargs):
-        self.__log(logging.ERROR, msg, args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.ERROR) or self.__smart_state.retired:
+            self.__log(logging.ERROR, msg, args, **kwargs)
 
     def critical(self, msg, *args, **kwargs):
-        self.__log(logging.CRITICAL, msg, args, **kwargs)
+        if self.__py_logger.isEnabledFor(logging.CRITICAL) or self.__smart_state.retired:
+            self.__log(logging.CRITICAL, msg, args, **kwargs)
+
+    @staticmethod
+    def lazy(func: Callable[..., Any], *args: Any, **kwargs: Any) -> LazyMessage:
+        """
+        Defer an expensive message (or argument) until a handler renders it:
+
+            logger.debug("state: %s", SmartLogger.lazy(pprint.pformat, big_dict))
+
+        func(*args, **kwargs) is never called when the level is disabled.
+        """
+        return LazyMessage(func, *args, **kwargs)
 
     @property
     def name(self) -> str:
@@ -315,6 +363,14 @@ class SmartLogger:
     def level(self, value) -> None:
         self.__py_logger.setLevel(value)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        True if a record at this level would be processed (hierarchy-aware,
+        served from the logging module's per-logger level cache).
+        Use it to guard work that is only needed for the log call itself.
+        """
+        return self.__py_logger.isEnabledFor(level)
+
     @staticmethod
     def __bleach_non_colored_text(message: str) -> str:
         """
@@ -389,6 +445,12 @@ class SmartLogger:
             if level < handler.level:
                 continue
 
+            # Queued file handler: keep raw text in order with queued records
+            if isinstance(handler, QueuedFileHandler):
+                do_not_sanitize = getattr(handler, "preserve_colors_in_log_files", False)
+                handler.write_raw((message if do_not_sanitize else CPrint.strip_ansi(message)) + end)
+                continue
+
             stream = getattr(handler, "stream", None)
 
             # FIX: FileHandler lazily opens the file; force-open if needed
@@ -431,15 +493,8 @@ class SmartLogger:
                     if stream is None:  # pragma: no cover
                         continue
 
-                    # Format text exactly like print()
-                    buffer = io.StringIO()
-                    with contextlib.redirect_stdout(buffer):
-                        print(*args, sep=sep, end=end)
-                    text = buffer.getvalue()
-
-                    # Write directly to the console handler's stream
-                    stream.write(text)
-                    # stream.flush()
+                    # Write directly to the console handler's stream, exactly like print()
+                    print(*args, sep=sep, end=end, file=stream)
                     return
 
         # No console handler → fallback to normal print
@@ -470,6 +525,44 @@ class SmartLogger:
 
         return frame    # pragma: no cover
 
+    def __caller_needed(self) -> bool:
+        """
+        True if anything this record can reach may use the caller: a handler
+        rendering file_path / file_name / lineno / func_name, or any logger
+        filter, handler filter or non-LogSmith formatter. Handlers that
+        LogSmith did not attach (no log_record_details) are assumed to need it.
+        """
+        if self.__py_logger.filters:
+            return True
+
+        if SmartLogger.__audit_enabled and _handler_needs_caller(SmartLogger.__audit_handler):
+            return True
+
+        logger = self.__py_logger
+        while logger:
+            for handler in logger.handlers:
+                if _handler_needs_caller(handler):
+                    return True
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        return False
+
+    def __sanitize_messages(self) -> bool:
+        # Sanitize ANSI for file logging unless explicitly disabled
+        for handler in self.__py_logger.handlers:
+            if hasattr(handler, "baseFilename"):  # file handler
+                return not getattr(handler, "preserve_colors_in_log_files", False)
+        return True
+
+    def __resolve_caller(self) -> tuple[str, int, str]:
+        # the frame walk is skipped when no handler renders the caller
+        if not self.__caller_needed():
+            return "(unknown file)", 0, "(unknown function)"
+
+        frame = self.__find_caller()
+        return frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+
     def __log(self, level, msg, args, exc_info=None, stack_info=False, **kwargs):
         if self.__smart_state.retired:
             raise RuntimeError(f"Logger {self.__name!r} has been retired and cannot be used.")   # pragma: no cover
@@ -487,22 +580,11 @@ class SmartLogger:
         if exc_info is True:
             exc_info = sys.exc_info()
 
-        # Sanitize ANSI for file logging unless explicitly disabled
-        sanitize = True
-        for handler in self.__py_logger.handlers:
-            if hasattr(handler, "baseFilename"):  # file handler
-                if getattr(handler, "preserve_colors_in_log_files", False):
-                    sanitize = False
-                break   # pragma: no cover
-
-        if sanitize:
+        # (non-str messages, e.g. SmartLogger.lazy(...), are rendered later - like args)
+        if isinstance(msg, str) and self.__sanitize_messages():
             msg = CPrint.strip_ansi(msg)
 
-        # Resolve caller
-        frame = self.__find_caller()
-        pathname = frame.f_code.co_filename
-        lineno = frame.f_lineno
-        func_name = frame.f_code.co_name
+        pathname, lineno, func_name = self.__resolve_caller()
 
         # sinfo = "".join(traceback.format_stack()[0:-2]) if stack_info else None
         if stack_info:
@@ -533,10 +615,85 @@ class SmartLogger:
         # AUDIT
         if SmartLogger.__audit_enabled and SmartLogger.__audit_handler:
             SmartLogger.__audit_handler.handle(record)
+            record._logsmith_audited = True
 
         # Let Python logging handle hierarchy + filtering + propagation
         self.__py_logger.handle(record)
 
+    def log_many(self, level: int, messages: Iterable[Any], **kwargs) -> None:
+        """
+        Log each message of ``messages`` at ``level``, in order.
+
+        Equivalent to calling the level method once per message, but the
+        level check, ANSI-sanitizing decision and caller lookup happen once,
+        and every handler is locked once for the whole batch (rotating file
+        handlers also take their cross-process lock once). Keyword arguments
+        become fields of every record. ``messages`` is only consumed when
+        the level is enabled, so a generator of f-strings costs nothing
+        for a disabled level.
+        """
+        if self.__smart_state.retired:
+            raise RuntimeError(f"Logger {self.__name!r} has been retired and cannot be used.")
+
+        logger = self.__py_logger
+        if not logger.isEnabledFor(level):
+            return
+
+        sanitize = self.__sanitize_messages()
+        pathname, lineno, func_name = self.__resolve_caller()
+
+        records = []
+        for msg in messages:
+            if sanitize and isinstance(msg, str):
+                msg = CPrint.strip_ansi(msg)
+            record = logging.LogRecord(self.__name, level, pathname, lineno, msg, (), None, func_name)
+            record.__dict__.update(kwargs)
+            records.append(record)
+
+        # AUDIT
+        if SmartLogger.__audit_enabled and SmartLogger.__audit_handler:
+            SmartLogger.__emit_batch(SmartLogger.__audit_handler, records)
+            for record in records:
+                record._logsmith_audited = True
+
+        # Logger filters, then the same handler walk as Logger.callHandlers
+        if logger.disabled:
+            return  # pragma: no cover
+        records = [record for record in records if logger.filter(record)]
+        if not records:
+            return
+
+        found = False
+        current = logger
+        while current:
+            for handler in current.handlers:
+                found = True
+                SmartLogger.__emit_batch(handler, records)
+            if not current.propagate:
+                break
+            current = current.parent
+
+        if not found and logging.lastResort:    # pragma: no cover
+            SmartLogger.__emit_batch(logging.lastResort, records)
+
+    @staticmethod
+    def __emit_batch(handler: logging.Handler, records: list[logging.LogRecord]) -> None:
+        batch = [record for record in records if record.levelno >= handler.level]
+        if not batch:
+            return
+
+        emit_batch = getattr(handler, "emit_batch", None)
+        handler.acquire()
+        try:
+            if emit_batch is not None:
+                emit_batch(batch)
+            else:
+                for record in batch:
+                    if handler.filter(record):
+                        handler.emit(record)
+        finally:
+            handler.release()
+
     @staticmethod
     def __normalize_output_mode(mode: str | OutputMode) -> OutputMode:
         if isinstance(mode, OutputMode):
@@ -581,8 +738,10 @@ class SmartLogger:
             formatter = StructuredPlainFormatter(log_record_details)
 
         handler.setFormatter(formatter)
+        handler.log_record_details = log_record_details
         self.__py_logger.addHandler(handler)
 
+        self.__smart_state.handler_info_json = None
         self.__smart_state.handlers.append(
             HandlerMetadata(
                 kind="console",
@@ -603,6 +762,7 @@ class SmartLogger:
                 h.close()
 
                 # Remove metadata
+                self.__smart_state.handler_info_json = None
                 self.__smart_state.handlers = [
                     info for info in self.__smart_state.handlers
                     if info.kind != "console"
@@ -614,7 +774,10 @@ class SmartLogger:
                 raise RuntimeError(f"Logger {self.__py_logger.name!r} has no console handler to remove.")    # pragma: no cover
 
     @staticmethod
-    def __create_sync_handler(rotation_logic: RotationLogic, file_path: str):
+    def __create_sync_handler(
+            rotation_logic: RotationLogic, file_path: str, buffer_size: int = 0, flush_interval: float = 0,
+            lock_check_interval: float = 0,
+    ):
         return ConcurrentTimedSizedRotatingFileHandler(
             filename = file_path,
             when = rotation_logic.when,
@@ -627,6 +790,10 @@ class SmartLogger:
             large_entry_behavior = rotation_logic.large_entry_behavior,
             append_filename_pid = rotation_logic.append_filename_pid,
             append_filename_timestamp = rotation_logic.append_filename_timestamp,
+            timestamped_backups = rotation_logic.timestamped_backups,
+            buffer_size = buffer_size,
+            flush_interval = flush_interval,
+            lock_check_interval = lock_check_interval,
         )
 
     def add_file(
@@ -638,6 +805,80 @@ class SmartLogger:
             rotation_logic: RotationLogic | None = None,
             preserve_colors_in_log_files: bool = False,
             output_mode: str | OutputMode = OutputMode.PLAIN,
+            buffer_size: int = 0,
+            flush_interval: float = 0,
+            lock_check_interval: float = 0,
+    ) -> None:
+        """
+        Attach a rotating file handler.
+
+        buffer_size > 0 enables buffered writes: entries below WARNING stay in
+        a buffer of that many bytes and reach the file when it fills, on a
+        WARNING+ entry, on rotation, on flush() or at interpreter exit.
+        flush_interval > 0 also flushes the buffer on the first entry written
+        that many seconds after the previous flush.
+
+        lock_check_interval > 0 (unbuffered only) takes the cross-process file
+        lock at most once per that many seconds, or when a rollover is due,
+        and appends all other entries without it. With several processes
+        sharing the file, max_bytes then becomes approximate.
+        """
+        self.__add_file_handler(
+            log_dir, logfile_name, level, log_record_details, rotation_logic,
+            preserve_colors_in_log_files, output_mode, buffer_size,
+            flush_interval=flush_interval, lock_check_interval=lock_check_interval,
+        )
+
+    def add_async_file(
+            self,
+            log_dir: str,
+            logfile_name: str | None = None,
+            level: int | None = None,
+            log_record_details: LogRecordDetails | None = None,
+            rotation_logic: RotationLogic | None = None,
+            preserve_colors_in_log_files: bool = False,
+            output_mode: str | OutputMode = OutputMode.PLAIN,
+            queue_size: int = 8192,
+            overflow: str = "drop_oldest",
+            buffer_size: int = 0,
+            flush_interval: float = 0,
+            lock_check_interval: float = 0,
+    ) -> None:
+        """
+        Attach a rotating file handler that formats and writes on a background
+        thread. Logging calls only enqueue the record.
+
+        queue_size bounds the queue (<= 0 means unbounded). When it is full,
+        overflow="drop_oldest" discards the oldest queued record and
+        overflow="block" waits for room. flush() waits until the queue drains.
+
+        buffer_size, flush_interval and lock_check_interval work as in
+        add_file(), on the background thread: with buffer_size > 0 the drained
+        records are written through a buffer instead of being flushed batch by
+        batch.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+
+        self.__add_file_handler(
+            log_dir, logfile_name, level, log_record_details, rotation_logic,
+            preserve_colors_in_log_files, output_mode, buffer_size, (queue_size, overflow),
+            flush_interval=flush_interval, lock_check_interval=lock_check_interval,
+        )
+
+    def __add_file_handler(
+            self,
+            log_dir: str,
+            logfile_name: str | None,
+            level: int | None,
+            log_record_details: LogRecordDetails | None,
+            rotation_logic: RotationLogic | None,
+            preserve_colors_in_log_files: bool,
+            output_mode: str | OutputMode,
+            buffer_size: int,
+            queue_options: tuple[int, str] | None = None,
+            flush_interval: float = 0,
+            lock_check_interval: float = 0,
     ) -> None:
         if self.__smart_state.retired:
             raise RuntimeError(f"Logger {self.__py_logger.name!r} has been retired and cannot accept handlers.") # pragma: no cover
@@ -655,7 +896,6 @@ class SmartLogger:
         os.makedirs(normalized, exist_ok=True)
 
         log_dir_path = Path(log_dir).resolve()
-        os.makedirs(log_dir_path, exist_ok=True)
 
         if logfile_name is None:
             logfile_name = f"{self.__py_logger.name}.log"   # pragma: no cover
@@ -683,11 +923,18 @@ class SmartLogger:
 
         FileHandlerRegistry.register(str(file_path))
 
-        handler = self.__create_sync_handler(rotation_logic, str(file_path))
+        handler = self.__create_sync_handler(
+            rotation_logic, str(file_path), buffer_size, flush_interval, lock_check_interval,
+        )
 
         handler.setLevel(level or self.__py_logger.level)
         handler.setFormatter(formatter)
 
+        if queue_options is not None:
+            queue_size, overflow = queue_options
+            handler = QueuedFileHandler(handler, queue_size=queue_size, overflow=overflow)
+            handler.setLevel(level or self.__py_logger.level)
+
         handler.log_record_details = log_record_details
         handler.rotation_logic = rotation_logic
         handler.preserve_colors_in_log_files = preserve_colors_in_log_files
@@ -704,8 +951,8 @@ class SmartLogger:
                     if info.kind != "file" or not info.path:
                         continue    # pragma: no cover
 
-                    existing_resolved = str(Path(info.path).resolve())
-                    if existing_resolved == resolved_path:
+                    # info.path was stored resolved: compare it as-is, no realpath per handler
+                    if info.path == resolved_path:
                         FileHandlerRegistry.unregister(str(file_path))
                         raise ValueError(
                             f"A file handler for '{resolved_path}' is already active "
@@ -727,6 +974,7 @@ class SmartLogger:
                 if rotation_logic else None
             )
 
+            self.__smart_state.handler_info_json = None
             self.__smart_state.handlers.append(
                 HandlerMetadata(
                     kind="file",
@@ -753,7 +1001,7 @@ class SmartLogger:
 
         removed = False
         for h in list(self.__py_logger.handlers):
-            if isinstance(h, logging.FileHandler) and Path(h.baseFilename).resolve() == Path(target_path):
+            if isinstance(h, (logging.FileHandler, QueuedFileHandler)) and Path(h.baseFilename).resolve() == Path(target_path):
                 self.__py_logger.removeHandler(h)
                 h.close()
                 removed = True
@@ -766,11 +1014,23 @@ class SmartLogger:
                 f"log_dir={log_dir!r}, logfile_name={logfile_name!r}."
             )
 
+        self.__smart_state.handler_info_json = None
         self.__smart_state.handlers = [
             info for info in self.__smart_state.handlers
             if not (info.kind == "file" and info.path == target_path)
         ]
 
+    def flush(self) -> None:
+        """
+        Flush every handler attached to this logger (e.g. pending entries of
+        a buffered file handler), and the audit handler when auditing is on.
+        """
+        for h in list(self.__py_logger.handlers):
+            h.flush()
+
+        if SmartLogger.__audit_enabled and SmartLogger.__audit_handler:
+            SmartLogger.__audit_handler.flush()
+
     # ------------------------------------------------------------------
     #  HANDLER INTROSPECTION (READ-ONLY)
     # ------------------------------------------------------------------
@@ -778,6 +1038,17 @@ class SmartLogger:
     def handler_info(self) -> list[dict[str, Any]]:
         return [asdict(h) for h in self.__smart_state.handlers]
 
+    @property
+    def handler_info_json(self) -> str:
+        """
+        handler_info as indented JSON, serialized once until the handlers change.
+        """
+        if self.__smart_state.handler_info_json is None:
+            self.__smart_state.handler_info_json = json.dumps(
+                self.handler_info, indent=4, ensure_ascii=False, default=str
+            )
+        return self.__smart_state.handler_info_json
+
     @property
     def console_handler(self):
         for h in self.__smart_state.handlers:
@@ -844,10 +1115,8 @@ class SmartLogger:
     # ------------------------------------------------------------------
     @staticmethod
     def levels() -> dict[str, int]:
-        levels = {"NOTSET": logging.NOTSET}
-        for name, meta in LEVELS.all().items():
-            levels[name] = meta["value"]
-        return levels
+        # a fresh dict per call (callers may mutate or serialize it), copied from the registry's cached map
+        return dict(LEVELS.value_map())
 
     @staticmethod
     def __safeguard_internals(name: str, value: int):
@@ -910,6 +1179,23 @@ class SmartLogger:
 
             meta["style"] = style
 
+    # ------------------------------------------------------------------
+    #  LOOKUP
+    # ------------------------------------------------------------------
+    @classmethod
+    def get(cls, name: str) -> Optional[SmartLogger]:
+        """
+        Return the live SmartLogger registered under ``name``, or None.
+
+        A single dict lookup (no walk through logging's manager and its
+        placeholders), so it is cheap enough for hot paths. Retired loggers
+        are not returned.
+        """
+        logger = cls.__SmartLogger_registry.get(name)
+        if logger is None or logger.__smart_state.retired:
+            return None
+        return logger
+
     # ------------------------------------------------------------------
     #  RETIRE / DESTROY a logger
     # ------------------------------------------------------------------
@@ -949,6 +1235,7 @@ class SmartLogger:
                 pass    # pragma: no cover
 
         self.__py_logger.handlers.clear()
+        self.__smart_state.handler_info_json = None
         self.__smart_state.handlers.clear()
         self.__smart_state.retired = True
 
@@ -1022,17 +1309,22 @@ class SmartLogger:
         if name.startswith("_"):
             raise AttributeError(name)
 
-        upper = name.upper()
-
-        if upper not in LEVELS.all():
+        level_name = name.upper()
+        if LEVELS.get(level_name) is None:
             raise AttributeError(f"{self.__class__.__name__!s} has no attribute {name!r}")
 
-        level_value = LEVELS.get(upper)["value"]
-
         def dynamic_log_method(msg: str, *args, **kwargs):
+            # the value is read per call: the registry may since have been reset or re-registered
+            meta = LEVELS.get(level_name)
+            if meta is None:
+                self.__dict__.pop(name, None)
+                raise AttributeError(f"{self.__class__.__name__!s} has no attribute {name!r}")
+            level_value = meta["value"]
             if self.__py_logger.isEnabledFor(level_value):
                 self.__log(level_value, msg, args, **kwargs)
 
+        # resolve once: later lookups find the method without reaching __getattr__
+        self.__dict__[name] = dynamic_log_method
         return dynamic_log_method
 
     @property
@@ -1049,6 +1341,8 @@ class SmartLogger:
         rotation_logic: RotationLogic | None = None,
         details: LogRecordDetails | None = None,
         NDJSON_output: bool = False,
+        buffer_size: int = 0,
+        flush_interval: float = 0,
     ) -> None:
         """
         Enable global auditing of all SmartLogger instances.
@@ -1071,6 +1365,13 @@ class SmartLogger:
             SmartLogger's global default LogRecordDetails.
         NDJSON_output : bool | None
             Optional formatting style of audited log entries.
+        buffer_size : int
+            Buffered writes for the audit file, as in add_file(). Recommended
+            when many loggers fan in: entries below WARNING are written in
+            batches instead of one write per entry.
+        flush_interval : float
+            With buffer_size > 0, also flush once this many seconds have
+            passed since the previous flush.
         """
         if rotation_logic is not None and not isinstance(rotation_logic, RotationLogic):
             raise ValueError("rotation_logic must be a RotationLogic instance or None")
@@ -1082,7 +1383,7 @@ class SmartLogger:
         if rotation_logic is None:
             rotation_logic = RotationLogic()
 
-        handler = SmartLogger.__create_sync_handler(rotation_logic, str(file_path))
+        handler = SmartLogger.__create_sync_handler(rotation_logic, str(file_path), buffer_size, flush_interval)
 
         handler.setLevel(logging.NOTSET)
 
@@ -1091,6 +1392,8 @@ class SmartLogger:
             details = LogRecordDetails()
 
         handler.setFormatter(AuditFormatter(details, NDJSON_output))
+        handler.log_record_details = details
+        handler.addFilter(_not_audited_yet)
 
         # Attach to root logger
         root = logging.getLogger()
@@ -1107,9 +1410,8 @@ class SmartLogger:
         SmartLogger.__audit_details = details
 
         # Retroactively enable propagation on all SmartLogger instances
-        for logger in logging.Logger.manager.loggerDict.values():   # pragma: no cover
-            if isinstance(logger, SmartLogger):
-                logger.__py_logger.propagate = True
+        for logger in SmartLogger.__SmartLogger_registry.values():
+            logger.__py_logger.propagate = True
 
     @staticmethod
     def terminate_auditing() -> None:
@@ -1130,9 +1432,8 @@ class SmartLogger:
         SmartLogger.__audit_details = None
 
         # Retroactively disable propagation
-        for logger in logging.Logger.manager.loggerDict.values():
-            if isinstance(logger, SmartLogger):
-                logger.__py_logger.propagate = False    # pragma: no cover
+        for logger in SmartLogger.__SmartLogger_registry.values():
+            logger.__py_logger.propagate = False
 
     @staticmethod
     def get_record(
@@ -1230,7 +1531,6 @@ class SmartLogger:
         # Task name (asyncio) — optional, safe fallback
         # noinspection PyBroadException
         try:
-            import asyncio
             task = asyncio.current_task()
             task_name_val = task.get_name() if task else None
         except Exception:   # pragma: no cover
@@ -14,9 +14,7 @@ import logging
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
 import asyncio
@@ -107,16 +105,16 @@ async def main():
 
     await logger.a_stdout("\nRAW colored text:\n------------------")
 
-    colored = [
-        CPrint.colorize("RAW",      fg=CPrint.FG.BRIGHT_RED),
-        CPrint.colorize("text",     fg=CPrint.FG.ORANGE),
-        CPrint.colorize("rocks",    fg=CPrint.FG.BRIGHT_YELLOW),
-        CPrint.colorize("in",       fg=CPrint.FG.BRIGHT_GREEN),
-        CPrint.colorize("multiple", fg=CPrint.FG.BRIGHT_BLUE),
-        CPrint.colorize("colors",   fg=CPrint.FG.SOFT_PURPLE),
-    ]
+    colored = CPrint.colorize_multi([
+        ("RAW ",      {"fg": CPrint.FG.BRIGHT_RED}),
+        ("text ",     {"fg": CPrint.FG.ORANGE}),
+        ("rocks ",    {"fg": CPrint.FG.BRIGHT_YELLOW}),
+        ("in ",       {"fg": CPrint.FG.BRIGHT_GREEN}),
+        ("multiple ", {"fg": CPrint.FG.BRIGHT_BLUE}),
+        ("colors",    {"fg": CPrint.FG.SOFT_PURPLE}),
+    ])
 
-    await logger.a_raw(logging.INFO, " ".join(colored))
+    await logger.a_raw(logging.INFO, colored)
 
     # ------------------------------------------------------------------------------------------------------
     # 7. Safeguards & validations (informational)
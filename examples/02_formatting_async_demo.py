@@ -12,9 +12,7 @@ Demonstrates granular control over async log message components:
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
 import asyncio
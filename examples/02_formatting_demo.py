@@ -13,8 +13,7 @@ Demonstrates granular control over log message components:
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
 import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
 from LogSmith import SmartLogger
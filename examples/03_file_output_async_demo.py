@@ -9,17 +9,15 @@ Demonstrates AsyncSmartLogger file output:
 - handler_info (JSON-safe)
 - AsyncSmartLogger path validation safeguards
 """
-import json
 import logging
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
 import asyncio
+import os
 from pathlib import Path
 
 from LogSmith import LogRecordDetails, OptionalRecordFields
@@ -61,14 +59,16 @@ async def main():
     ]
 
     # Delete rotating.log.* as well
-    for f in log_dir.iterdir():
-        if f.name.startswith("rotating.log"):
-            f.unlink()
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("rotating.log") and entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
 
     for fname in files_to_delete:
-        f = log_dir / fname
-        if f.exists():
-            f.unlink()
+        try:
+            os.unlink(os.path.join(log_dir, fname))
+        except FileNotFoundError:
+            pass
 
     await logger.a_stdout("Old demo files removed.")
 
@@ -122,7 +122,7 @@ async def main():
     )
 
     # Show handler info (JSON-safe)
-    await logger.a_stdout(json.dumps(logger.handler_info, indent=4))
+    await logger.a_stdout(logger.handler_info_json)
 
     await logger.a_info("Rotation handler attached.")
 
@@ -165,8 +165,7 @@ async def main():
     # ------------------------------------------------------------------------------------------------------
     await logger.a_stdout("\nReading color-preserved text back from file:")
 
-    with open(color_file, "r", encoding="utf-8") as fh:
-        file_content = fh.read().rstrip()
+    file_content = color_file.read_bytes().decode("utf-8", errors="replace").rstrip()
 
     await logger.a_stdout("---------------------------------------------")
     await logger.a_stdout(file_content)
@@ -179,7 +178,7 @@ async def main():
     # 8. Show handler_info (JSON-safe)
     # ------------------------------------------------------------------------------------------------------
     await logger.a_stdout("\nHandlers details:\n-----------------")
-    await logger.a_stdout(json.dumps(logger.handler_info, indent=4))
+    await logger.a_stdout(logger.handler_info_json)
 
     # ------------------------------------------------------------------------------------------------------
     # 9. AsyncSmartLogger safeguards (contextually relevant here)
@@ -9,16 +9,14 @@ Demonstrates LogSmith file output:
 - handler_info (JSON-safe)
 - LogSmith's path validation safeguards
 """
-import json
 import logging
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
+import os
 from pathlib import Path
 
 from LogSmith import SmartLogger
@@ -58,14 +56,16 @@ files_to_delete = [
 ]
 
 # Delete rotating.log.* as well
-for f in log_dir.iterdir():
-    if f.name.startswith("rotating.log"):
-        f.unlink()
+with os.scandir(log_dir) as entries:
+    for entry in entries:
+        if entry.name.startswith("rotating.log") and entry.is_file(follow_symlinks=False):
+            os.unlink(entry.path)
 
 for fname in files_to_delete:
-    f = log_dir / fname
-    if f.exists():
-        f.unlink()
+    try:
+        os.unlink(os.path.join(log_dir, fname))
+    except FileNotFoundError:
+        pass
 
 logger.stdout("Old demo files removed.")
 
@@ -118,12 +118,11 @@ logger.add_file(
     rotation_logic=rotation,
 )
 
-logger.stdout(json.dumps(logger.handler_info, indent=4))
+logger.stdout(logger.handler_info_json)
 
 logger.info("Rotation handler attached.")
 
-for i in range(20):
-    logger.debug(f"Rotating message {i}")
+logger.log_many(logging.DEBUG, (f"Rotating message {i}" for i in range(20)))
 
 # ----------------------------------------------------------------------------------------------------------
 # 6. Demonstrate color-preserving file output
@@ -152,8 +151,7 @@ logger.stdout(CPrint.escape_ansi_for_display(colored))
 # ----------------------------------------------------------------------------------------------------------
 logger.stdout("\nReading color-preserved text back from file:")
 
-with open(color_file, "r", encoding="utf-8") as fh:
-    file_content = fh.read().rstrip()
+file_content = color_file.read_bytes().decode("utf-8", errors="replace").rstrip()
 
 logger.stdout("---------------------------------------------")
 logger.stdout(file_content)
@@ -166,7 +164,7 @@ logger.stdout(CPrint.escape_ansi_for_display(file_content))
 # 8. Show handler_info (JSON-safe)
 # ----------------------------------------------------------------------------------------------------------
 logger.stdout("\nHandlers details:\n-----------------")
-logger.stdout(json.dumps(logger.handler_info, indent=4))
+logger.stdout(logger.handler_info_json)
 
 # ----------------------------------------------------------------------------------------------------------
 # 9. SmartLogger safeguards (contextually relevant here)
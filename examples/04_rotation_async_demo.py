@@ -7,17 +7,15 @@ Demonstrates AsyncSmartLogger rotation logic:
 - Combined rotation (size + time)
 - Notes explaining daily/weekly behavior
 """
-import json
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
 import asyncio
 import time
+import os
 from pathlib import Path
 
 from LogSmith import RotationLogic, When
@@ -44,9 +42,10 @@ async def main():
     log_dir.mkdir(parents=True, exist_ok=True)
 
     # Clean previous files
-    for f in log_dir.iterdir():
-        if f.is_file():
-            f.unlink()
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
 
     print("Old rotation files removed.", flush = True)
 
@@ -114,10 +113,13 @@ async def main():
     )
 
     # Write for ~3 seconds to trigger multiple rotations
-    start = time.time()
-    while time.time() - start < 3:
-        await logger.a_debug("[time] rotating...")
-        await asyncio.sleep(0.01)  # throttle a bit
+    deadline = time.monotonic() + 3
+    n = 0
+    while time.monotonic() < deadline:
+        for i in range(n, n + 10):
+            await logger.a_debug(f"[time] rotating {i}")
+        n += 10
+        await asyncio.sleep(0.01)  # throttle a bit, once per batch
 
     await logger.a_stdout("Time-based rotation complete.")
 
@@ -151,10 +153,13 @@ async def main():
         log_record_details=details,
     )
 
-    start = time.time()
-    while time.time() - start < 2:
-        await logger.a_warning("[combined] rotating...")
-        await asyncio.sleep(0.01)  # throttle a bit
+    deadline = time.monotonic() + 2
+    n = 0
+    while time.monotonic() < deadline:
+        for i in range(n, n + 10):
+            await logger.a_warning(f"[combined] rotating {i}")
+        n += 10
+        await asyncio.sleep(0.01)  # throttle a bit, once per batch
 
     await logger.a_stdout("Combined rotation complete.")
 
@@ -162,7 +167,7 @@ async def main():
     # 5. Show handler_info (JSON-safe)
     # ------------------------------------------------------------------------------------------------------
     await logger.a_stdout("\nHandler info:\n-------------")
-    await logger.a_stdout(json.dumps(logger.handler_info, indent=4))
+    await logger.a_stdout(logger.handler_info_json)
 
     # ------------------------------------------------------------------------------------------------------
     # 6. AsyncSmartLogger rotation safeguards
@@ -7,15 +7,15 @@ Demonstrates SmartLogger rotation logic:
 - Combined rotation (size + time)
 - Comments explaining daily/weekly behavior
 """
-import json
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
+import logging
+import os
+import sys
 from pathlib import Path
 import time
 
@@ -41,9 +41,10 @@ log_dir = Path(ROOT_DIR) / "Logs" / "examples" / "rotation_demo"
 
 # Delete all rotation-related files from previous runs
 if log_dir.exists():
-    for f in log_dir.iterdir():
-        if f.is_file():
-            f.unlink()
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
 
 print("Old rotation files removed.", flush = True)
 log_dir.mkdir(parents=True, exist_ok=True)
@@ -89,8 +90,7 @@ logger.add_file(
     log_record_details=details,
 )
 
-for i in range(40):
-    logger.info(f"[size] message {i}")
+logger.log_many(logging.INFO, (f"[size] message {i}" for i in range(40)))
 
 logger.stdout("Size-based rotation complete.")
 
@@ -112,9 +112,11 @@ logger.add_file(
 )
 
 # Write for ~3 seconds to trigger multiple rotations
-start = time.time()
-while time.time() - start < 3:
-    logger.debug("[time] rotating...")
+deadline = time.monotonic() + 3
+n = 0
+while time.monotonic() < deadline:
+    logger.log_many(logging.DEBUG, (f"[time] rotating {i}" for i in range(n, n + 10)))
+    n += 10
 
 logger.stdout("Time-based rotation complete.")
 
@@ -148,9 +150,11 @@ logger.add_file(
     log_record_details=details,
 )
 
-start = time.time()
-while time.time() - start < 2:
-    logger.warning("[combined] rotating...")
+deadline = time.monotonic() + 2
+n = 0
+while time.monotonic() < deadline:
+    logger.log_many(logging.WARNING, (f"[combined] rotating {i}" for i in range(n, n + 10)))
+    n += 10
 
 logger.stdout("Combined rotation complete.")
 
@@ -158,7 +162,7 @@ logger.stdout("Combined rotation complete.")
 # 5. Show handler_info (JSON-safe)
 # ----------------------------------------------------------------------------------------------------------
 logger.stdout("\nHandler info:\n-------------")
-logger.stdout(json.dumps(logger.handler_info, indent=4))
+logger.stdout(logger.handler_info_json)
 
 # ----------------------------------------------------------------------------------------------------------
 # 6. SmartLogger rotation safeguards
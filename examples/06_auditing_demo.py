@@ -11,11 +11,10 @@ import json
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
+import os
 from pathlib import Path
 from typing import Dict
 
@@ -41,9 +40,10 @@ audit_dir = Path(ROOT_DIR) / "Logs" / "examples" / "auditing_demo"
 audit_dir.mkdir(parents=True, exist_ok=True)
 
 # Clean previous audit files
-for f in audit_dir.iterdir():
-    if f.is_file():
-        f.unlink()
+with os.scandir(audit_dir) as entries:
+    for entry in entries:
+        if entry.is_file(follow_symlinks=False):
+            os.unlink(entry.path)
 
 print("Old audit files removed.", flush = True)
 
@@ -11,13 +11,13 @@ Demonstrates SmartLogger under multi-threaded load:
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
 import threading
 import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from LogSmith import SmartLogger
@@ -26,6 +26,15 @@ from LogSmith import LogRecordDetails, OptionalRecordFields
 
 from project_definitions import ROOT_DIR
 
+# Benchmark runs: LOGSMITH_BENCH=1 drops the progress bar (its polling would be timed too),
+# LOGSMITH_STRESS_THREADS / LOGSMITH_STRESS_ITERATIONS size the run without editing this file.
+BENCH = bool(os.environ.get("LOGSMITH_BENCH"))
+THREAD_COUNT = int(os.environ.get("LOGSMITH_STRESS_THREADS", 32))
+ITERATIONS_PER_THREAD = int(os.environ.get("LOGSMITH_STRESS_ITERATIONS", 5000))
+
+# messages each worker hands to logger.log_many() at once (one handler lock per batch)
+BATCH_SIZE = 100
+
 
 # ----------------------------------------------------------------------------------------------------------
 # 1. Initialization
@@ -44,9 +53,10 @@ log_dir = Path(ROOT_DIR) / "Logs" / "examples" / "stress_test"
 
 # Clean previous files
 if log_dir.exists():
-    for f in log_dir.iterdir():
-        if f.is_file():
-            f.unlink()
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
 
 print("Old stress-test files removed.", flush = True)
 
@@ -61,7 +71,7 @@ logger = SmartLogger("stress", level=levels["TRACE"])
 
 
 # ----------------------------------------------------------------------------------------------------------
-# 4. Add rotating file handler
+# 4. Add rotating file handler (written by a background thread)
 # ----------------------------------------------------------------------------------------------------------
 logger.stdout("\nAdding rotating file handler...")
 
@@ -86,12 +96,13 @@ rotation = RotationLogic(
     backupCount=200,
 )
 
-logger.add_file(
+logger.add_async_file(
     log_dir=str(log_dir),
     logfile_name="stress_test.log",
     level=levels["TRACE"],
     rotation_logic=rotation,
     log_record_details=details,
+    queue_size=0,       # unbounded: worker threads only enqueue, nothing is dropped
 )
 
 logger.info("Stress-test logger ready.")
@@ -101,12 +112,16 @@ logger.info("Stress-test logger ready.")
 # 5. Worker thread
 # ----------------------------------------------------------------------------------------------------------
 def worker(thread_number: int, iterations: int, progress_dict, lock):
-    for i in range(iterations):
-        logger.info(f"[thread number {thread_number}] message {i}")
+    for first in range(0, iterations, BATCH_SIZE):
+        last = min(first + BATCH_SIZE, iterations)
+        logger.log_many(
+            levels["INFO"],
+            (f"[thread number {thread_number}] message {i}" for i in range(first, last)),
+        )
 
         # update progress counter
         with lock:
-            progress_dict["count"] += 1
+            progress_dict["count"] += last - first
 
 
 # ----------------------------------------------------------------------------------------------------------
@@ -152,8 +167,8 @@ def start_progress_monitor(total_messages, progress_dict, lock):
 # ----------------------------------------------------------------------------------------------------------
 # 7. Stress test runner
 # ----------------------------------------------------------------------------------------------------------
-def run_stress_test(thread_count: int = 32, iterations_per_thread: int = 5000):
-    logger.stdout(f"\nStarting stress test with {thread_count} threads and {5000} logs per thread...")
+def run_stress_test(thread_count: int = THREAD_COUNT, iterations_per_thread: int = ITERATIONS_PER_THREAD):
+    logger.stdout(f"\nStarting stress test with {thread_count} threads and {iterations_per_thread} logs per thread...")
     logger.stdout(f"(Writing logs to: '{logger.handler_info[0]["path"]}')")
 
 
@@ -163,26 +178,23 @@ def run_stress_test(thread_count: int = 32, iterations_per_thread: int = 5000):
     lock = threading.Lock()
 
     # Start progress monitor
-    monitor_thread = start_progress_monitor(total_messages, progress, lock)
-
-    threads = [
-        threading.Thread(
-            target=worker,
-            args=(t, iterations_per_thread, progress, lock),
-            daemon=True,
-        )
-        for t in range(thread_count)
-    ]
+    monitor_thread = None if BENCH else start_progress_monitor(total_messages, progress, lock)
 
     start = time.time()
 
-    for t in threads:
-        t.start()
+    with ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix="stress") as pool:
+        futures = [
+            pool.submit(worker, t, iterations_per_thread, progress, lock)
+            for t in range(thread_count)
+        ]
+        for future in futures:
+            future.result()     # re-raise a worker's exception instead of losing it
 
-    for t in threads:
-        t.join()
+    if monitor_thread is not None:
+        monitor_thread.join()
 
-    monitor_thread.join()
+    # wait for the background writer to drain the queue
+    logger.flush()
 
     end = time.time()
 
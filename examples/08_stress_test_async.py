@@ -11,13 +11,12 @@ Async stress test with:
 # ----------------------------------------------------------------------------------------------------------
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
 import asyncio
 import time
+import os
 from pathlib import Path
 
 from LogSmith import AsyncSmartLogger
@@ -26,6 +25,10 @@ from LogSmith import LogRecordDetails, OptionalRecordFields
 
 from project_definitions import ROOT_DIR
 
+# Benchmark runs: LOGSMITH_BENCH=1 drops the progress bar and the worker pacing,
+# LOGSMITH_STRESS_TASKS / LOGSMITH_STRESS_ITERATIONS size the run without editing this file.
+BENCH = bool(os.environ.get("LOGSMITH_BENCH"))
+
 
 async def main():
     levels = AsyncSmartLogger.levels()
@@ -39,9 +42,10 @@ async def main():
 
     log_dir = Path(ROOT_DIR) / "Logs" / "examples" / "stress_test_async"
     if log_dir.exists():
-        for f in log_dir.iterdir():
-            if f.is_file():
-                f.unlink()
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.path)
 
     print("Old stress-test files removed.", flush = True)
 
@@ -93,8 +97,8 @@ async def main():
     # --------------------------------------------------------------
     # TASK_COUNT = 16
     # ITERATIONS = 2000
-    TASK_COUNT = 32
-    ITERATIONS = 5000
+    TASK_COUNT = int(os.environ.get("LOGSMITH_STRESS_TASKS", 32))
+    ITERATIONS = int(os.environ.get("LOGSMITH_STRESS_ITERATIONS", 5000))
     TOTAL = TASK_COUNT * ITERATIONS
 
     # Shared progress counter
@@ -112,7 +116,7 @@ async def main():
             async with lock:
                 progress["count"] += 1
 
-            if i % 50 == 0:
+            if not BENCH and i % 50 == 0:
                 await asyncio.sleep(0.02)
 
     # --------------------------------------------------------------
@@ -171,10 +175,11 @@ async def main():
     tasks = [asyncio.create_task(worker(t)) for t in range(TASK_COUNT)]
 
     # create monitor for workers progress
-    monitor_task = asyncio.create_task(monitor())
+    monitor_task = None if BENCH else asyncio.create_task(monitor())
 
     await asyncio.gather(*tasks)    # DO      WORKLOAD
-    await monitor_task              # Monitor WORKLOAD
+    if monitor_task is not None:
+        await monitor_task          # Monitor WORKLOAD
 
     # force logger queue to empty
     await logger.flush()
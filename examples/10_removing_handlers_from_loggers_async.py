@@ -14,11 +14,9 @@ Demonstrates:
 # Make ROOT_DIR a known path when executing via CLI from (active) ROOT_DIR
 # ----------------------------------------------------------------------------------------------------------
 import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import _bootstrap  # noqa: F401
 # ----------------------------------------------------------------------------------------------------------
 
-import os
 import shutil
 import asyncio
 from pathlib import Path
@@ -36,11 +34,20 @@ async def print_file(label: str, path: Path):
         print("    <file missing>")
         return
 
-    raw = path.read_bytes()
-    decoded = raw.decode("utf-8")
-
-    for line in decoded.splitlines():
-        print("    " + line)
+    # Stream the file in 64 KB chunks, indenting every line, one write per chunk
+    # (text mode also folds CRLF line endings into "\n")
+    at_line_start = True
+    with path.open("r", encoding="utf-8", buffering=65536) as f:
+        while chunk := f.read(65536):
+            text = chunk.replace("\n", "\n    ")
+            if at_line_start:
+                text = "    " + text
+            at_line_start = chunk.endswith("\n")
+            if at_line_start:
+                text = text[:-4]    # the indent belongs to the next chunk's first line
+            print(text, end="")
+    if not at_line_start:
+        print()
 
     print("\n    NOTE:")
     if label.startswith("Logger A"):
@@ -65,13 +72,15 @@ async def main():
     logger_a.add_console()
     logger_b.add_console()
 
-    log_dir = (Path(ROOT_DIR) / "logs" / "examples" / "removing_handlers_demo_async").resolve()
+    log_dir = str((Path(ROOT_DIR) / "logs" / "examples" / "removing_handlers_demo_async").resolve())   # resolved once, reused as-is
 
-    if os.path.exists(log_dir):
+    try:
         shutil.rmtree(log_dir)
+    except FileNotFoundError:
+        pass
 
-    logger_a.add_file(log_dir=str(log_dir), logfile_name="A.log")
-    logger_b.add_file(log_dir=str(log_dir), logfile_name="B.log")
+    logger_a.add_file(log_dir=log_dir, logfile_name="A.log")
+    logger_b.add_file(log_dir=log_dir, logfile_name="B.log")
 
     # ------------------------------------------------------------
     # Step 1: both loggers write 3 INFO entries
@@ -86,7 +95,7 @@ async def main():
     await logger_a.flush()
     await logger_b.flush()
 
-    logger_a.remove_file_handler(log_dir=str(log_dir), logfile_name="A.log")
+    logger_a.remove_file_handler(log_dir=log_dir, logfile_name="A.log")
     logger_b.remove_console()
 
     # ------------------------------------------------------------
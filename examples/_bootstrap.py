@@ -0,0 +1,17 @@
+# examples/_bootstrap.py
+
+"""
+Make ROOT_DIR a known path when executing an example via CLI from (active) ROOT_DIR.
+Imported by the examples for its side effect only.
+
+It lives next to the examples rather than in LogSmith: LogSmith is not
+importable until this has run. The root is derived from __file__ without
+touching the filesystem (no resolve()), and the module cache makes every
+import after the first a dictionary lookup.
+"""
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
@@ -18,3 +18,22 @@ async def test_async_passthrough_formatter(tmp_path):
 
     text = (tmp_path / "p.log").read_text()
     assert "\x1b" in text  # ANSI preserved
+
+
+@pytest.mark.asyncio
+async def test_async_handler_filters_run_once_per_record(tmp_path):
+    logger = AsyncSmartLogger("apass_filter", logging.INFO)
+    logger.add_file(str(tmp_path), "f.log")
+
+    calls = []
+    handler = logger._AsyncSmartLogger__py_logger.handlers[0]
+    handler.addFilter(lambda record: calls.append(record.getMessage()) or record.getMessage() != "drop")
+
+    await logger.a_info("keep")
+    await logger.a_info("drop")
+    await logger._AsyncSmartLogger__queue.join()    # accessing private member. do not use outside of test suite
+
+    assert calls == ["keep", "drop"]
+    text = (tmp_path / "f.log").read_text()
+    assert "keep" in text and "drop" not in text
+    logger.destroy()
@@ -317,7 +317,7 @@ def test_list_rotated_files(tmp_path):
     handler.baseFilename = str(base)
 
     # noinspection PyUnresolvedReferences
-    files = handler._Async_TimedSizedRotatingFileHandler__list_rotated_files()
+    files = [path for path, _ in handler._Async_TimedSizedRotatingFileHandler__scan_rotated_files()]
 
     assert str(tmp_path / "test.log.1") in files
     assert str(tmp_path / "test.log.2") in files
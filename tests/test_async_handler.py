@@ -160,5 +160,5 @@ def test_list_rotated_files(tmp_path):
     (tmp_path / "x.log.2").write_text("b")
 
     # noinspection PyUnresolvedReferences
-    lst = h._Async_TimedSizedRotatingFileHandler__list_rotated_files()
-    assert len(lst) == 3
+    lst = [path for path, _ in h._Async_TimedSizedRotatingFileHandler__scan_rotated_files()]
+    assert sorted(lst) == [str(tmp_path / "x.log.1"), str(tmp_path / "x.log.2")]
@@ -381,6 +381,33 @@ def test_should_rotate_size(tmp_path):
     assert h._Async_TimedSizedRotatingFileHandler__should_rotate("xx")
 
 
+def test_should_rotate_uses_measured_size(tmp_path):
+    file = tmp_path / "x.log"
+    h = Async_TimedSizedRotatingFileHandler(str(file), max_bytes=5)
+    h.stream = open(file, "a")
+
+    # a size measured by emit() is trusted as-is instead of re-encoding the entry
+    # noinspection PyUnresolvedReferences
+    assert h._Async_TimedSizedRotatingFileHandler__should_rotate("x", 5)
+    # noinspection PyUnresolvedReferences
+    assert not h._Async_TimedSizedRotatingFileHandler__should_rotate("x")
+    h.stream.close()
+
+
+def test_should_rotate_reads_size_without_seeking(tmp_path):
+    file = tmp_path / "x.log"
+    file.write_text("1234")
+    h = Async_TimedSizedRotatingFileHandler(str(file), max_bytes=5)
+
+    real = open(file, "a")
+    h.stream = MagicMock(wraps=real)
+    h.stream.seek.side_effect = AssertionError("size must come from fstat, not seek/tell")
+
+    # noinspection PyUnresolvedReferences
+    assert h._Async_TimedSizedRotatingFileHandler__should_rotate("x")
+    real.close()
+
+
 def test_rotation_suffix_empty(tmp_path):
     h = Async_TimedSizedRotatingFileHandler(str(tmp_path / "x.log"))
     # noinspection PyUnresolvedReferences
@@ -409,10 +436,10 @@ def test_list_rotated_files_excludes_lock(tmp_path):
 
     h = Async_TimedSizedRotatingFileHandler(str(tmp_path / "x.log"))
     # noinspection PyUnresolvedReferences
-    lst = h._Async_TimedSizedRotatingFileHandler__list_rotated_files()
+    lst = [path for path, _ in h._Async_TimedSizedRotatingFileHandler__scan_rotated_files()]
 
-    assert len(lst) == 2
-    assert lst[1].endswith("x.log.1")
+    assert len(lst) == 1
+    assert lst[0].endswith("x.log.1")
 
 
 def test_rotate_first_creates_empty_file(tmp_path):
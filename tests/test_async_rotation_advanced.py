@@ -114,11 +114,11 @@ async def test_async_rotation_expiration(tmp_path, monkeypatch):
         if hasattr(h, "baseFilename")
     )
 
-    # Monkeypatch list_rotated_files to return only the aged file
+    # Monkeypatch the backup scan to return only the aged file
     monkeypatch.setattr(
         real_handler,
-        "_Async_TimedSizedRotatingFileHandler__list_rotated_files",
-        lambda: [str(rotated1)],
+        "_Async_TimedSizedRotatingFileHandler__scan_rotated_files",
+        lambda: iter([(str(rotated1), two_days_ago)]),
     )
 
     # Call expiration directly (no second rotation)
@@ -241,8 +241,8 @@ def test_expiration_policy_direct(tmp_path, monkeypatch):
 
     monkeypatch.setattr(
         handler,
-        "_Async_TimedSizedRotatingFileHandler__list_rotated_files",
-        lambda: [str(old_file), str(new_file)],
+        "_Async_TimedSizedRotatingFileHandler__scan_rotated_files",
+        lambda: iter([(str(old_file), two_days_ago), (str(new_file), os.path.getmtime(new_file))]),
     )
 
     # noinspection PyUnresolvedReferences
@@ -190,8 +190,8 @@ def test_expiration_file_disappears(tmp_path, monkeypatch):
 
     monkeypatch.setattr(
         handler,
-        "_Async_TimedSizedRotatingFileHandler__list_rotated_files",
-        lambda: [str(f)],
+        "_Async_TimedSizedRotatingFileHandler__scan_rotated_files",
+        lambda: iter([(str(f), 0.0)]),
     )
 
     f.unlink()
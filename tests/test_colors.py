@@ -1,6 +1,6 @@
 import sys
 import pytest
-from LogSmith.colors import CPrint, GradientDirection, terminal_supports_color
+from LogSmith.colors import CPrint, GradientDirection, GradientPalette, blend_palettes, terminal_supports_color
 
 
 # ============================================================
@@ -13,6 +13,11 @@ def test_strip_ansi_basic():
     assert out == "RED plain"
 
 
+def test_strip_ansi_plain_text_returned_as_is():
+    text = "no escapes here [31m"
+    assert CPrint.strip_ansi(text) is text
+
+
 # ============================================================
 # 2. escape_ansi_for_display
 # ============================================================
@@ -22,6 +27,12 @@ def test_escape_ansi_for_display():
     out = CPrint.escape_ansi_for_display(text)
     assert "\\x1b" in out
     assert "RED" in out
+    assert out == "\\x1b[31mRED\\x1b[0m"
+
+
+def test_escape_ansi_for_display_returns_plain_text_unchanged():
+    text = "plain text"
+    assert CPrint.escape_ansi_for_display(text) is text
 
 
 # ============================================================
@@ -37,6 +48,10 @@ def test_escape_control_chars():
     assert "A" in out and "B" in out and "C" in out
 
 
+def test_escape_control_chars_exact():
+    assert CPrint.escape_control_chars("a\tb\x7f\x80é\n") == "a\\x09b\\x7f\x80é\\x0a"
+
+
 # ============================================================
 # 4. colorize() — fg, bg, intensity, styles
 # ============================================================
@@ -57,6 +72,24 @@ def test_colorize_fg_bg_intensity_styles():
     assert out.endswith("\x1b[0m")
 
 
+def test_colorize_reuses_cached_escape_sequences():
+    first = CPrint.colorize("a", fg=CPrint.FG.RED, styles=[CPrint.Style.ITALIC])
+    second = CPrint.colorize("b", fg=CPrint.FG.RED, styles=(CPrint.Style.ITALIC,))
+
+    assert first == "\x1b[31;3ma\x1b[0m"
+    assert second == "\x1b[31;3mb\x1b[0m"
+    # noinspection PyUnresolvedReferences
+    assert CPrint._CPrint__affixes.cache_info().hits >= 1
+
+
+def test_colorize_multi_merges_consecutive_equal_styles():
+    red = {"fg": CPrint.FG.RED}
+    out = CPrint.colorize_multi([("a", red), ("b", red), (" ", None), ("c", {"fg": CPrint.FG.GREEN})])
+
+    assert out == "\x1b[31mab\x1b[0m \x1b[32mc\x1b[0m"
+    assert CPrint.strip_ansi(out) == "ab c"
+
+
 # ============================================================
 # 5. reverse() — 8‑color and 256‑color
 # ============================================================
@@ -83,6 +116,11 @@ def test_reverse_no_ansi():
     assert CPrint.reverse("plain") == "plain"
 
 
+def test_reverse_keeps_text_between_sequences():
+    rev = CPrint.reverse("\x1b[31;44mAB\x1b[0mC\x1b[1mD")
+    assert rev == "\x1b[44;31;0;1mABCD\x1b[0m"
+
+
 # ============================================================
 # 6. terminal_supports_color() — monkeypatch
 # ============================================================
@@ -105,6 +143,29 @@ def test_gradient_horizontal():
     assert "38;5;21" in out
 
 
+def test_gradient_horizontal_reuses_column_sequences():
+    first = CPrint.gradient("ABC", fg_codes=[196, 46, 21], bg_codes=[16, 17, 18])
+    # noinspection PyUnresolvedReferences
+    hits = CPrint._CPrint__gradient_template.cache_info().hits
+    second = CPrint.gradient("XYZ", fg_codes=(196, 46, 21), bg_codes=(16, 17, 18))
+
+    assert first == "\x1b[38;5;196;48;5;16mA\x1b[38;5;46;48;5;17mB\x1b[38;5;21;48;5;18mC\x1b[0m"
+    assert CPrint.strip_ansi(second) == "XYZ"
+    assert second == first.replace("A", "X").replace("B", "Y").replace("C", "Z")
+    # noinspection PyUnresolvedReferences
+    assert CPrint._CPrint__gradient_template.cache_info().hits == hits + 1
+
+
+def test_gradient_horizontal_merges_columns_of_the_same_stop():
+    out = CPrint.gradient("ABCD", fg_codes=[1, 2])
+    assert out == "\x1b[38;5;1mABC\x1b[38;5;2mD\x1b[0m"
+
+
+def test_gradient_horizontal_keeps_percent_signs():
+    out = CPrint.gradient("50%s %d", fg_codes=[196, 46, 21])
+    assert CPrint.strip_ansi(out) == "50%s %d"
+
+
 def test_gradient_horizontal_reverse():
     out = CPrint.gradient("ABC", fg_codes=[196, 46, 21],
                           direction=GradientDirection.HORIZONTAL_REVERSE)
@@ -129,6 +190,18 @@ def test_gradient_vertical_reverse():
     assert "38;5;21" in out.split("\n")[0]
 
 
+def test_gradient_vertical_reuses_line_sequences():
+    first = CPrint.gradient("A\nB\nC", fg_codes=[196, 46, 21], direction=GradientDirection.VERTICAL)
+    # noinspection PyUnresolvedReferences
+    hits = CPrint._CPrint__vertical_template.cache_info().hits
+    second = CPrint.gradient("10%\n\n%s", fg_codes=(196, 46, 21), direction=GradientDirection.VERTICAL)
+
+    assert first == "\x1b[38;5;196mA\x1b[0m\n\x1b[38;5;46mB\x1b[0m\n\x1b[38;5;21mC\x1b[0m"
+    assert second == "\x1b[38;5;196m10%\x1b[0m\n\x1b[38;5;46m\x1b[0m\n\x1b[38;5;21m%s\x1b[0m"
+    # noinspection PyUnresolvedReferences
+    assert CPrint._CPrint__vertical_template.cache_info().hits == hits + 1
+
+
 def test_gradient_auto_single_line():
     out = CPrint.gradient("XYZ", fg_codes=[1, 2, 3],
                           direction=GradientDirection.AUTO)
@@ -158,3 +231,38 @@ def test_gradient_empty_text():
 
 def test_gradient_no_fg_codes():
     assert CPrint.gradient("ABC", fg_codes=None) == "ABC"
+
+
+def test_stretch_indices_are_shared():
+    from LogSmith.colors import _stretch_indices
+
+    assert _stretch_indices(3, 5) == (0, 0, 1, 1, 2)
+    assert _stretch_indices(1, 3) == (0, 0, 0)
+    assert _stretch_indices(4, 1) == (0,)
+    assert _stretch_indices(3, 5) is _stretch_indices(3, 5)
+
+
+def test_blend_palettes_stretches_and_averages():
+    assert blend_palettes([10, 20], [30, 40, 50, 60]) == [20, 25, 30, 40]
+    assert blend_palettes([10], [20, 40], steps=3) == [15, 15, 25]
+    assert blend_palettes([10, 20], [30, 40], steps=1) == [20]
+    assert len(blend_palettes(GradientPalette.NEON, GradientPalette.FIRE, steps=12)) == 12
+
+
+def test_palettes_are_immutable_and_accept_lists():
+    assert isinstance(GradientPalette.RAINBOW, tuple)
+    hash(GradientPalette.OCEAN)
+
+    for direction in GradientDirection:
+        text = "ABCDEFGH\nIJ"
+        assert CPrint.gradient(text, fg_codes=GradientPalette.FIRE, direction=direction) == \
+            CPrint.gradient(text, fg_codes=list(GradientPalette.FIRE), direction=direction)
+
+
+def test_gradient_uses_precomputed_256_color_codes():
+    from LogSmith.colors import _FG_256, _BG_256
+
+    assert _FG_256[196] == "38;5;196" and _BG_256[21] == "48;5;21"
+    if terminal_supports_color():
+        # out-of-table indices are still spelled out rather than rejected
+        assert "38;5;300" in CPrint.gradient("ab", fg_codes=[300, 301])
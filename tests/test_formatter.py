@@ -2,6 +2,7 @@ import json
 import logging
 import pytest
 import sys
+from unittest.mock import patch
 import LogSmith.formatter as F
 
 from LogSmith.formatter import (
@@ -139,6 +140,103 @@ def test_timestamp_invalid_fractional_directive():
         fmt.format(rec)
 
 
+def test_compiled_datefmt_is_shared_and_matches_strftime():
+    renderer = F._compile_datefmt("%H:%M:%S.%2f")
+    assert F._compile_datefmt("%H:%M:%S.%2f") is renderer
+
+    rec = make_record()
+    base = __import__("datetime").datetime.fromtimestamp(rec.created)
+    assert renderer(rec.created) == base.strftime("%H:%M:%S.") + f"{base.microsecond:06d}"[:2]
+
+
+def test_exception_text_rendered_once_per_record():
+    import traceback
+
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        rec = make_record(exc_info=sys.exc_info())
+
+    expected = "".join(traceback.format_exception(*rec.exc_info))
+    assert F._format_exc_info(rec) == expected
+    assert rec.exc_text == expected.rstrip("\n")
+
+    rec.exc_text = "cached"
+    assert F._format_exc_info(rec) == "cached\n"
+
+
+def test_message_resolved_once_per_record():
+    rec = make_record(msg="value=%d", args=(5,))
+    plain = StructuredPlainFormatter(LogRecordDetails())
+    ndjson = StructuredNDJSONFormatter(LogRecordDetails())
+
+    assert plain.format(rec).endswith("value=5")
+    assert rec.message == "value=5"
+
+    # unchanged msg/args: later handlers reuse the message
+    with patch.object(logging.LogRecord, "getMessage", side_effect=AssertionError("re-rendered")):
+        assert json.loads(ndjson.format(rec))["message"] == "value=5"
+
+    # a filter rewrote the args (e.g. redaction): the message is rebuilt
+    rec.args = (6,)
+    assert json.loads(ndjson.format(rec))["message"] == "value=6"
+
+
+@pytest.mark.parametrize("datefmt", [
+    "%Y-%m-%d %H:%M:%S.%3f",
+    "%Y-%m-%d %H:%M:%S",
+    "{%d/%m/%Y} %H:%M:%S.%6f",
+])
+@pytest.mark.parametrize("created", [0.0, 1_700_000_000.0004994, 1_700_000_000.9999996, 1_712_345_678.123456])
+def test_fast_datefmt_matches_strftime(datefmt, created):
+    from datetime import datetime
+
+    renderer = F._compile_datefmt(datefmt)
+    assert renderer.__name__ == "render_fast"
+
+    base = datetime.fromtimestamp(created)
+    for digits in "36":
+        datefmt = datefmt.replace(f"%{digits}f", f"{base.microsecond:06d}"[:int(digits)])
+    assert renderer(created) == base.strftime(datefmt)
+
+
+def test_fast_datefmt_reuses_second_across_calls():
+    from datetime import datetime
+
+    renderer = F._compile_datefmt("[%S.%3f|%M {%3f}]")
+    for created in (1_700_000_000.123, 1_700_000_000.987, 1_700_000_001.0004, 1_700_000_000.5):
+        base = datetime.fromtimestamp(created)
+        frac = f"{base.microsecond:06d}"
+        assert renderer(created) == base.strftime(f"[%S.{frac[:3]}|%M {{{frac[:3]}}}]")
+
+    whole = F._compile_datefmt("%Y-%m-%d %H:%M:%S")
+    assert whole(1_700_000_000.1) == whole(1_700_000_000.9) == datetime.fromtimestamp(1_700_000_000).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_fast_datefmt_falls_back_for_other_directives():
+    assert F._compile_datefmt("%b %d %H:%M:%S").__name__ != "render_fast"
+    assert F._compile_datefmt("%Y%%%m").__name__ != "render_fast"
+
+
+def test_strftime_datefmt_renders_once_per_second():
+    from datetime import datetime
+
+    calls = []
+
+    def render_second(whole):
+        calls.append(whole)
+        return datetime.fromtimestamp(whole).strftime(f"%b %d %H:%M:%S.{F._FRACTION_PLACEHOLDER}")
+
+    renderer = F._compile_per_second(render_second, 2)
+    for created in (1_700_000_000.25, 1_700_000_000.75, 1_700_000_001.5):
+        base = datetime.fromtimestamp(created)
+        assert renderer(created) == base.strftime("%b %d %H:%M:%S.") + f"{base.microsecond:06d}"[:2]
+
+    assert calls == [1_700_000_000.0, 1_700_000_001.0]
+    assert F._compile_datefmt("%b %d %H:%M:%S.%2f").__name__ == "render_cached"
+    assert F._compile_datefmt(None).__name__ == "render_cached"
+
+
 # ------------------------------------------------------------
 # 6. JSON formatter — optional field filtering
 # ------------------------------------------------------------
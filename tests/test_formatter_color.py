@@ -43,3 +43,72 @@ def test_color_all_fields():
 
     assert "LOGGER=test" in out
     assert "\x1b[" in out  # colored
+
+
+def test_color_precomputed_wrappers_match_colorize():
+    from LogSmith.level_registry import LEVELS
+
+    fmt = StructuredColorFormatter(LogRecordDetails(datefmt="%Y"))
+    rec = make_record("hello")
+    out = fmt.format(rec)
+
+    style = LEVELS.get("INFO")["style"]
+    colorize_level = lambda text: CPrint.colorize(
+        text, fg=style.fg, bg=style.bg, intensity=style.intensity, styles=style.styles
+    )
+    sep = CPrint.colorize("•", fg=CPrint.FG.BRIGHT_WHITE, intensity=CPrint.Intensity.BOLD)
+    year = str(__import__("datetime").datetime.fromtimestamp(rec.created).year)
+
+    assert out == f" {sep} ".join([
+        CPrint.colorize(year, fg=CPrint.FG.CONSOLE_DEFAULT, intensity=CPrint.Intensity.DIM),
+        colorize_level("INFO".ljust(8)),
+        colorize_level("hello"),
+    ])
+
+
+def test_color_format_path_resolved_at_construction():
+    plain_details = LogRecordDetails()
+    diag_details = LogRecordDetails(optional_record_fields=OptionalRecordFields(stack_info=True))
+
+    fmt = StructuredColorFormatter(diag_details)
+    assert "format" in vars(fmt)
+    out = fmt.format(make_record("hello", stack_info="Stack (most recent call last):"))
+    assert out.endswith(CPrint.colorize("Stack (most recent call last):", fg=CPrint.FG.BRIGHT_MAGENTA))
+
+    class Custom(StructuredColorFormatter):
+        def format(self, record):
+            return "custom:" + super().format(record)
+
+    custom = Custom(plain_details)
+    assert "format" not in vars(custom)
+    assert custom.format(make_record("hello")).startswith("custom:")
+
+
+def test_color_extras_match_colorize():
+    fmt = StructuredColorFormatter(LogRecordDetails())
+    rec = make_record("hello")
+    rec.__dict__["fields"] = {"user": "gilad", "x": 5}
+
+    key = lambda k: CPrint.colorize(k, fg=CPrint.FG.BRIGHT_WHITE, intensity=CPrint.Intensity.BOLD)
+    val = lambda v: CPrint.colorize(repr(v), fg=CPrint.FG.BRIGHT_GREY)
+
+    expected = f"{{{key('user')} = {val('gilad')}, {key('x')} = {val(5)}}}"
+    assert fmt.format(rec).endswith(" " + expected)
+
+
+def test_color_rendered_level_follows_style_changes():
+    from LogSmith.level_registry import LEVELS
+    from LogSmith.levels import LevelStyle
+
+    fmt = StructuredColorFormatter(LogRecordDetails())
+    meta = LEVELS.get("INFO")
+    original = meta["style"]
+    try:
+        first = fmt.format(make_record("a"))
+        meta["style"] = LevelStyle(fg=CPrint.FG.BRIGHT_BLUE)
+        second = fmt.format(make_record("a"))
+    finally:
+        meta["style"] = original
+
+    assert CPrint.colorize("INFO    ", fg=CPrint.FG.BRIGHT_BLUE) in second
+    assert CPrint.colorize("INFO    ", fg=CPrint.FG.BRIGHT_BLUE) not in first
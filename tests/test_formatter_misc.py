@@ -33,3 +33,46 @@ def test_audit_formatter_prefix():
 
     assert out.startswith("[test]: ")
     assert "hello" in out
+
+
+def test_audit_formatter_formats_each_record_once():
+    fmt = AuditFormatter(LogRecordDetails())
+    other = AuditFormatter(LogRecordDetails(separator="|"))
+
+    rec = make_record("hello", x=1)
+    rec.user = "gilad"
+    first = fmt.format(rec)
+
+    rec.msg = "changed"
+    assert fmt.format(rec) is first             # same formatter → cached line
+    assert "changed" not in first
+    assert " | " in other.format(rec)           # other formatters are not affected
+    assert "_logsmith_audit_line" not in first
+
+
+def test_audit_formatter_reuses_plain_line_of_matching_formatter():
+    from LogSmith.formatter import StructuredPlainFormatter
+
+    file_fmt = StructuredPlainFormatter(LogRecordDetails())
+    audit_fmt = AuditFormatter(LogRecordDetails())
+
+    rec = make_record("hello")
+    line = file_fmt.format(rec)
+
+    assert audit_fmt.format(rec) == f"[test]: {line}"
+    assert audit_fmt.structured.format(rec) is line
+
+
+def test_shared_plain_line_is_rebuilt_after_msg_changes():
+    from LogSmith.formatter import StructuredPlainFormatter
+
+    first = StructuredPlainFormatter(LogRecordDetails())
+    second = StructuredPlainFormatter(LogRecordDetails())
+
+    rec = make_record("password=%s")
+    rec.args = ("hunter2",)
+    assert first.format(rec).endswith("password=hunter2")
+
+    # a later handler's filter redacts the record before its formatter runs
+    rec.args = ("***",)
+    assert second.format(rec).endswith("password=***")
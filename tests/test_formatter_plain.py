@@ -122,3 +122,81 @@ def test_plain_invalid_optional_field_mismatch():
             optional_record_fields=orf,
             message_parts_order=["level", "logger_name"],
         )
+
+
+# ------------------------------------------------------------
+# COMPILED PARTS
+# ------------------------------------------------------------
+def test_plain_strict_mode_exact_compiled_order():
+    orf = OptionalRecordFields(lineno=True, thread_id=True, process_id=True)
+    details = LogRecordDetails(
+        datefmt="%Y",
+        optional_record_fields=orf,
+        message_parts_order=["process_id", "level", "lineno", "thread_id"],
+    )
+    fmt = StructuredPlainFormatter(details)
+    rec = make_record("msg")
+
+    year = str(__import__("datetime").datetime.fromtimestamp(rec.created).year)
+    assert fmt.format(rec) == " • ".join(
+        [year, f"P={rec.process}", "INFO", "L=10", f"th={rec.thread}", "msg"]
+    )
+
+
+def test_plain_strict_mode_generated_head_all_fields():
+    orf = OptionalRecordFields(
+        relative_created=True, logger_name=True, file_path=True, file_name=True,
+        lineno=True, func_name=True, thread_id=True, thread_name=True,
+        task_name=True, process_id=True, process_name=True,
+    )
+    order = [
+        "task_name", "level", "relative_created", "logger_name", "file_path", "file_name",
+        "lineno", "func_name", "thread_id", "thread_name", "process_id", "process_name",
+    ]
+    fmt = StructuredPlainFormatter(LogRecordDetails(
+        datefmt="%Y", separator="%", optional_record_fields=orf, message_parts_order=order,
+    ))
+    rec = make_record("msg")
+    year = str(__import__("datetime").datetime.fromtimestamp(rec.created).year)
+    fields = [
+        "INFO", str(int(rec.relativeCreated)), "LOGGER=test", __file__, rec.filename,
+        "L=10", "func", f"th={rec.thread}", rec.threadName, f"P={rec.process}", rec.processName,
+    ]
+
+    rec.taskName = "worker"
+    assert fmt.format(rec) == " % ".join([year, "worker", *fields, "msg"])
+
+    bare = make_record("msg")
+    bare.__dict__.pop("taskName", None)
+    bare.created, bare.relativeCreated, bare.thread, bare.process = (
+        rec.created, rec.relativeCreated, rec.thread, rec.process)
+    assert fmt.format(bare) == " % ".join([year, *fields, "msg"])
+
+
+def test_plain_generated_head_shared_by_equal_layouts():
+    def details():
+        return LogRecordDetails(
+            datefmt="%H:%M:%S", separator="|",
+            optional_record_fields=OptionalRecordFields(logger_name=True, lineno=True),
+            message_parts_order=["level", "logger_name", "lineno"],
+        )
+
+    first = StructuredPlainFormatter(details())
+    second = StructuredPlainFormatter(details())
+    rec = make_record("msg")
+
+    assert first._StructuredPlainFormatter__head is second._StructuredPlainFormatter__head
+    assert first.format(rec) == second.format(rec)
+
+
+def test_plain_format_path_resolved_at_construction():
+    simple = StructuredPlainFormatter(LogRecordDetails())
+    strict = StructuredPlainFormatter(LogRecordDetails(optional_record_fields=OptionalRecordFields(stack_info=True)))
+    rec = make_record("msg")
+    rec.user = "gilad"
+
+    assert "format" in vars(simple) and "format" in vars(strict)
+    assert simple.format(rec).endswith("msg {user='gilad'}")
+    assert strict.format(rec).endswith("msg user='gilad'")
+    # the class-level dispatcher gives the same result
+    assert StructuredPlainFormatter.format(simple, rec) == simple.format(rec)
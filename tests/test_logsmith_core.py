@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -249,3 +251,19 @@ async def test_asyncsmartlogger_raw_respects_sanitization(tmp_path):
     content = (tmp_path / "raw_async.log").read_text(encoding="utf-8")
     assert "async-raw" in content
     assert "\x1b[" not in content
+
+
+# =========================
+# __init__.py – calling card
+# =========================
+
+def test_package_metadata_is_resolved_on_first_access():
+    code = (
+        "import sys, LogSmith; "
+        "assert 'importlib.metadata' not in sys.modules; "
+        "assert isinstance(LogSmith.__version__, str); "
+        "assert isinstance(LogSmith.__metadata__, dict); "
+        "assert LogSmith.__metadata__ is LogSmith.__metadata__"
+    )
+    root = Path(__file__).resolve().parent.parent
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=root)
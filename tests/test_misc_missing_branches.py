@@ -117,8 +117,6 @@ def test_illegal_register_level(tmp_path):
 def reset_levels_for_tests():
     # noinspection PyProtectedMember
     LEVELS._LevelRegistry__init_builtin_levels()
-    # noinspection PyProtectedMember
-    LEVELS._LevelRegistry__cache.clear()
 
 async def test_theme():
     reset_levels_for_tests()
@@ -0,0 +1,257 @@
+# tests/test_queued_file_handler.py
+
+import logging
+import queue
+import threading
+import time
+import uuid
+
+import pytest
+
+from LogSmith.smartlogger import SmartLogger
+from LogSmith.queued_handler import QueuedFileHandler
+from LogSmith.rotation import ConcurrentTimedSizedRotatingFileHandler
+
+
+@pytest.fixture
+def logger():
+    lg = SmartLogger(f"test_queued_{uuid.uuid4().hex}")
+    yield lg
+    lg.retire()
+
+
+def bodies(path):
+    return [line.split("•")[-1].strip() for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_add_async_file_writes_in_order(logger, tmp_path):
+    logger.add_async_file(str(tmp_path), "q.log", level=logging.DEBUG)
+
+    for i in range(200):
+        logger.info("msg %d", i)
+    logger.raw(logging.INFO, "\x1b[31mRAW\x1b[0m")
+    logger.flush()
+
+    assert bodies(tmp_path / "q.log") == [f"msg {i}" for i in range(200)] + ["RAW"]
+    assert logger.file_handlers[0]["path"] == str((tmp_path / "q.log").resolve())
+
+
+def test_records_are_formatted_on_listener_thread(tmp_path):
+    inner = ConcurrentTimedSizedRotatingFileHandler(str(tmp_path / "f.log"))
+    inner.setFormatter(logging.Formatter("%(message)s"))
+    handler = QueuedFileHandler(inner)
+
+    threads = []
+
+    class Probe:
+        def __str__(self):
+            threads.append(threading.current_thread())
+            return "probe"
+
+    handler.handle(logging.makeLogRecord({"msg": "value=%s", "args": (Probe(),), "levelno": logging.INFO}))
+    handler.flush()
+    handler.close()
+
+    assert (tmp_path / "f.log").read_text().splitlines() == ["value=probe"]
+    assert threads and all(t is not threading.current_thread() for t in threads)
+
+
+def test_add_async_file_buffers_on_listener_thread(logger, tmp_path):
+    logger.add_async_file(str(tmp_path), "qb.log", level=logging.DEBUG, queue_size=0,
+                          buffer_size=64 * 1024, flush_interval=0.5)
+
+    queued = [h for h in logging.getLogger(logger.name).handlers if isinstance(h, QueuedFileHandler)]
+    assert (queued[0].handler.buffer_size, queued[0].handler.flush_interval) == (64 * 1024, 0.5)
+
+    for i in range(20):
+        logger.info("msg %d", i)
+    logger.flush()
+    assert bodies(tmp_path / "qb.log") == [f"msg {i}" for i in range(20)]
+
+
+def test_drop_oldest_keeps_newest(tmp_path):
+    inner = ConcurrentTimedSizedRotatingFileHandler(str(tmp_path / "d.log"))
+    inner.setFormatter(logging.Formatter("%(message)s"))
+
+    gate = threading.Event()
+    original_handle = inner.handle
+
+    def slow_handle(record):
+        gate.wait()
+        return original_handle(record)
+
+    inner.handle = slow_handle
+
+    handler = QueuedFileHandler(inner, queue_size=2, overflow="drop_oldest")
+    for i in range(10):
+        handler.handle(logging.makeLogRecord({"msg": f"m{i}", "levelno": logging.INFO}))
+
+    gate.set()
+    handler.flush()
+    handler.close()
+
+    lines = (tmp_path / "d.log").read_text().splitlines()
+    assert handler.dropped > 0
+    assert lines[-2:] == ["m8", "m9"]
+    assert len(lines) + handler.dropped == 10
+
+
+def test_drop_oldest_never_drops_flush_marker_or_stop_sentinel(tmp_path):
+    inner = ConcurrentTimedSizedRotatingFileHandler(str(tmp_path / "c.log"))
+    inner.setFormatter(logging.Formatter("%(message)s"))
+
+    entered, gate = threading.Event(), threading.Event()
+    original_handle = inner.handle
+
+    def slow_handle(record):
+        entered.set()
+        gate.wait()
+        return original_handle(record)
+
+    inner.handle = slow_handle
+
+    def rec(msg):
+        return logging.makeLogRecord({"msg": msg, "levelno": logging.INFO})
+
+    def wait_until_full(q):
+        while q.qsize() < 4:
+            time.sleep(0.001)
+
+    handler = QueuedFileHandler(inner, queue_size=4, overflow="drop_oldest")
+    handler.handle(rec("first"))
+    entered.wait(5)     # the listener is now stuck on "first"
+
+    # a flush marker queued behind records, then enough records to evict everything droppable
+    for i in range(3):
+        handler.handle(rec(f"a{i}"))
+    flusher = threading.Thread(target=handler.flush, daemon=True)
+    flusher.start()
+    wait_until_full(handler.queue)
+    for i in range(10):
+        handler.handle(rec(f"b{i}"))
+
+    gate.set()
+    flusher.join(5)
+    assert not flusher.is_alive()
+
+    # the same for the listener's stop sentinel
+    gate.clear()
+    entered.clear()
+    handler.handle(rec("second"))
+    entered.wait(5)
+    for i in range(3):
+        handler.handle(rec(f"c{i}"))
+    closer = threading.Thread(target=handler.close, daemon=True)
+    closer.start()
+    wait_until_full(handler.queue)
+    for i in range(10):
+        handler.handle(rec(f"d{i}"))
+
+    gate.set()
+    closer.join(5)
+    assert not closer.is_alive()
+
+    lines = (tmp_path / "c.log").read_text().splitlines()
+    # everything queued before the marker (what survived eviction) was written before flush() returned
+    assert lines[:4] == ["first", "b7", "b8", "b9"]
+    assert lines[4] == "second"
+
+
+def test_drop_oldest_never_drops_raw_text(tmp_path):
+    inner = ConcurrentTimedSizedRotatingFileHandler(str(tmp_path / "r.log"))
+    inner.setFormatter(logging.Formatter("%(message)s"))
+
+    entered, gate = threading.Event(), threading.Event()
+    original_handle = inner.handle
+
+    def slow_handle(record):
+        entered.set()
+        gate.wait()
+        return original_handle(record)
+
+    inner.handle = slow_handle
+
+    def rec(msg):
+        return logging.makeLogRecord({"msg": msg, "levelno": logging.INFO})
+
+    handler = QueuedFileHandler(inner, queue_size=3, overflow="drop_oldest")
+    handler.handle(rec("first"))
+    entered.wait(5)     # the listener is now stuck on "first"
+
+    handler.write_raw("RAW\n")
+    for i in range(10):
+        handler.handle(rec(f"m{i}"))
+
+    gate.set()
+    handler.flush()
+    handler.close()
+
+    assert (tmp_path / "r.log").read_text().splitlines() == ["first", "RAW", "m8", "m9"]
+    assert handler.dropped == 8
+
+
+def test_unbounded_queue_is_simple_queue(tmp_path):
+    inner = ConcurrentTimedSizedRotatingFileHandler(str(tmp_path / "u.log"))
+    inner.setFormatter(logging.Formatter("%(message)s"))
+    handler = QueuedFileHandler(inner, queue_size=0)
+    assert isinstance(handler.queue, queue.SimpleQueue)
+
+    for i in range(100):
+        handler.handle(logging.makeLogRecord({"msg": f"m{i}", "levelno": logging.INFO}))
+    handler.flush()
+
+    assert (tmp_path / "u.log").read_text().splitlines() == [f"m{i}" for i in range(100)]
+    handler.close()
+
+
+def test_listener_drains_backlog_in_batches(tmp_path):
+    from LogSmith.queued_handler import _FileQueueListener
+
+    inner = ConcurrentTimedSizedRotatingFileHandler(str(tmp_path / "b.log"))
+    inner.setFormatter(logging.Formatter("%(message)s"))
+    inner.setLevel(logging.INFO)
+
+    batches = []
+    original_emit_batch = inner.emit_batch
+
+    def counting_emit_batch(records):
+        batches.append(len(records))
+        original_emit_batch(records)
+
+    inner.emit_batch = counting_emit_batch
+
+    flushed = threading.Event()
+    q = queue.SimpleQueue()
+    for i in range(300):
+        q.put(logging.makeLogRecord({"msg": f"m{i}", "levelno": logging.INFO}))
+    q.put(logging.makeLogRecord({"msg": "hidden", "levelno": logging.DEBUG}))
+    q.put(logging.makeLogRecord({"_logsmith_raw_text": "RAW\n"}))
+    q.put(logging.makeLogRecord({"_logsmith_flush_event": flushed}))
+    q.put(logging.makeLogRecord({"msg": "last", "levelno": logging.INFO}))
+
+    listener = _FileQueueListener(q, inner, respect_handler_level=True)
+    q.put(listener._sentinel)
+    listener._monitor()     # runs the drain loop on this thread, up to the sentinel
+    inner.close()
+
+    assert batches == [256, 44]
+    assert flushed.is_set()
+    assert (tmp_path / "b.log").read_text().splitlines() == [f"m{i}" for i in range(300)] + ["RAW", "last"]
+
+
+def test_invalid_overflow_policy_rejected(logger, tmp_path):
+    with pytest.raises(ValueError):
+        logger.add_async_file(str(tmp_path), "q.log", overflow="spill")
+
+
+def test_remove_async_file_handler_stops_listener(logger, tmp_path):
+    thread_count = threading.active_count()
+    logger.add_async_file(str(tmp_path), "q.log", level=logging.DEBUG)
+    assert threading.active_count() == thread_count + 1
+
+    logger.info("before")
+    logger.remove_file_handler(str(tmp_path), "q.log")
+
+    assert bodies(tmp_path / "q.log") == ["before"]
+    assert logger.file_handlers == []
+    assert threading.active_count() == thread_count
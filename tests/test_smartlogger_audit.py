@@ -24,3 +24,51 @@ def test_sync_audit_mirroring(tmp_path):
 
     SmartLogger._SmartLogger__audit_enabled = False
     SmartLogger._SmartLogger__audit_handler = None
+
+
+def test_sync_audit_records_each_entry_once(tmp_path):
+    before = SmartLogger("audit_once_before", logging.INFO)
+    SmartLogger.audit_everything(str(tmp_path), "audit.log")
+    after = SmartLogger("audit_once_after", logging.INFO)
+    try:
+        assert logging.getLogger("audit_once_before").propagate
+
+        before.info("from before")
+        after.info("from after")
+        after.log_many(logging.INFO, ["batch 1", "batch 2"])
+        logging.getLogger("audit_once_plain").warning("from stdlib")
+    finally:
+        SmartLogger.terminate_auditing()
+
+    assert not logging.getLogger("audit_once_before").propagate
+    before.destroy()
+    after.destroy()
+
+    text = (tmp_path / "audit.log").read_text()
+    for message in ("from before", "from after", "batch 1", "batch 2", "from stdlib"):
+        assert text.count(message) == 1
+
+
+def test_sync_audit_marker_is_not_rendered_as_extra(tmp_path):
+    import json
+    from LogSmith import OutputMode
+
+    logger = SmartLogger("audit_marker_clean", logging.INFO)
+    logger.add_file(str(tmp_path), "plain.log")
+    logger.add_file(str(tmp_path), "events.ndjson", output_mode=OutputMode.NDJSON)
+
+    SmartLogger.audit_everything(str(tmp_path / "audit"), "audit.log")
+    try:
+        logger.info("hello")
+        logger.log_many(logging.INFO, ["batch"])
+    finally:
+        SmartLogger.terminate_auditing()
+    logger.destroy()
+
+    plain = (tmp_path / "plain.log").read_text()
+    assert "hello" in plain and "batch" in plain
+    assert "_logsmith_audited" not in plain
+
+    for line in (tmp_path / "events.ndjson").read_text().splitlines():
+        assert "_logsmith_audited" not in json.loads(line).get("named_args", {})
+    assert "_logsmith_audited" not in (tmp_path / "events.ndjson").read_text()
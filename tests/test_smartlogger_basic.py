@@ -29,6 +29,91 @@ def test_info_to_file(logger, tmp_log_dir):
     assert "INFO" in text
 
 
+def test_disabled_level_skips_record_construction(logger, monkeypatch):
+    logger.level = logging.INFO
+
+    def fail():
+        raise AssertionError("caller resolved for a disabled level")
+
+    monkeypatch.setattr(SmartLogger, "_SmartLogger__find_caller", staticmethod(fail))
+
+    assert not logger.isEnabledFor(logging.DEBUG)
+    assert logger.isEnabledFor(logging.INFO)
+    logger.trace("skipped")
+    logger.debug("skipped %s", object())
+
+
+def test_caller_resolved_only_when_a_handler_renders_it(logger, tmp_log_dir, monkeypatch):
+    calls = []
+    original = SmartLogger._SmartLogger__find_caller
+
+    def counting():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(SmartLogger, "_SmartLogger__find_caller", staticmethod(counting))
+    # only LogSmith's own handlers (pytest's capture handlers would need the caller)
+    monkeypatch.setattr(logging.getLogger(logger.name), "handlers", [])
+
+    logger.add_file(tmp_log_dir.__str__(), "plain.txt")
+    logger.info("no caller fields")
+    assert calls == []
+
+    orf = OptionalRecordFields(lineno=True)
+    details = LogRecordDetails(optional_record_fields=orf, message_parts_order=["level", "lineno"])
+    logger.add_file(tmp_log_dir.__str__(), "lineno.txt", log_record_details=details)
+    logger.info("with lineno")
+    assert calls == [1]
+    assert "L=0" not in read_file(tmp_log_dir / "lineno.txt")
+
+
+def test_caller_resolved_for_filters_and_foreign_formatters(logger, tmp_log_dir, monkeypatch):
+    py_logger = logging.getLogger(logger.name)
+    monkeypatch.setattr(py_logger, "handlers", [])
+    logger.add_file(tmp_log_dir.__str__(), "plain.txt")
+    handler = py_logger.handlers[0]
+    expected = {(Path(__file__).name, "seen_by")}
+
+    def seen_by(attach, detach):
+        seen = set()
+
+        def capture(record):
+            seen.add((record.filename, record.funcName))
+            return True
+
+        attach(capture)
+        logger.info("needs the caller")
+        detach(capture)
+        return seen
+
+    assert seen_by(handler.addFilter, handler.removeFilter) == expected
+    assert seen_by(py_logger.addFilter, py_logger.removeFilter) == expected
+
+    foreign = logging.Handler()
+    assert seen_by(lambda f: (setattr(foreign, "emit", f), py_logger.addHandler(foreign)),
+                   lambda f: py_logger.removeHandler(foreign)) == expected
+
+
+
+def test_lazy_message_only_rendered_when_enabled(logger, tmp_log_dir):
+    path = tmp_log_dir / "lazy.txt"
+    logger.add_file(tmp_log_dir.__str__(), "lazy.txt", level=logging.INFO)
+    logger.level = logging.INFO
+
+    calls = []
+
+    def expensive(tag):
+        calls.append(tag)
+        return f"\x1b[31m{tag}\x1b[0m"
+
+    logger.debug("skipped %s", SmartLogger.lazy(expensive, "debug"))
+    assert calls == []
+
+    logger.info(SmartLogger.lazy(expensive, "info"))
+    assert calls == ["info"]
+    assert "info" in read_file(path)
+
+
 # ---------------------------------------------------------
 # Raw Logging Tests
 # ---------------------------------------------------------
@@ -160,6 +245,26 @@ def test_audit_mode(tmp_path, logger):
     assert "hello" in lines[0]
 
 
+def test_buffered_audit_mode(tmp_path, logger):
+    audit_dir = tmp_path / "audit"
+    audit_dir.mkdir()
+
+    logger.audit_everything(
+        log_dir=str(audit_dir),
+        logfile_name="audit.log",
+        buffer_size=64 * 1024,
+    )
+    audit_file = audit_dir / "audit.log"
+
+    logger.info("buffered")
+    assert audit_file.read_text() == ""
+
+    logger.flush()
+    assert "buffered" in audit_file.read_text()
+
+    logger.terminate_auditing()
+
+
 # ---------------------------------------------------------
 # Rotation Integration Tests
 # ---------------------------------------------------------
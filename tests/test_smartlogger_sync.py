@@ -203,3 +203,74 @@ def test_sync_logger_trace_level_if_available(clean_sync_logger, tmp_path):
     bodies = [line.split("•")[-1].strip() for line in content.splitlines()]
 
     assert "trace-msg" in bodies
+
+
+# 10. Buffered file writes
+
+def test_sync_logger_buffered_file_flushes_on_warning_and_flush(clean_sync_logger, tmp_path):
+    logger = clean_sync_logger
+    logger.add_file(str(tmp_path), "x.log", level=logging.DEBUG, buffer_size=64 * 1024)
+    path = tmp_path / "x.log"
+
+    logger.info("buffered")
+    assert path.read_text(encoding="utf-8") == ""
+
+    logger.warning("urgent")
+    bodies = [line.split("•")[-1].strip() for line in path.read_text(encoding="utf-8").splitlines()]
+    assert bodies == ["buffered", "urgent"]
+
+    logger.debug("pending")
+    logger.flush()
+    assert path.read_text(encoding="utf-8").rstrip().endswith("pending")
+
+
+# 11. Batched logging
+
+def test_sync_logger_log_many_locks_file_once(clean_sync_logger, tmp_path, monkeypatch):
+    logger = clean_sync_logger
+    logger.add_file(str(tmp_path), "x.log", level=logging.INFO)
+    handler = next(h for h in logging.getLogger(logger.name).handlers if hasattr(h, "emit_batch"))
+
+    batches = []
+    original = handler.emit_batch
+    monkeypatch.setattr(handler, "emit_batch", lambda records: (batches.append(len(records)), original(records)))
+
+    logger.log_many(logging.INFO, (f"line {i}" for i in range(5)))
+    logger.log_many(logging.DEBUG, (f"hidden {i}" for i in range(5)))
+
+    content = (tmp_path / "x.log").read_text(encoding="utf-8")
+    bodies = [line.split("•")[-1].strip() for line in content.splitlines()]
+
+    assert bodies == [f"line {i}" for i in range(5)]
+    assert batches == [5]
+
+
+# 12. handler_info_json
+
+def test_sync_logger_handler_info_json_cached_until_handlers_change(clean_sync_logger, tmp_path):
+    logger = clean_sync_logger
+    logger.add_file(str(tmp_path), "x.log")
+
+    first = logger.handler_info_json
+    assert logger.handler_info_json is first
+    assert json.loads(first) == logger.handler_info
+
+    logger.add_file(str(tmp_path), "y.log")
+    assert len(json.loads(logger.handler_info_json)) == 2
+
+    logger.remove_file_handler(str(tmp_path), "y.log")
+    assert logger.handler_info_json == first
+
+
+# 13. Lock-free file writes
+
+def test_sync_logger_lock_check_interval_reaches_handler(clean_sync_logger, tmp_path):
+    logger = clean_sync_logger
+    logger.add_file(str(tmp_path), "x.log", level=logging.INFO, lock_check_interval=60)
+    handler = next(h for h in logging.getLogger(logger.name).handlers if hasattr(h, "emit_batch"))
+    assert handler.lock_check_interval == 60
+
+    logger.info("one")
+    logger.info("two")
+    bodies = [line.split("•")[-1].strip() for line in (tmp_path / "x.log").read_text(encoding="utf-8").splitlines()]
+    assert bodies == ["one", "two"]
@@ -249,6 +249,19 @@ def test_level_registry_safeguard():
         SmartLogger.register_level("BAD NAME!", 55)
 
 
+def test_level_registry_get_reflects_reset():
+    from LogSmith.level_registry import LEVELS
+
+    assert LEVELS.get("NO_SUCH_LEVEL") is None
+
+    before = LEVELS.get("INFO")
+    reset_levels_for_tests()
+    after = LEVELS.get("INFO")
+
+    assert after is not before
+    assert after["value"] == 20
+
+
 # ============================================================
 # 10. INVALID THEME REGISTRATION
 # ============================================================
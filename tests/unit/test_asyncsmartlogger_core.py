@@ -85,3 +85,35 @@ async def test_async_ordering_guarantee(tmp_path: Path):
 
     indices = [json.loads(line)["named_args"]["index"] for line in lines]
     assert indices == list(range(50))
+
+
+@pytest.mark.asyncio
+async def test_async_disabled_level_skips_log_path(monkeypatch):
+    levels = AsyncSmartLogger.levels()
+    logger = AsyncSmartLogger("async_disabled_levels", level=levels["WARNING"])
+
+    calls = []
+
+    async def fake_a_log(*args, **kwargs):
+        calls.append(args)
+
+    monkeypatch.setattr(logger, "_AsyncSmartLogger__a_log", fake_a_log)
+
+    await logger.a_trace("trace message")
+    await logger.a_debug("debug message")
+    await logger.a_info("info message")
+    await logger.a_warning("warning message")
+
+    assert len(calls) == 1
+    await logger.flush()
+
+
+@pytest.mark.asyncio
+async def test_async_get_returns_live_logger_by_name():
+    logger = AsyncSmartLogger("async_lookup_test")
+
+    assert AsyncSmartLogger.get("async_lookup_test") is logger
+    assert AsyncSmartLogger.get("async_lookup_missing") is None
+
+    await logger.destroy()
+    assert AsyncSmartLogger.get("async_lookup_test") is None
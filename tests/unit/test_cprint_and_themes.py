@@ -52,3 +52,15 @@ def test_custom_theme_for_dynamic_level(capsys):
     out = capsys.readouterr().out
     assert "Notice message" in out
     assert ANSI_PATTERN.search(out)
+
+
+def test_level_style_apply_matches_colorize():
+    style = LevelStyle(fg=CPrint.FG.NEON_YELLOW, bg=CPrint.BG.NEON_RED,
+                       intensity=CPrint.Intensity.BOLD, styles=(CPrint.Style.UNDERLINE,))
+    expected = CPrint.colorize("msg", fg=style.fg, bg=style.bg, intensity=style.intensity, styles=style.styles)
+
+    assert style.apply("msg") == expected
+    assert style.compile() is style.compile()
+    assert LevelStyle().apply("msg") == "msg"
+    assert style == LevelStyle(fg=CPrint.FG.NEON_YELLOW, bg=CPrint.BG.NEON_RED,
+                               intensity=CPrint.Intensity.BOLD, styles=(CPrint.Style.UNDERLINE,))
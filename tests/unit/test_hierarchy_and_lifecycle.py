@@ -84,3 +84,19 @@ def test_retire_and_destroy_logger(tmp_path):
 
     content2 = (log_dir / "life2.log").read_text(encoding="utf-8")
     assert "new logger" in content2
+
+
+def test_get_returns_live_logger_by_name():
+    parent = SmartLogger("lookup_test")
+    child = SmartLogger("lookup_test.child")
+
+    assert SmartLogger.get("lookup_test") is parent
+    assert SmartLogger.get("lookup_test.child") is child
+    assert SmartLogger.get("lookup_test.missing") is None
+
+    child.retire()
+    assert SmartLogger.get("lookup_test.child") is None
+
+    child.destroy()
+    parent.destroy()
+    assert SmartLogger.get("lookup_test") is None
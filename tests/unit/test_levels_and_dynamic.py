@@ -10,6 +10,19 @@ def test_levels_contains_core_levels():
         assert isinstance(levels[name], int)
 
 
+def test_levels_returns_a_fresh_plain_dict():
+    import json
+
+    levels = SmartLogger.levels()
+    assert type(levels) is dict
+    assert AsyncSmartLogger.levels() == levels
+    json.dumps(levels)
+
+    # callers own their copy: mutating it leaves the registry untouched
+    levels["INFO"] = 1
+    assert SmartLogger.levels()["INFO"] == 20
+
+
 def test_register_dynamic_level_creates_method_and_value_unique():
     levels_before = SmartLogger.levels()
     assert "NOTICE" not in levels_before
@@ -62,3 +75,62 @@ async def test_async_dynamic_level_registration_and_method():
     await logger.flush()
 
     logger.destroy()
+
+
+def test_dynamic_level_method_is_resolved_once(monkeypatch):
+    if "VERBOSE" not in SmartLogger.levels():
+        SmartLogger.register_level("VERBOSE", 15)
+
+    logger = SmartLogger("dynamic_resolved_once", level=SmartLogger.levels()["INFO"])
+    method = logger.verbose
+    assert logger.verbose is method
+    assert "verbose" in vars(logger)
+
+    calls = []
+    monkeypatch.setattr(logger, "_SmartLogger__log", lambda *a, **k: calls.append(a))
+    logger.verbose("hidden")
+    logger.level = SmartLogger.levels()["DEBUG"]
+    logger.verbose("shown")
+    assert [c[1] for c in calls] == ["shown"]
+
+
+def test_level_style_resolves_affixes_at_creation(monkeypatch):
+    style = LevelStyle(fg=CPrint.FG.RED, intensity=CPrint.Intensity.BOLD)
+    twin = LevelStyle(fg=CPrint.FG.RED, intensity=CPrint.Intensity.BOLD)
+    expected = CPrint.colorize("msg", fg=CPrint.FG.RED, intensity=CPrint.Intensity.BOLD)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("colorize called after creation")
+
+    monkeypatch.setattr(CPrint, "colorize", fail)
+    assert style.apply("msg") == expected
+    assert style.compile() == style.compile()
+    assert style == twin
+
+
+def test_dynamic_level_method_follows_registry_changes(monkeypatch):
+    from LogSmith.level_registry import reset_levels_for_tests
+
+    reset_levels_for_tests()
+    SmartLogger.register_level("RESOLVED", 22)
+    logger = SmartLogger("dynamic_follows_registry", level=SmartLogger.levels()["DEBUG"])
+    method = logger.resolved
+
+    calls = []
+    monkeypatch.setattr(logger, "_SmartLogger__log", lambda *a, **k: calls.append(a[0]))
+    try:
+        # same name, new value: the cached method logs at the new value
+        reset_levels_for_tests()
+        SmartLogger.register_level("RESOLVED", 23)
+        method("re-registered")
+        assert calls == [23]
+
+        # level gone: the cached method is dropped and the attribute no longer resolves
+        reset_levels_for_tests()
+        with pytest.raises(AttributeError):
+            method("unregistered")
+        with pytest.raises(AttributeError):
+            _ = logger.resolved
+    finally:
+        reset_levels_for_tests()
+        logger.destroy()
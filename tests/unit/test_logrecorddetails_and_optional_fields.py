@@ -91,3 +91,21 @@ def test_logrecorddetails_used_by_console_output(capsys):
     assert "username = 'Gilad'" in out
     assert "|" in out
     return
+
+
+def test_logrecorddetails_validation_messages():
+    import pytest
+
+    orf = OptionalRecordFields(lineno=True)
+
+    with pytest.raises(ValueError, match="'level' exactly once"):
+        LogRecordDetails(optional_record_fields=orf, message_parts_order=["level", "lineno", "level"])
+
+    with pytest.raises(ValueError, match="'lineno' is True but not present exactly once"):
+        LogRecordDetails(optional_record_fields=orf, message_parts_order=["lineno", "level", "lineno"])
+
+    with pytest.raises(ValueError, match="'func_name' is False but appears"):
+        LogRecordDetails(optional_record_fields=orf, message_parts_order=["lineno", "level", "func_name"])
+
+    with pytest.raises(ValueError, match="Invalid message part: 'bogus'"):
+        LogRecordDetails(optional_record_fields=orf, message_parts_order=["lineno", "level", "bogus"])
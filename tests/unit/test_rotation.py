@@ -124,5 +124,402 @@ def test_list_rotated_files(tmp_path):
     (tmp_path / "test.log.1").write_text("x")
     (tmp_path / "test.log.lock").write_text("x")
     # noinspection PyUnresolvedReferences
-    files = handler._ConcurrentTimedSizedRotatingFileHandler__list_rotated_files()
-    assert len(files) == 2
+    files = [path for path, _ in handler._ConcurrentTimedSizedRotatingFileHandler__scan_rotated_files()]
+    assert files == [str(tmp_path / "test.log.1")]
+
+
+def test_buffered_writes_flush_on_warning(tmp_path):
+    handler = make_handler(tmp_path, buffer_size=64 * 1024)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    path = Path(handler.baseFilename)
+
+    for i in range(5):
+        handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, f"info {i}", (), None))
+    assert path.read_text() == ""
+
+    handler.emit(logging.LogRecord("x", logging.WARNING, __file__, 1, "warn", (), None))
+    assert path.read_text().splitlines() == [f"info {i}" for i in range(5)] + ["warn"]
+
+    handler.emit(logging.LogRecord("x", logging.DEBUG, __file__, 1, "tail", (), None))
+    handler.flush()
+    assert path.read_text().endswith("tail\n")
+    handler.close()
+
+
+def test_buffered_writes_rotate_by_size(tmp_path):
+    handler = make_handler(tmp_path, buffer_size=64 * 1024, max_bytes=40, backup_count=3)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for i in range(6):
+        handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, f"line-{i:02d}-xxxxx", (), None))
+    handler.close()
+
+    base = Path(handler.baseFilename)
+    rotated = tmp_path / "test.log.1"
+    assert rotated.exists()
+    assert all(len(p.read_bytes()) <= 40 for p in (base, rotated))
+    lines = [ln for p in sorted(tmp_path.glob("test.log*")) if not p.name.endswith(".lock")
+             for ln in p.read_text().splitlines()]
+    assert sorted(lines) == [f"line-{i:02d}-xxxxx" for i in range(6)]
+
+
+def test_buffered_writes_count_encoded_bytes(tmp_path):
+    handler = make_handler(tmp_path, buffer_size=64 * 1024, max_bytes=40, backup_count=3)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # 12 characters but 22 bytes per line once UTF-8 encoded (with the newline)
+    for i in range(4):
+        handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, f"{i}éééééééééé", (), None))
+    handler.close()
+
+    sizes = [len(p.read_bytes()) for p in sorted(tmp_path.glob("test.log*")) if not p.name.endswith(".lock")]
+    assert sorted(sizes) == [22, 22, 22, 22]
+
+
+def test_unbuffered_batch_is_flushed_once(tmp_path):
+    handler = make_handler(tmp_path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    class CountingStream:
+        def __init__(self, stream):
+            self.stream = stream
+            self.flushes = 0
+
+        def flush(self):
+            self.flushes += 1
+            self.stream.flush()
+
+        def __getattr__(self, name):
+            return getattr(self.stream, name)
+
+    counting = handler.stream = CountingStream(handler.stream)
+    handler.emit_batch([logging.LogRecord("x", logging.INFO, __file__, 1, f"m{i}", (), None) for i in range(50)])
+
+    assert counting.flushes == 1
+    assert (tmp_path / "test.log").read_text().splitlines() == [f"m{i}" for i in range(50)]
+
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "single", (), None))
+    assert counting.flushes == 2
+    handler.close()
+
+
+def test_unbuffered_batch_is_joined_into_one_write_per_file(tmp_path, monkeypatch):
+    handler = make_handler(tmp_path, max_bytes=40, backup_count=3)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    writes = []
+    real_open = handler._open
+
+    def counting_open():
+        stream = real_open()
+        write = stream.write
+        monkeypatch.setattr(stream, "write", lambda text: (writes.append(text), write(text))[1], raising=False)
+        return stream
+
+    monkeypatch.setattr(handler, "_open", counting_open)
+    handler.stream.close()
+    handler.stream = handler._open()
+
+    # 8 bytes per entry: four fit under max_bytes=40, the fifth rotates the file
+    handler.emit_batch([logging.LogRecord("x", logging.INFO, __file__, 1, f"entry-{i}", (), None) for i in range(7)])
+    handler.close()
+
+    assert writes == ["".join(f"entry-{i}\n" for i in range(4)), "entry-4\nentry-5\nentry-6\n"]
+    assert (tmp_path / "test.log.1").read_text().splitlines() == [f"entry-{i}" for i in range(4)]
+    assert (tmp_path / "test.log").read_text().splitlines() == ["entry-4", "entry-5", "entry-6"]
+
+
+def test_unbuffered_size_check_sees_other_writers(tmp_path):
+    handler = make_handler(tmp_path, max_bytes=30, backup_count=3)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "aaaaaaaaa", (), None))
+    # another process appends while it holds the lock: picked up on our next emit
+    with open(tmp_path / "test.log", "a", encoding="utf-8") as other:
+        other.write("bbbbbbbbb\n")
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "ccccccccc", (), None))
+    handler.close()
+
+    assert (tmp_path / "test.log").read_text() == "ccccccccc\n"
+    assert (tmp_path / "test.log.1").read_text() == "aaaaaaaaa\nbbbbbbbbb\n"
+
+
+def test_lock_check_interval_takes_lock_only_when_due(tmp_path, monkeypatch):
+    handler = make_handler(tmp_path, lock_check_interval=60)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    locks = []
+    acquire = handler._ConcurrentTimedSizedRotatingFileHandler__acquire_lock
+    monkeypatch.setattr(handler, "_ConcurrentTimedSizedRotatingFileHandler__acquire_lock",
+                        lambda: (locks.append(1), acquire()))
+
+    for i in range(5):
+        handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, f"m{i}", (), None))
+    assert len(locks) == 1
+
+    late = logging.LogRecord("x", logging.INFO, __file__, 1, "late", (), None)
+    late.created += 120
+    handler.emit(late)
+    assert len(locks) == 2
+    handler.close()
+
+    assert (tmp_path / "test.log").read_text().splitlines() == ["m0", "m1", "m2", "m3", "m4", "late"]
+
+
+def test_lock_free_writer_follows_rotation_by_another_writer(tmp_path):
+    rotating = make_handler(tmp_path, max_bytes=18, backup_count=3)
+    lock_free = make_handler(tmp_path, lock_check_interval=60)
+    for h in (rotating, lock_free):
+        h.setFormatter(logging.Formatter("%(message)s"))
+
+    lock_free.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "first", (), None))
+    rotating.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "second", (), None))
+    rotating.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "third", (), None))   # rotates
+
+    # not due yet: still appends to the file it has open (now test.log.1)
+    lock_free.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "fourth", (), None))
+    due = logging.LogRecord("x", logging.INFO, __file__, 1, "fifth", (), None)
+    due.created += 120
+    lock_free.emit(due)
+    rotating.close()
+    lock_free.close()
+
+    assert (tmp_path / "test.log.1").read_text().splitlines() == ["first", "second", "fourth"]
+    assert (tmp_path / "test.log").read_text().splitlines() == ["third", "fifth"]
+
+
+def test_lock_free_writers_rotate_once_on_time_based_rollover(tmp_path):
+    first = make_handler(tmp_path, when=When.MINUTE, interval=1, backup_count=3, lock_check_interval=60)
+    second = make_handler(tmp_path, when=When.MINUTE, interval=1, backup_count=3, lock_check_interval=60)
+    for h in (first, second):
+        h.setFormatter(logging.Formatter("%(message)s"))
+        h._ConcurrentTimedSizedRotatingFileHandler__rollover_at = time.time() + 3600
+
+    first.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "a", (), None))
+    second.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "b", (), None))
+
+    # both writers are due for the same time-based rollover
+    for h in (first, second):
+        h._ConcurrentTimedSizedRotatingFileHandler__rollover_at = 0
+    first.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "c", (), None))     # rotates
+    # `second` reopens the new file under the lock and takes over the new schedule
+    second.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "d", (), None))
+    first.close()
+    second.close()
+
+    assert not (tmp_path / "test.log.2").exists()
+    assert (tmp_path / "test.log.1").read_text().splitlines() == ["a", "b"]
+    assert (tmp_path / "test.log").read_text().splitlines() == ["c", "d"]
+
+
+def test_second_writer_follows_rotation_instead_of_rotating_again(tmp_path):
+    first = make_handler(tmp_path, max_bytes=18, backup_count=3)
+    second = make_handler(tmp_path, max_bytes=18, backup_count=3)
+    for h in (first, second):
+        h.setFormatter(logging.Formatter("%(message)s"))
+
+    second.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "first", (), None))
+    first.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "second", (), None))
+    first.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "third", (), None))     # rotates
+    # `second` still has the old file open and decides to roll over: it only reopens
+    second.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "fourth", (), None))
+    first.close()
+    second.close()
+
+    assert not (tmp_path / "test.log.2").exists()
+    assert (tmp_path / "test.log.1").read_text().splitlines() == ["first", "second"]
+    assert (tmp_path / "test.log").read_text().splitlines() == ["third", "fourth"]
+
+
+def test_lock_check_interval_requires_unbuffered_writes(tmp_path):
+    with pytest.raises(ValueError):
+        make_handler(tmp_path, lock_check_interval=1, buffer_size=1024)
+    with pytest.raises(ValueError):
+        make_handler(tmp_path, lock_check_interval=-1)
+
+
+def test_buffered_writes_flush_after_interval(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+
+    handler = make_handler(tmp_path, buffer_size=64 * 1024, flush_interval=0.5)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    path = Path(handler.baseFilename)
+
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "early", (), None))
+    assert path.read_text() == ""
+
+    now[0] += 0.6
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "late", (), None))
+    assert path.read_text().splitlines() == ["early", "late"]
+    handler.close()
+
+
+def test_rollover_check_reuses_formatted_entry_and_record_time(tmp_path):
+    handler = make_handler(tmp_path, max_bytes=10_000, when=When.SECOND, interval=1, backup_count=2)
+    formats = []
+
+    class CountingFormatter(logging.Formatter):
+        def format(self, record):
+            formats.append(record)
+            return super().format(record)
+
+    handler.setFormatter(CountingFormatter("%(message)s"))
+
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "now", (), None))
+    later = logging.LogRecord("x", logging.INFO, __file__, 1, "later", (), None)
+    later.created += 5
+    handler.emit(later)
+    handler.close()
+
+    assert len(formats) == 2
+    assert (tmp_path / "test.log").read_text().splitlines() == ["later"]
+    assert (tmp_path / "test.log.1").read_text().splitlines() == ["now"]
+
+
+def test_handler_opens_stream_and_registers_once(tmp_path):
+    opened = []
+
+    class Counting(ConcurrentTimedSizedRotatingFileHandler):
+        def _open(self):
+            opened.append(self)
+            return super()._open()
+
+    handler = Counting(str(tmp_path / "once.log"))
+    try:
+        assert len(opened) == 1
+        # noinspection PyProtectedMember,PyUnresolvedReferences
+        assert sum(ref() is handler for ref in logging._handlerList) == 1
+    finally:
+        handler.close()
+
+
+def test_negative_buffer_size_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        make_handler(tmp_path, buffer_size=-1)
+    with pytest.raises(ValueError):
+        make_handler(tmp_path, buffer_size=1024, flush_interval=-1)
+
+
+def test_expiration_keeps_live_base_file(tmp_path):
+    handler = make_handler(tmp_path, max_bytes=10, backup_count=5,
+                           expiration_rule=ExpirationRule(ExpirationScale.Seconds, interval=0))
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for i in range(4):
+        handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, f"entry-{i}xx", (), None))
+    handler.close()
+
+    names = sorted(p.name for p in tmp_path.iterdir() if not p.name.endswith(".lock"))
+    assert names == ["test.log"]
+    assert (tmp_path / "test.log").read_text() == "entry-3xx\n"
+
+
+def test_timestamped_backups_rename_once_and_keep_newest(tmp_path, monkeypatch):
+    handler = make_handler(tmp_path, max_bytes=10, backup_count=2, timestamped_backups=True)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    renames = []
+    real_replace = os.replace
+    monkeypatch.setattr("LogSmith.rotation_base.os.replace",
+                        lambda src, dst: (renames.append((src, dst)), real_replace(src, dst)))
+
+    for i in range(5):
+        handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, f"entry-{i}xx", (), None))
+        time.sleep(0.002)
+    handler.close()
+
+    # each entry fills max_bytes, so every emit rolls over: one rename apiece, whatever the backup count
+    assert len(renames) == 5
+    assert all(src == str(tmp_path / "test.log") for src, _ in renames)
+
+    backups = sorted(p.name for p in tmp_path.iterdir() if p.name.startswith("test.log.") and not p.name.endswith(".lock"))
+    assert len(backups) == 2
+    assert [(tmp_path / name).read_text() for name in backups] == ["entry-2xx\n", "entry-3xx\n"]
+    assert (tmp_path / "test.log").read_text() == "entry-4xx\n"
+
+
+def test_periodic_rollover_delta_is_resolved_at_construction(tmp_path):
+    handler = make_handler(tmp_path, when=When.MINUTE, interval=5)
+    assert handler._period_seconds == 300
+    assert handler._ConcurrentTimedSizedRotatingFileHandler__compute_next_rollover(1000.0) == 1300.0
+    handler.close()
+
+    # anchored modes keep computing from the time of day
+    handler = make_handler(tmp_path, when=When.EVERYDAY, timestamp=RotationTimestamp(0, 0, 0))
+    assert handler._period_seconds is None
+    handler.close()
+
+
+def test_filtered_records_do_not_take_the_lock(tmp_path):
+    handler = make_handler(tmp_path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.addFilter(lambda record: record.msg != "drop")
+
+    locks = []
+    real_acquire = handler._ConcurrentTimedSizedRotatingFileHandler__acquire_lock
+    handler._ConcurrentTimedSizedRotatingFileHandler__acquire_lock = lambda: (locks.append(1), real_acquire())
+
+    def rec(msg):
+        return logging.LogRecord("x", logging.INFO, __file__, 1, msg, (), None)
+
+    handler.emit(rec("drop"))
+    handler.emit_batch([rec("drop"), rec("drop")])
+    assert locks == []
+
+    handler.emit_batch([rec("drop"), rec("keep")])
+    handler.close()
+
+    assert len(locks) == 1
+    assert (tmp_path / "test.log").read_text() == "keep\n"
+
+
+def test_expiration_check_interval_throttles_scans(tmp_path):
+    handler = make_handler(tmp_path, max_bytes=10, backup_count=5,
+                           expiration_rule=ExpirationRule(ExpirationScale.Seconds, interval=0, check_interval=3600))
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    scans = []
+    real_scan = handler._ConcurrentTimedSizedRotatingFileHandler__scan_rotated_files
+    handler._ConcurrentTimedSizedRotatingFileHandler__scan_rotated_files = lambda: (scans.append(1), real_scan())[1]
+
+    for i in range(4):
+        handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, f"entry-{i}xx", (), None))
+    handler.close()
+
+    # four rollovers, a single retention scan: later backups are kept until the next one is due
+    assert len(scans) == 1
+    assert (tmp_path / "test.log.1").read_text() == "entry-2xx\n"
+
+
+def test_lock_file_is_reopened_after_fork(tmp_path, monkeypatch):
+    handler = make_handler(tmp_path)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "parent", (), None))
+    inherited = handler._ConcurrentTimedSizedRotatingFileHandler__lock_file
+
+    # same process: the lock file is reused
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "again", (), None))
+    assert handler._ConcurrentTimedSizedRotatingFileHandler__lock_file is inherited
+
+    # a forked child (new pid) opens a lock file of its own
+    monkeypatch.setattr("LogSmith.rotation.os.getpid", lambda: -1)
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "child", (), None))
+    own = handler._ConcurrentTimedSizedRotatingFileHandler__lock_file
+    assert own is not inherited
+    assert inherited.closed and not own.closed
+    handler.close()
+
+    assert (tmp_path / "test.log").read_text() == "parent\nagain\nchild\n"
+
+
+def test_rotation_constants_are_resolved_at_construction(tmp_path):
+    handler = make_handler(tmp_path, when=When.FRIDAY, timestamp=RotationTimestamp(3, 0, 0),
+                           expiration_rule=ExpirationRule(ExpirationScale.Hours, interval=2))
+    assert handler._weekday_index == 4
+    assert handler._expiration_seconds == 7200
+    handler.close()
+
+    # MonthDay expiration is calendar-based, not an age
+    handler = make_handler(tmp_path, expiration_rule=ExpirationRule(ExpirationScale.MonthDay, interval=0))
+    assert handler._weekday_index is None
+    assert handler._expiration_seconds is None
+    handler.close()